@@ -0,0 +1,164 @@
+"""
+HTTP API for the document validators, for CI pipelines.
+
+Run from this folder (config/ and temp/ are resolved from the working directory):
+
+    uvicorn api:app --host 0.0.0.0 --port 8000
+
+    curl -F release_id=2025.3 -F project_id=P002 -F file=@plan.docx http://localhost:8000/validate/word
+    curl -F release_id=2025.3 -F file=@report.pptx http://localhost:8000/validate/ppt
+    curl -F release_id=2025.3 -F file=@closure.docx http://localhost:8000/validate/closure_report
+
+Any document type of docreview.doctypes (built-in or from the document_types sheet)
+is served at /validate/<type>; GET /document-types lists them.
+
+project_id / application_id are optional and pick one row when a release spans several projects.
+Without release_id the release is detected from the IDs written in the document
+(page 1 / Slide 1); 409 is returned when that is ambiguous. Standalone workbooks
+(/validate/nfr_workbook, /validate/results_workbook) are validated without a
+release when none is given.
+
+GET /metrics exposes validation counters and latencies for Prometheus.
+"""
+import asyncio
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import PlainTextResponse
+
+from docreview.admission import controller as admission, estimate_job_cost
+from docreview.archive import release_archive
+from docreview.autodetect import DETECTABLE_EXTENSIONS, detect_release
+from docreview.doctypes import document_types, get_document_type
+from docreview.preflight import MAX_ARCHIVE_BYTES, ArchiveRejected, inspect_archive
+from docreview.releases import find_release
+from docreview.telemetry import PROMETHEUS_CONTENT_TYPE, has_failures, render_metrics
+from docreview.word import temp_dir
+
+API_WORKERS = int(os.environ.get("DOCREVIEW_API_WORKERS", 4))
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+app = FastAPI(title="Automated Document Review")
+executor = ThreadPoolExecutor(max_workers=API_WORKERS, thread_name_prefix="validate")
+
+
+async def save_upload(upload, suffix):
+    """Streams a multipart upload to a temp file chunk by chunk, enforcing the archive size limit."""
+    os.makedirs(temp_dir, exist_ok=True)
+    fd, path = tempfile.mkstemp(dir=temp_dir, suffix=suffix)
+    written = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            while chunk := await upload.read(UPLOAD_CHUNK_BYTES):
+                written += len(chunk)
+                if written > MAX_ARCHIVE_BYTES:
+                    raise HTTPException(413, f"Upload exceeds {MAX_ARCHIVE_BYTES // 1024 // 1024} MB")
+                f.write(chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path
+
+
+def detect_job_release(path):
+    """The release detected from the document's IDs; 422/409 when it cannot be read or is not unique."""
+    detection = detect_release(path)
+    if detection["error"]:
+        raise HTTPException(422, detection["error"])
+    if detection["release"] is None:
+        reason = "matches several releases equally well" if detection["candidates"] else "matches no catalog release"
+        raise HTTPException(409, f"No release_id given and the document {reason}")
+    return detection["release"]
+
+
+def run_job(path, main_parts, validate, release, detect):
+    """
+    Runs on the worker pool: pre-flight checks, then release detection (when `detect`)
+    and validation, both under the shared admission budget.
+
+    :return: (release row used, validation results)
+    """
+    try:
+        inspect_archive(path)
+        with admission.admit(estimate_job_cost(path, main_parts)):
+            if detect:
+                release = detect_job_release(path)
+            return release, validate(path, release)
+    finally:
+        release_archive(path)  # Unmap before the temp file is deleted
+
+
+async def validate_upload(upload, release_key, doc_type):
+    if not upload.filename or not doc_type.accepts(upload.filename):
+        raise HTTPException(415, f"Expected a {' or '.join(doc_type.extensions)} file")
+    suffix = os.path.splitext(upload.filename)[1].lower()
+    release_id = release_key[0]
+    release = find_release(*release_key) if release_id else None
+    if release_id and release is None:
+        raise HTTPException(404, f"Unknown release '{release_id}'")
+
+    path = await save_upload(upload, suffix)
+    try:
+        loop = asyncio.get_running_loop()
+        detect = release is None and suffix in DETECTABLE_EXTENSIONS
+        release, results = await loop.run_in_executor(
+            executor, run_job, path, doc_type.main_parts, doc_type.validate, release, detect
+        )
+        if detect:
+            release_id = release["Enterprise Release ID"]
+    except ArchiveRejected as e:
+        raise HTTPException(422, str(e))
+    finally:
+        os.remove(path)
+
+    return jsonable_encoder({
+        "document": upload.filename,
+        "document_type": doc_type.name,
+        "release_id": release_id,
+        "passed": not has_failures(results),
+        "results": results,
+    })
+
+
+@app.post("/validate/word")
+async def validate_word(file: UploadFile = File(...), release_id: str = Form(None),
+                        project_id: str = Form(None), application_id: str = Form(None)):
+    return await validate_upload(file, (release_id, project_id, application_id), get_document_type("word"))
+
+
+@app.post("/validate/ppt")
+async def validate_ppt_file(file: UploadFile = File(...), release_id: str = Form(None),
+                            project_id: str = Form(None), application_id: str = Form(None)):
+    return await validate_upload(file, (release_id, project_id, application_id), get_document_type("ppt"))
+
+
+@app.post("/validate/{doc_type}")
+async def validate_registered_type(doc_type: str, file: UploadFile = File(...), release_id: str = Form(None),
+                                   project_id: str = Form(None), application_id: str = Form(None)):
+    try:
+        registered = get_document_type(doc_type)
+    except ValueError as e:
+        raise HTTPException(404, str(e))
+    return await validate_upload(file, (release_id, project_id, application_id), registered)
+
+
+@app.get("/document-types")
+async def list_document_types():
+    return [
+        {"name": t.name, "label": t.label, "extensions": list(t.extensions), "rules_sheet": t.rules_sheet}
+        for t in document_types().values()
+    ]
+
+
+@app.get("/health")
+async def health():
+    return {"status": "ok", "queued": admission.queue_length()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Validation counters and latency histograms in the Prometheus text format."""
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
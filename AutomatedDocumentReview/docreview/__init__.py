@@ -0,0 +1 @@
+"""Shared helpers for the Word and PPT review pages."""
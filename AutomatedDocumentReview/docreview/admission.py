@@ -0,0 +1,109 @@
+"""
+Admission control for validation jobs.
+
+Streamlit runs every session as a thread of one process, so several reviewers
+pressing Validate together parse their XML trees at the same time. Jobs are
+admitted through a shared controller under a memory and concurrency budget;
+the rest wait in FIFO order and can report their queue position.
+"""
+import fnmatch
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+from .archive import get_archive
+
+MEMORY_BUDGET_BYTES = int(os.environ.get("DOCREVIEW_MEMORY_BUDGET_MB", 1024)) * 1024 * 1024
+MAX_CONCURRENT_JOBS = int(os.environ.get("DOCREVIEW_MAX_CONCURRENT_JOBS", 2))
+XML_EXPANSION_FACTOR = 12  # ElementTree nodes take roughly this many bytes per byte of XML
+
+WORD_MAIN_PARTS = ["word/document.xml"]
+PPT_MAIN_PARTS = ["ppt/slides/slide*.xml"]
+XLSX_MAIN_PARTS = ["xl/sharedStrings.xml"]  # Worksheets are streamed; only the string table is held in memory
+
+QUEUE_POLL_SECONDS = 1.0  # How often a waiting job re-reports its position
+
+
+def estimate_job_cost(archive_path, main_parts):
+    """
+    Estimates the peak memory of validating a document, in bytes.
+
+    Reads only the central directory: the archive itself is mapped once, and the
+    parsed trees of the main parts dominate, so their uncompressed sizes are scaled
+    by XML_EXPANSION_FACTOR.
+    """
+    xml_bytes = sum(
+        info.file_size
+        for info in get_archive(archive_path).infolist()
+        if any(fnmatch.fnmatch(info.filename, pattern) for pattern in main_parts)
+    )
+    return os.path.getsize(archive_path) + xml_bytes * XML_EXPANSION_FACTOR
+
+
+class AdmissionController:
+    """Admits jobs in FIFO order while both the memory and the concurrency budget allow."""
+
+    def __init__(self, memory_budget=MEMORY_BUDGET_BYTES, max_jobs=MAX_CONCURRENT_JOBS):
+        self.memory_budget = memory_budget
+        self.max_jobs = max_jobs
+        self._condition = threading.Condition()
+        self._queue = deque()
+        self._running_cost = 0
+        self._running_jobs = 0
+
+    def _fits(self, cost):
+        if self._running_jobs == 0:
+            return True  # ✅ A job larger than the whole budget still runs, alone
+        return self._running_jobs < self.max_jobs and self._running_cost + cost <= self.memory_budget
+
+    def queue_length(self):
+        with self._condition:
+            return len(self._queue)
+
+    @contextmanager
+    def admit(self, cost, on_wait=None):
+        """
+        Blocks until the job may run, then holds its share of the budget for the duration of the block.
+
+        :param cost: Estimated bytes, e.g. from estimate_job_cost.
+        :param on_wait: Optional callable(position) called while queued whenever the 1-based position changes.
+                        It runs without the controller's lock held, so a slow UI update never blocks other jobs.
+        """
+        ticket = object()
+        with self._condition:
+            self._queue.append(ticket)
+        last_position = None
+        try:
+            while True:
+                with self._condition:
+                    if self._queue[0] is ticket and self._fits(cost):
+                        self._queue.popleft()
+                        self._running_jobs += 1
+                        self._running_cost += cost
+                        self._condition.notify_all()  # The next job in line may fit as well
+                        break
+                    position = self._queue.index(ticket) + 1
+                    if not on_wait or position == last_position:
+                        self._condition.wait(QUEUE_POLL_SECONDS)
+                        continue
+                on_wait(position)  # ✅ Outside the lock
+                last_position = position
+        except BaseException:
+            # ⚠️ The session went away while queued (e.g. Streamlit stopped the script): give up the place in line
+            with self._condition:
+                if ticket in self._queue:
+                    self._queue.remove(ticket)
+                self._condition.notify_all()
+            raise
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._running_jobs -= 1
+                self._running_cost -= cost
+                self._condition.notify_all()
+
+
+controller = AdmissionController()  # Shared by every session of the app
@@ -0,0 +1,160 @@
+import mmap
+import os
+import struct
+import threading
+import zipfile
+from collections import OrderedDict
+from contextlib import contextmanager
+
+MAX_OPEN_ARCHIVES = 8  # Readers kept mapped at once (oldest is unmapped first)
+
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")  # Fixed 30-byte zip local file header
+
+
+class _BufferFile:
+    """Minimal read-only, seekable file object over a memoryview (no copy of the archive)."""
+
+    def __init__(self, view):
+        self._view = view
+        self._pos = 0
+
+    def read(self, size=-1):
+        end = len(self._view) if size is None or size < 0 else min(self._pos + size, len(self._view))
+        data = self._view[self._pos:end].tobytes()
+        self._pos = end
+        return data
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+        elif whence == os.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def seekable(self):
+        return True
+
+    def close(self):
+        pass
+
+
+class ArchiveReader:
+    """
+    Zip reader that maps the archive once and parses the central directory once.
+
+    `source` is a file path (memory-mapped read-only) or a bytes-like object already in
+    memory (served through a memoryview without copying the archive). Member reads are
+    served from the mapping; `read_view` returns a zero-copy memoryview for members stored
+    without compression.
+    """
+
+    def __init__(self, source):
+        self._mmap = None
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    raise zipfile.BadZipFile(f"❌ Empty archive: {source}")
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)
+        else:
+            self._view = memoryview(source).cast("B")
+        self._zip = zipfile.ZipFile(_BufferFile(self._view), "r")
+
+    def namelist(self):
+        return self._zip.namelist()
+
+    def infolist(self):
+        return self._zip.infolist()
+
+    def getinfo(self, member):
+        return self._zip.getinfo(member)
+
+    def read(self, member):
+        return self._zip.read(member)
+
+    def open(self, member):
+        return self._zip.open(member)
+
+    def read_view(self, member):
+        """Returns the member's bytes as a memoryview; zero-copy when the member is stored uncompressed."""
+        info = self._zip.getinfo(member)
+        if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+            return memoryview(self._zip.read(member))
+        header = _LOCAL_HEADER.unpack_from(self._view, info.header_offset)
+        name_length, extra_length = header[-2], header[-1]
+        start = info.header_offset + _LOCAL_HEADER.size + name_length + extra_length
+        return self._view[start:start + info.file_size]
+
+    def close(self):
+        self._zip.close()
+        try:
+            self._view.release()
+            if self._mmap is not None:
+                self._mmap.close()
+        except BufferError:
+            pass  # A read_view() is still referenced; the mapping is freed once it is garbage collected
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_archives = OrderedDict()
+_archives_lock = threading.Lock()
+_release_hooks = []  # Called with the absolute path when an archive is released (drops per-file caches)
+
+
+def on_release(hook):
+    """Registers `hook(abs_path)` to run whenever release_archive() is called for a file."""
+    _release_hooks.append(hook)
+    return hook
+
+
+def get_archive(path):
+    """
+    Returns a shared ArchiveReader for `path`, reopened only when the file changes on disk.
+
+    Callers must not close the returned reader; use release_archive() once the file is
+    no longer needed (required on Windows before the file can be deleted or overwritten).
+    """
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    with _archives_lock:
+        cached = _archives.get(abs_path)
+        if cached is not None and cached[0] == key:
+            _archives.move_to_end(abs_path)
+            return cached[1]
+        if cached is not None:
+            cached[1].close()
+
+        reader = ArchiveReader(abs_path)
+        _archives[abs_path] = (key, reader)
+        while len(_archives) > MAX_OPEN_ARCHIVES:
+            _, (_, oldest) = _archives.popitem(last=False)
+            oldest.close()
+        return reader
+
+
+def release_archive(path):
+    """Unmaps a shared archive so the underlying file can be removed or rewritten, and drops what was cached for it."""
+    abs_path = os.path.abspath(path)
+    with _archives_lock:
+        cached = _archives.pop(abs_path, None)
+    if cached is not None:
+        cached[1].close()
+    for hook in _release_hooks:
+        hook(abs_path)
+
+
+@contextmanager
+def shared_archive(path):
+    """Drop-in for `with zipfile.ZipFile(path, "r") as z:` that reuses the shared mapped reader."""
+    yield get_archive(path)
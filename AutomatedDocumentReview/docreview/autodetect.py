@@ -0,0 +1,102 @@
+"""
+Detects which catalog release a document belongs to from the IDs written in it.
+
+Word documents are read from the page 1 key/value block, decks from Slide 1's
+"Slide1ProjectDetails" shape. The Enterprise Release, Project and Application
+IDs found there are looked up in a hashed index of the catalog (one dict probe
+per ID), so detection costs the same whether the catalog holds 100 or 100k rows.
+
+    python -m docreview.autodetect report1.docx deck1.pptx ...
+"""
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .admission import controller as admission, estimate_job_cost
+from .preflight import ArchiveRejected, inspect_archive
+from .releases import KEY_COLUMNS, match_releases
+
+MAX_WORKERS = 4  # Documents read in parallel in batch mode
+DETECTABLE_EXTENSIONS = (".docx", ".pptx")  # Formats that carry the release IDs on page 1 / Slide 1
+
+
+def detect_fields(path):
+    """Returns the release fields written in a .docx (page 1) or .pptx (Slide 1)."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".docx":
+        from .word import extract_key_values, extract_page1_text
+
+        return extract_key_values(extract_page1_text(path))
+    if extension == ".pptx":
+        from .ppt import extract_slide1_project_details
+
+        return extract_slide1_project_details(path)
+    raise ValueError(f"❌ Unsupported document type '{extension}'. Expected .docx or .pptx")
+
+
+def detect_release(path, limit=5):
+    """
+    Finds the catalog rows matching a document's IDs.
+
+    :return: Dict with "document", "fields" (values found in the document), "candidates"
+             ([(catalog row, matched ID columns)], most matched IDs first), "release" (the
+             best candidate's row when it is unambiguous, else None) and "error".
+    """
+    result = {"document": path, "fields": {}, "candidates": [], "release": None, "error": None}
+    try:
+        inspect_archive(path)
+        result["fields"] = detect_fields(path)
+    except (ArchiveRejected, ValueError, KeyError, OSError) as e:
+        result["error"] = str(e)
+        return result
+
+    candidates = match_releases(result["fields"], limit=limit)
+    result["candidates"] = candidates
+    if candidates:
+        best_row, best_columns = candidates[0]
+        runner_up = len(candidates[1][1]) if len(candidates) > 1 else 0
+        if len(best_columns) > runner_up:
+            result["release"] = best_row  # ✅ Strictly more IDs matched than any other row
+    return result
+
+
+def detect_release_admitted(path, main_parts, on_wait=None, limit=5):
+    """
+    detect_release inside a slot of the shared admission budget, for the Streamlit pages:
+    detection parses page 1 / Slide 1 of an upload as a validation would.
+
+    :param main_parts: Members that dominate the document's memory (admission *_MAIN_PARTS).
+    :param on_wait: Passed to admission.admit; called with the queue position while waiting.
+    """
+    try:
+        inspect_archive(path)  # ✅ Reject zip bombs / oversized parts before queueing for a slot
+        job_cost = estimate_job_cost(path, main_parts)
+    except ArchiveRejected as e:
+        return {"document": path, "fields": {}, "candidates": [], "release": None, "error": str(e)}
+    with admission.admit(job_cost, on_wait=on_wait):
+        return detect_release(path, limit)
+
+
+def detect_releases(paths, max_workers=MAX_WORKERS):
+    """Batch mode: detect_release for each path, in input order."""
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(detect_release, paths))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Detect the catalog release of Word/PowerPoint documents.")
+    parser.add_argument("documents", nargs="+")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    args = parser.parse_args()
+
+    for result in detect_releases(args.documents, args.workers):
+        name = os.path.basename(result["document"])
+        if result["error"]:
+            print(f"❌ {name}: {result['error']}")
+        elif result["release"]:
+            release = result["release"]
+            print(f"✅ {name}: " + ", ".join(f"{column} {release[column]}" for column in KEY_COLUMNS))
+        elif result["candidates"]:
+            print(f"⚠️ {name}: {len(result['candidates'])} equally likely releases; select one manually")
+        else:
+            print(f"❌ {name}: no catalog release matches {result['fields'] or 'the document'}")
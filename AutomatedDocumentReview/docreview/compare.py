@@ -0,0 +1,115 @@
+"""Structural comparison of two releases of the same Word or PowerPoint document."""
+import hashlib
+import os
+import re
+from difflib import SequenceMatcher
+
+from . import ppt, word
+
+
+def _normalize(text):
+    return re.sub(r"\s+", " ", str(text)).strip().lower()
+
+
+def _fingerprint(item):
+    """Hashes an item's normalized text so alignment compares short digests instead of long strings."""
+    if isinstance(item, dict):
+        item = "\x1f".join(f"{key}={_normalize(value)}" for key, value in sorted(item.items()))
+    return hashlib.blake2b(_normalize(item).encode("utf-8"), digest_size=8).digest()
+
+
+def extract_word_structure(docx_path):
+    """Extracts the parts of a .docx that are compared between releases."""
+    return {
+        "Sections": sorted(word.extract_section_names(docx_path)),
+        "Table of Contents": [f"{'  ' * (level - 1)}{name}" for level, name in word.extract_toc_sections(docx_path)],
+        "Revision History": [
+            " | ".join(f"{key}: {value}" for key, value in row.items())
+            for row in (word.extract_revision_history(docx_path) or [])
+        ],
+        "Page 1 Fields": word.extract_key_values(word.extract_page1_text(docx_path)),
+    }
+
+
+def extract_ppt_structure(pptx_path):
+    """Extracts the named shapes of every slide, in slide order."""
+    return {
+        "Slides": [ppt.extract_named_shapes(pptx_path, number) for number in range(1, ppt.get_total_slides(pptx_path) + 1)],
+    }
+
+
+def diff_sequences(old_items, new_items):
+    """Aligns two ordered lists on their hashes and reports added, removed and changed items."""
+    matcher = SequenceMatcher(None, [_fingerprint(i) for i in old_items], [_fingerprint(i) for i in new_items], autojunk=False)
+    changes = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        old_chunk, new_chunk = old_items[i1:i2], new_items[j1:j2]
+        if tag == "replace":
+            for old_item, new_item in zip(old_chunk, new_chunk):
+                changes.append(f"✏️ Changed: '{old_item}' → '{new_item}'")
+            old_chunk, new_chunk = old_chunk[len(new_chunk):], new_chunk[len(old_chunk):]
+        changes.extend(f"➖ Removed: '{item}'" for item in old_chunk)
+        changes.extend(f"➕ Added: '{item}'" for item in new_chunk)
+    return changes
+
+
+def diff_mappings(old_map, new_map):
+    """Reports keys added, removed or whose value changed between two dicts."""
+    changes = []
+    for key in list(old_map) + [k for k in new_map if k not in old_map]:
+        if key not in new_map:
+            changes.append(f"➖ {key}: removed (was '{old_map[key]}')")
+        elif key not in old_map:
+            changes.append(f"➕ {key}: added ('{new_map[key]}')")
+        elif _normalize(old_map[key]) != _normalize(new_map[key]):
+            changes.append(f"✏️ {key}: '{old_map[key]}' → '{new_map[key]}'")
+    return changes
+
+
+def diff_slides(old_slides, new_slides):
+    """Aligns slides by content (so an inserted slide doesn't shift every later comparison) and diffs their shapes."""
+    matcher = SequenceMatcher(None, [_fingerprint(s) for s in old_slides], [_fingerprint(s) for s in new_slides], autojunk=False)
+    results = {}
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        pairs = list(zip(range(i1, i2), range(j1, j2))) if tag == "replace" else []
+        for old_index, new_index in pairs:
+            label = f"Slide {old_index + 1} → Slide {new_index + 1}" if old_index != new_index else f"Slide {new_index + 1}"
+            results[label] = diff_mappings(old_slides[old_index], new_slides[new_index])
+        for old_index in range(i1 + len(pairs), i2):
+            results[f"Slide {old_index + 1} (previous)"] = ["➖ Slide removed"]
+        for new_index in range(j1 + len(pairs), j2):
+            results[f"Slide {new_index + 1} (new)"] = ["➕ Slide added"]
+    return results
+
+
+def compare_documents(old_path, new_path):
+    """
+    Compares two releases of a .docx or .pptx document.
+
+    :return: Dict of section -> list of change lines, in the same shape as the validation results.
+    """
+    extension = os.path.splitext(new_path)[1].lower()
+    if extension != os.path.splitext(old_path)[1].lower():
+        raise ValueError("❌ Both documents must be of the same type (.docx or .pptx).")
+
+    if extension == ".pptx":
+        results = diff_slides(extract_ppt_structure(old_path)["Slides"], extract_ppt_structure(new_path)["Slides"])
+        return results or {"Slides": ["✅ No differences"]}
+
+    if extension != ".docx":
+        raise ValueError(f"❌ Unsupported document type '{extension}'. Expected .docx or .pptx.")
+
+    old_structure, new_structure = extract_word_structure(old_path), extract_word_structure(new_path)
+    results = {}
+    for section, old_value in old_structure.items():
+        new_value = new_structure[section]
+        if isinstance(old_value, dict):
+            changes = diff_mappings(old_value, new_value)
+        else:
+            changes = diff_sequences(old_value, new_value)
+        results[section] = changes or ["✅ No differences"]
+    return results
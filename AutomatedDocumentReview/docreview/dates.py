@@ -0,0 +1,99 @@
+import re
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+# Known revision-date formats, in order of preference when a value fits several (e.g. 03/04/2025)
+DATE_FORMATS = [
+    "%d-%B-%Y", "%d-%b-%Y", "%m/%d/%Y", "%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d",
+    "%Y/%m/%d", "%d.%m.%Y", "%A, %d %B %Y", "%d %B %Y", "%d-%m-%Y %H:%M:%S",
+]
+
+DETECTION_SAMPLE_SIZE = 20  # Values tried against each format when detecting a column's format
+
+_format_cache = {}  # Value shape, e.g. "99/99/9999" -> winning format
+_format_cache_lock = threading.Lock()
+
+
+def _normalize(text):
+    """Normalizes spacing around separators the way the revision table extractor does."""
+    return re.sub(r"\s*/\s*", "/", str(text)).strip()
+
+
+def value_shape(text):
+    """Reduces a date string to its shape (digits → 9, words → a) so documents with the same layout share a format."""
+    return re.sub(r"[A-Za-z]+", "a", re.sub(r"\d", "9", text))
+
+
+def _count_matches(values, fmt):
+    hits = 0
+    for value in values:
+        try:
+            datetime.strptime(value, fmt)
+            hits += 1
+        except ValueError:
+            continue
+    return hits
+
+
+def detect_format(values):
+    """
+    Returns the format that parses most of the sample, or None.
+
+    The winner is cached against the shape of the first value, so later columns and
+    documents with the same layout skip detection as long as the cached format still fits.
+    """
+    sample = [v for v in (_normalize(v) for v in values if v is not None and not pd.isna(v)) if v][:DETECTION_SAMPLE_SIZE]
+    if not sample:
+        return None
+
+    shape = value_shape(sample[0])
+    cached = _format_cache.get(shape)
+    if cached and _count_matches(sample, cached) == len(sample):
+        return cached
+
+    best_format, best_hits = None, 0
+    for fmt in DATE_FORMATS:
+        hits = _count_matches(sample, fmt)
+        if hits > best_hits:  # Strictly greater keeps the earlier (preferred) format on ties
+            best_format, best_hits = fmt, hits
+            if hits == len(sample):
+                break
+
+    if best_format:
+        with _format_cache_lock:
+            _format_cache[shape] = best_format
+    return best_format
+
+
+def parse_date(text):
+    """Parses a single date string with the first matching known format."""
+    text = _normalize(text)
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def parse_dates(values):
+    """
+    Parses a whole column of date strings at once.
+
+    The column's format is detected once and applied with a vectorized pd.to_datetime;
+    only values that don't fit it (mixed-format tables) fall back to per-value parsing.
+    Returns a pd.Series of Timestamps (NaT where nothing matched), aligned with `values`.
+    """
+    series = pd.Series(list(values), dtype="object").map(lambda v: _normalize(v) if v is not None and not pd.isna(v) else "")
+    fmt = detect_format(series.tolist())
+    if fmt is None:
+        return pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
+
+    parsed = pd.to_datetime(series, format=fmt, errors="coerce")
+
+    leftovers = parsed.isna() & (series != "")
+    if leftovers.any():
+        parsed.loc[leftovers] = pd.to_datetime(series[leftovers].map(parse_date), errors="coerce")
+    return parsed
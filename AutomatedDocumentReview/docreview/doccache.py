@@ -0,0 +1,150 @@
+"""
+On-disk cache of extracted document structures.
+
+Extractors decorated with @cached_extraction store their results per document,
+keyed by the SHA-256 of the uploaded file and EXTRACTOR_VERSION. Re-validating
+the same upload against another release row or an updated config.xlsx then
+reads the pickled structures instead of re-parsing the archive.
+
+The folder keeps the MAX_CACHE_FILES most recently used documents: files of older
+extractor versions and the least recently used ones are pruned on every save.
+"""
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .telemetry import get_logger
+
+CACHE_FOLDER = os.path.join(os.getcwd(), "cache", "parsed")
+EXTRACTOR_VERSION = 3  # ⚠️ Bump whenever an extractor's output changes so stale entries are ignored
+MAX_ENTRIES_IN_MEMORY = 32
+MAX_DIGESTS = 1024  # File versions whose digest is remembered
+MAX_CACHE_FILES = 500  # Documents kept in CACHE_FOLDER
+
+logger = get_logger(__name__)
+
+_entries = OrderedDict()  # Document digest -> {(extractor name, *args): value}
+_digests = OrderedDict()  # (path, mtime, size) -> document digest
+_dirty = set()
+_lock = threading.RLock()
+
+
+def document_digest(path):
+    """SHA-256 of the file contents, memoised until the file changes on disk."""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        if key in _digests:
+            _digests.move_to_end(key)
+            return _digests[key]
+
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha.update(chunk)
+    digest = sha.hexdigest()
+
+    with _lock:
+        _digests[key] = digest
+        while len(_digests) > MAX_DIGESTS:
+            _digests.popitem(last=False)
+    return digest
+
+
+def _cache_file(digest):
+    return os.path.join(CACHE_FOLDER, f"{digest}-v{EXTRACTOR_VERSION}.pkl")
+
+
+def load_document_cache(path):
+    """Returns the cached structures for a document (loading them from disk once); empty dict on a miss."""
+    digest = document_digest(path)
+    with _lock:
+        if digest in _entries:
+            _entries.move_to_end(digest)
+            return _entries[digest]
+
+        entry = {}
+        cache_file = _cache_file(digest)
+        if os.path.exists(cache_file):
+            try:
+                with open(cache_file, "rb") as f:
+                    entry = pickle.load(f)
+                os.utime(cache_file)  # Marks the file as recently used for prune_cache_folder
+            except Exception as e:
+                logger.warning("ignoring unreadable parse cache %s: %s", cache_file, e)
+                entry = {}
+
+        _entries[digest] = entry
+        while len(_entries) > MAX_ENTRIES_IN_MEMORY:
+            evicted, _ = _entries.popitem(last=False)
+            _dirty.discard(evicted)
+        return entry
+
+
+def save_document_cache(path):
+    """Writes newly extracted structures for a document to disk (atomically); no-op when nothing changed."""
+    digest = document_digest(path)
+    with _lock:
+        if digest not in _dirty or digest not in _entries:
+            return
+        entry = dict(_entries[digest])
+        _dirty.discard(digest)
+
+    os.makedirs(CACHE_FOLDER, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_FOLDER, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _cache_file(digest))
+    except Exception:
+        os.remove(tmp_path)
+        raise
+    prune_cache_folder()
+
+
+def prune_cache_folder(max_files=MAX_CACHE_FILES):
+    """Deletes cache files of other extractor versions, then all but the `max_files` most recently used."""
+    current_suffix = f"-v{EXTRACTOR_VERSION}.pkl"
+    try:
+        names = [name for name in os.listdir(CACHE_FOLDER) if name.endswith(".pkl")]
+    except FileNotFoundError:
+        return
+    current = []
+    for name in names:
+        cache_file = os.path.join(CACHE_FOLDER, name)
+        try:
+            if name.endswith(current_suffix):
+                current.append((os.path.getmtime(cache_file), cache_file))
+            else:
+                os.remove(cache_file)
+        except FileNotFoundError:
+            pass  # Pruned by another session
+    for _, cache_file in sorted(current, reverse=True)[max_files:]:
+        try:
+            os.remove(cache_file)
+        except FileNotFoundError:
+            pass
+
+
+def cached_extraction(func):
+    """Caches an extractor's result per (document contents, extractor, arguments). Results must be treated as read-only."""
+    @functools.wraps(func)
+    def wrapper(archive_path, *args):
+        entry = load_document_cache(archive_path)
+        key = (func.__name__,) + tuple(str(arg) for arg in args)
+        with _lock:
+            if key in entry:
+                return entry[key]
+
+        value = func(archive_path, *args)
+
+        with _lock:
+            entry[key] = value
+            _dirty.add(document_digest(archive_path))
+        return value
+
+    return wrapper
@@ -0,0 +1,269 @@
+"""
+Registry of the document types the reviewer can validate.
+
+A document type bundles everything a page or API route needs to validate one
+template: the upload extensions, the parts that dominate its memory (for
+admission control), the part registry its declarative rules read, the rules
+sheet and the config sheet in config.xlsx. Word test plans and PowerPoint
+reports keep their hand-written validators; any other template is validated
+by its rules sheet alone (validate_with_rules) through the same cached,
+incremental and parallel pipeline, so a new template needs rows in config.xlsx
+rather than a new page script:
+
+    document_types sheet        Name | Label | Extensions | Parts | Rules Sheet | Config Sheet
+                                closure_report | Test Closure Report | .docx | word | closure_rules | test_closure_report
+
+"Parts" names a built-in part registry ("word", "ppt") or a "module:attribute"
+reference; "xlsx" registers a standalone workbook type instead, checked by
+docreview.workbook from its Config Sheet (sheets and header schemas) and Rules
+Sheet (cell rules). Validators and part registries are referenced by "module:attribute"
+strings and imported on first use, so listing the types loads no validator.
+"""
+import importlib
+import os
+import time
+
+import pandas as pd
+
+from .admission import PPT_MAIN_PARTS, WORD_MAIN_PARTS, XLSX_MAIN_PARTS
+from .doccache import save_document_cache
+from .incremental import inputs_fingerprint, run_incremental
+from .preflight import inspect_archive
+from .rules import execute_plan, load_rule_plan, plan_members
+from .scheduler import run_stages
+from .telemetry import get_logger, record_validation
+
+CONFIG_FILE = os.path.join(os.getcwd(), "config", "config.xlsx")
+TYPES_SHEET_NAME = "document_types"  # Optional sheet registering rule-only document types
+VALIDATION_WORKERS = 4  # Thread pool size for the parts of a rule-only validation
+
+# Part registry name -> ("module:attribute" of its RULE_ENGINE_PARTS, members that dominate memory)
+PART_REGISTRIES = {
+    "word": ("docreview.word:RULE_ENGINE_PARTS", WORD_MAIN_PARTS),
+    "ppt": ("docreview.ppt:RULE_ENGINE_PARTS", PPT_MAIN_PARTS),
+}
+WORKBOOK_VALIDATOR = "docreview.workbook:validate_workbook"  # Streams standalone .xlsx workbooks sheet by sheet
+WORKBOOK_EXTENSIONS = [".xlsx", ".xlsm"]
+
+logger = get_logger(__name__)
+
+
+def resolve(reference):
+    """Imports a "module:attribute" reference; other values are returned unchanged."""
+    if not isinstance(reference, str):
+        return reference
+    module_name, _, attribute = reference.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class DocumentType:
+    """One reviewable template: how to recognise, admit and validate it."""
+
+    def __init__(self, name, label, extensions, main_parts, parts=None, rules_sheet=None,
+                 config_sheet=None, validator=None, requires_release=False):
+        self.name = name  # Also the "kind" label of the validation metrics
+        self.label = label
+        self.extensions = tuple(extension.lower() for extension in extensions)
+        self.main_parts = list(main_parts)
+        self.parts_ref = parts  # Part registry (dict or "module:attribute") the rules sheet reads
+        self.rules_sheet = rules_sheet
+        self.config_sheet = config_sheet
+        self.validator = validator  # callable(doc_type, path, release_row, cache, timings, config_file); None = rules only
+        self.requires_release = requires_release  # Validator reads the release row (not only {placeholders})
+
+    @property
+    def parts(self):
+        return resolve(self.parts_ref) if self.parts_ref is not None else {}
+
+    def accepts(self, path):
+        return os.path.splitext(str(path))[1].lower() in self.extensions
+
+    def validate(self, path, release_row, cache=None, timings=None, config_file=CONFIG_FILE):
+        """
+        Validates a document of this type against the selected release row.
+
+        :param cache: Dict kept across reruns; only results whose parts changed are recomputed.
+        :param timings: Dict receiving per-stage timings, when the validator reports them.
+        :return: Dict of result section -> result lines (or {check: line} for slide-style results).
+        """
+        validator = resolve(self.validator) if self.validator is not None else validate_with_rules
+        return validator(self, path, release_row, cache, timings, config_file)
+
+    def __repr__(self):
+        return f"DocumentType({self.name!r}, extensions={self.extensions})"
+
+
+def _validate_word(doc_type, path, release_row, cache, timings, config_file):
+    from .word import validate_document
+
+    return validate_document(path, config_file, doc_type.config_sheet, release_row, cache=cache, timings=timings)
+
+
+def _validate_ppt(doc_type, path, release_row, cache, timings, config_file):
+    from .ppt import validate_ppt
+
+    return validate_ppt(path, release_row, cache=cache, config_file=config_file)
+
+
+def read_config_sheet(config_file, sheet_name):
+    """Key/Value config sheet as a dict; empty when the file or sheet does not exist."""
+    if not sheet_name or not os.path.exists(config_file):
+        return {}
+    xls = pd.ExcelFile(config_file, engine="openpyxl")
+    if sheet_name not in xls.sheet_names:
+        return {}
+    return pd.read_excel(xls, sheet_name=sheet_name).set_index("Key")["Value"].to_dict()
+
+
+def release_row_dict(release_row):
+    """The selected release as a plain dict (grid rows are dicts, detected or PPT rows may be a Series)."""
+    if release_row is None:
+        return {}
+    return release_row.to_dict() if isinstance(release_row, pd.Series) else dict(release_row)
+
+
+def validate_with_rules(doc_type, path, release_row, cache=None, timings=None, config_file=CONFIG_FILE):
+    """
+    Validates a document by its rules sheet only: one stage per document part,
+    run in parallel, each extracting its part once for all the rules that read it.
+    """
+    inspect_archive(path)
+    started = time.perf_counter()
+    if timings is None:
+        timings = {}
+    parts = doc_type.parts
+    plan = load_rule_plan(config_file, doc_type.rules_sheet, parts)
+    if not plan:
+        return {"Configured Rules": [f"⚠️ No rules configured in sheet '{doc_type.rules_sheet}' for {doc_type.label}"]}
+
+    config = read_config_sheet(config_file, doc_type.config_sheet)
+    row = release_row_dict(release_row)
+    context = {**config, **row}
+
+    # ✅ One stage per part spec: parts are extracted in parallel, each once for all its rules
+    rules, rule_parts = {}, {}
+    for part_spec, part_rules in plan.items():
+        name = f"{part_spec} rules"
+        part_plan = {part_spec: part_rules}
+        rules[name] = lambda part_plan=part_plan: execute_plan(part_plan, path, parts, context)
+        rule_parts[name] = plan_members(part_plan, parts)
+
+    def run_rules(to_run):
+        results, stage_timings = run_stages({name: (rule, []) for name, rule in to_run.items()}, VALIDATION_WORKERS)
+        timings.update(stage_timings)
+        return results
+
+    if cache is None:
+        results = run_rules(rules)
+        results = {name: results[name] for name in rules}
+    else:
+        inputs_key = inputs_fingerprint(config, row, os.path.getmtime(config_file))
+        results = run_incremental(path, rules, rule_parts, cache, inputs_key, run_rules=run_rules)
+
+    save_document_cache(path)
+    record_validation(doc_type.name, results, time.perf_counter() - started, timings)
+    return results
+
+
+_builtin_types = {}
+_config_types_cache = {}
+
+
+def register_document_type(doc_type):
+    """Adds a document type to the built-in registry (e.g. from a plugin module). Names must be unique."""
+    if doc_type.name in _builtin_types:
+        raise ValueError(f"❌ Document type '{doc_type.name}' is already registered")
+    _builtin_types[doc_type.name] = doc_type
+    return doc_type
+
+
+register_document_type(DocumentType(
+    "word", "Test Plan (Word)", [".docx"], WORD_MAIN_PARTS, parts=PART_REGISTRIES["word"][0],
+    rules_sheet="word_rules", config_sheet="performance_testing_strategy", validator=_validate_word, requires_release=True,
+))
+register_document_type(DocumentType(
+    "ppt", "Test Report (PowerPoint)", [".pptx"], PPT_MAIN_PARTS, parts=PART_REGISTRIES["ppt"][0],
+    rules_sheet="ppt_rules", validator=_validate_ppt, requires_release=True,
+))
+register_document_type(DocumentType(
+    "closure_report", "Test Closure Report (Word)", [".docx"], WORD_MAIN_PARTS, parts=PART_REGISTRIES["word"][0],
+    rules_sheet="closure_rules", config_sheet="test_closure_report",
+))
+register_document_type(DocumentType(
+    "nfr_workbook", "NFR Workbook (Excel)", WORKBOOK_EXTENSIONS, XLSX_MAIN_PARTS,
+    rules_sheet="nfr_workbook_rules", config_sheet="nfr_workbook_sheets", validator=WORKBOOK_VALIDATOR,
+))
+register_document_type(DocumentType(
+    "results_workbook", "Test Results Workbook (Excel)", WORKBOOK_EXTENSIONS, XLSX_MAIN_PARTS,
+    rules_sheet="results_workbook_rules", config_sheet="results_workbook_sheets", validator=WORKBOOK_VALIDATOR,
+))
+
+
+def _cell_text(value):
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return ""
+    return str(value).strip()
+
+
+def _config_type(row):
+    name = _cell_text(row.get("Name"))
+    parts = _cell_text(row.get("Parts")) or "word"
+    extensions = [e if e.startswith(".") else f".{e}" for e in (e.strip() for e in _cell_text(row.get("Extensions")).split(",")) if e]
+    if parts == "xlsx":
+        return DocumentType(
+            name, _cell_text(row.get("Label")) or name, extensions or WORKBOOK_EXTENSIONS, XLSX_MAIN_PARTS,
+            rules_sheet=_cell_text(row.get("Rules Sheet")) or f"{name}_rules",
+            config_sheet=_cell_text(row.get("Config Sheet")) or f"{name}_sheets", validator=WORKBOOK_VALIDATOR,
+        )
+    if parts in PART_REGISTRIES:
+        parts, main_parts = PART_REGISTRIES[parts]
+    elif ":" in parts:
+        main_parts = []  # Unknown layout: admission counts the archive size only
+    else:
+        raise ValueError(f"❌ Document type '{name}': unknown parts '{parts}'. Expected one of "
+                         f"{sorted(PART_REGISTRIES) + ['xlsx']} or a module:attribute reference")
+    return DocumentType(
+        name, _cell_text(row.get("Label")) or name, extensions, main_parts, parts=parts,
+        rules_sheet=_cell_text(row.get("Rules Sheet")) or f"{name}_rules",
+        config_sheet=_cell_text(row.get("Config Sheet")) or None,
+    )
+
+
+def _config_types(config_file):
+    """Rule-only types from the document_types sheet, re-read only when config.xlsx changes on disk."""
+    if not os.path.exists(config_file):
+        return {}
+    cache_key = (os.path.abspath(config_file), os.path.getmtime(config_file))
+    if cache_key not in _config_types_cache:
+        xls = pd.ExcelFile(config_file, engine="openpyxl")
+        types = {}
+        if TYPES_SHEET_NAME in xls.sheet_names:
+            df = pd.read_excel(xls, sheet_name=TYPES_SHEET_NAME, dtype=str)
+            df.columns = df.columns.str.strip()
+            for row in df.to_dict("records"):
+                if not _cell_text(row.get("Name")):
+                    continue  # Blank spreadsheet row
+                doc_type = _config_type(row)
+                if doc_type.name in _builtin_types:
+                    logger.warning("config document type shadows a built-in type; ignored", extra={"fields": {"type": doc_type.name}})
+                    continue
+                types[doc_type.name] = doc_type
+        _config_types_cache[cache_key] = types
+    return _config_types_cache[cache_key]
+
+
+def document_types(config_file=CONFIG_FILE):
+    """All document types: built-in and plugin registrations first, then the document_types sheet."""
+    return {**_builtin_types, **_config_types(config_file)}
+
+
+def get_document_type(name, config_file=CONFIG_FILE):
+    types = document_types(config_file)
+    if name not in types:
+        raise ValueError(f"❌ Unknown document type '{name}'. Expected one of {sorted(types)}")
+    return types[name]
+
+
+def document_types_for(path, config_file=CONFIG_FILE):
+    """Document types accepting a file's extension, in registry order (the first is the default)."""
+    return [doc_type for doc_type in document_types(config_file).values() if doc_type.accepts(path)]
@@ -0,0 +1,146 @@
+"""
+Body paragraphs and tables of a .docx read straight from word/document.xml.
+
+A lightweight stand-in for python-docx's `Document(...).paragraphs` / `.tables`:
+the part is parsed once through xmlparts, every paragraph and cell string is
+built once, and the result is cached per document (docreview.doccache), so
+repeated passes over the body cost list iterations instead of rebuilding
+`para.text` / `cell.text` from the XML on every access.
+
+Texts follow python-docx: a paragraph's own runs and hyperlink runs are
+concatenated (text boxes and mc:AlternateContent nested in a run are skipped),
+<w:tab/> is "\\t", <w:br/> is "\\n", a cell's paragraphs are joined with "\\n",
+and only top-level body paragraphs and tables are listed. Merged cells are listed
+once (python-docx repeats them for every grid column they span).
+
+    python -m docreview.docxbody report.docx --repeat 5    # benchmark against python-docx
+"""
+import argparse
+import time
+from collections import namedtuple
+from functools import cached_property
+
+from .doccache import cached_extraction
+from .xmlparts import parse_part
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_RUN_TEXT = {W + "tab": "\t", W + "br": "\n", W + "cr": "\n", W + "noBreakHyphen": "-"}
+
+Paragraph = namedtuple("Paragraph", "text runs_text numbered")  # runs_text: direct runs joined with spaces
+
+
+def _run_text(run):
+    """Text of a run's own <w:t>/<w:tab>/<w:br> children; drawings and text boxes inside it are skipped."""
+    return "".join(node.text or "" if node.tag == W + "t" else _RUN_TEXT.get(node.tag, "") for node in run)
+
+
+def _paragraph_runs(p):
+    """The paragraph's direct runs and hyperlink runs, in document order."""
+    for child in p:
+        if child.tag == W + "r":
+            yield child
+        elif child.tag == W + "hyperlink":
+            yield from child.findall(W + "r")
+
+
+def _paragraph(p):
+    runs = [_run_text(run) for run in _paragraph_runs(p)]
+    return Paragraph(
+        text="".join(runs),
+        runs_text=" ".join(_run_text(run) for run in p.findall(W + "r")).strip(),
+        numbered=p.find(f"{W}pPr/{W}numPr") is not None,
+    )
+
+
+def _table(tbl):
+    return [
+        ["\n".join(_paragraph(p).text for p in tc.findall(W + "p")) for tc in tr.findall(W + "tc")]
+        for tr in tbl.findall(W + "tr")
+    ]
+
+
+class DocumentBody:
+    """Top-level paragraphs (Paragraph tuples) and tables (rows of cell strings) of a document."""
+
+    def __init__(self, paragraphs, tables):
+        self.paragraphs = paragraphs
+        self.tables = tables
+
+    @cached_property
+    def lower_text(self):
+        """All paragraph texts, lowercased and joined with spaces (built on first use)."""
+        return " ".join(para.text.lower() for para in self.paragraphs)
+
+
+def read_body(docx_path):
+    """Builds the DocumentBody from word/document.xml (uncached; see load_body)."""
+    body = parse_part(docx_path, "word/document.xml").find(W + "body")
+    paragraphs, tables = [], []
+    for child in body if body is not None else ():
+        if child.tag == W + "p":
+            paragraphs.append(_paragraph(child))
+        elif child.tag == W + "tbl":
+            tables.append(_table(child))
+    return DocumentBody(paragraphs, tables)
+
+
+@cached_extraction
+def load_body(docx_path):
+    """DocumentBody of a document, parsed once per file contents."""
+    return read_body(docx_path)
+
+
+def _python_docx_pass(docx_path):
+    """What the python-docx code path does: build the object model, then read every paragraph and cell."""
+    import docx
+
+    doc = docx.Document(docx_path)
+    paragraphs = [para.text for para in doc.paragraphs]
+    tables = [[[cell.text for cell in row.cells] for row in table.rows] for table in doc.tables]
+    return paragraphs, tables
+
+
+def _raw_pass(docx_path):
+    from .xmlparts import _parts
+
+    _parts.clear()  # Cold: include the XML parse, not just the cached lookup
+    body = read_body(docx_path)
+    return [para.text for para in body.paragraphs], body.tables
+
+
+def benchmark(docx_path, repeat=3):
+    """Best-of-`repeat` seconds for the python-docx and raw-XML passes (None when python-docx is not installed)."""
+    def best(run):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = run(docx_path)
+            timings.append(time.perf_counter() - started)
+        return min(timings), result
+
+    raw_seconds, (paragraphs, tables) = best(_raw_pass)
+    results = {"raw_xml": raw_seconds, "python_docx": None, "same_paragraphs": None,
+               "paragraphs": len(paragraphs), "tables": len(tables)}
+    try:
+        docx_seconds, (docx_paragraphs, _) = best(_python_docx_pass)
+    except ImportError:
+        return results
+    results.update(python_docx=docx_seconds, same_paragraphs=docx_paragraphs == paragraphs)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time raw-XML body extraction against python-docx.")
+    parser.add_argument("documents", nargs="+")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for path in args.documents:
+        results = benchmark(path, args.repeat)
+        print(f"📄 {path}: {results['paragraphs']} paragraphs, {results['tables']} tables")
+        print(f"   raw XML:     {results['raw_xml'] * 1000:.1f} ms")
+        if results["python_docx"] is None:
+            print("   python-docx: not installed")
+            continue
+        print(f"   python-docx: {results['python_docx'] * 1000:.1f} ms ({results['python_docx'] / results['raw_xml']:.1f}x slower)")
+        print(f"   {'✅ Same' if results['same_paragraphs'] else '⚠️ Different'} paragraph texts")
@@ -0,0 +1,135 @@
+import csv
+import io
+import os
+import uuid
+
+REPORT_HEADERS = ["Section", "Check", "Result"]
+BATCH_REPORT_HEADERS = ["Document"] + REPORT_HEADERS
+PARQUET_BATCH_ROWS = 10_000  # Rows buffered per Parquet row group
+
+EXPORT_FORMATS = {
+    "xlsx": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "csv": ("csv", "text/csv"),
+    "parquet": ("parquet", "application/octet-stream"),
+}
+
+
+def iter_report_rows(validation_results):
+    """
+    Flattens validation results into (Section, Check, Result) rows without building a DataFrame.
+
+    Handles both result shapes used by the pages: {section: [result lines]} (Word) and
+    {slide: {check: result}} (PPT).
+    """
+    for section, results in (validation_results or {}).items():
+        if isinstance(results, dict):
+            for check, result in results.items():
+                yield section, check, result
+        elif isinstance(results, (list, tuple)):
+            for result in results:
+                yield section, "", result
+        else:
+            yield section, "", results
+
+
+def iter_batch_rows(results_by_document):
+    """Yields (Document, Section, Check, Result) rows from (document name, validation results) pairs, e.g. a generator over a batch run."""
+    for document, validation_results in results_by_document:
+        for row in iter_report_rows(validation_results):
+            yield (document,) + row
+
+
+def write_xlsx(rows, output, headers=REPORT_HEADERS, sheet_name="Validation Report"):
+    """Streams rows into a single sheet with xlsxwriter in constant_memory mode (each row is flushed once written)."""
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(output, {"constant_memory": True})
+    worksheet = workbook.add_worksheet(sheet_name)
+    header_format = workbook.add_format({"bold": True})
+
+    worksheet.write_row(0, 0, headers, header_format)
+    row_count = 0
+    for row_count, row in enumerate(rows, 1):
+        worksheet.write_row(row_count, 0, ["" if value is None else str(value) for value in row])
+
+    if row_count == 0:
+        worksheet.write(1, 0, "No validation results found")  # ✅ Keep the report non-empty
+    workbook.close()
+
+
+def write_csv(rows, output, headers=REPORT_HEADERS):
+    """Streams rows as UTF-8 CSV into a path or binary file object."""
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, "wb") as f:
+            return write_csv(rows, f, headers)
+
+    text = io.TextIOWrapper(output, encoding="utf-8-sig", newline="", write_through=True)
+    writer = csv.writer(text)
+    writer.writerow(headers)
+    for row in rows:
+        writer.writerow(row)
+    text.detach()  # Leave `output` open for the caller
+
+
+def write_parquet(rows, output, headers=REPORT_HEADERS, batch_rows=PARQUET_BATCH_ROWS):
+    """Streams rows into Parquet in fixed-size row groups so memory stays flat for large batches."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(header, pa.string()) for header in headers])
+    with pq.ParquetWriter(output, schema) as writer:
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_rows:
+                writer.write_table(_parquet_table(batch, headers, schema))
+                batch = []
+        if batch:
+            writer.write_table(_parquet_table(batch, headers, schema))
+
+
+def _parquet_table(batch, headers, schema):
+    import pyarrow as pa
+
+    columns = list(zip(*batch))
+    return pa.table({
+        header: [None if value is None else str(value) for value in column]
+        for header, column in zip(headers, columns)
+    }, schema=schema)
+
+
+_WRITERS = {"xlsx": write_xlsx, "csv": write_csv, "parquet": write_parquet}
+
+
+def export_rows(rows, output, fmt="xlsx", headers=REPORT_HEADERS):
+    """Writes rows to a path or binary file object in the requested format."""
+    if fmt not in _WRITERS:
+        raise ValueError(f"❌ Unsupported export format '{fmt}'. Expected one of {sorted(_WRITERS)}")
+    _WRITERS[fmt](rows, output, headers=headers)
+
+
+def export_report(validation_results, fmt="xlsx"):
+    """Builds a single-document report in memory and returns its bytes."""
+    output = io.BytesIO()
+    export_rows(iter_report_rows(validation_results), output, fmt)
+    return output.getvalue()
+
+
+def new_run_id():
+    """Identifies one validation run; report bytes are cached against it."""
+    return uuid.uuid4().hex
+
+
+def cached_report(cache, run_id, validation_results, fmt="xlsx"):
+    """
+    Returns the report bytes for a validation run, building them at most once per (run, format).
+
+    :param cache: Mutable dict kept across reruns (e.g. an entry in st.session_state).
+    """
+    key = (run_id, fmt)
+    if key not in cache:
+        # ✅ Drop reports of earlier runs so only the current run's bytes are kept in the session
+        for stale_key in [k for k in cache if k[0] != run_id]:
+            del cache[stale_key]
+        cache[key] = export_report(validation_results, fmt)
+    return cache[key]
@@ -0,0 +1,147 @@
+"""
+Fuzzy matching of document fields against expected release values.
+
+Values are reduced to normalized tokens (case, accents, punctuation and spacing
+ignored). Near misses are scored with a banded edit distance that stops as soon
+as the distance exceeds the allowed budget, and FuzzyIndex finds the closest
+catalog value through a trigram index so only a handful of candidates are ever
+scored, even for 100k+ values.
+"""
+import re
+import unicodedata
+from collections import Counter, defaultdict
+
+CLOSE_MATCH_RATIO = 0.85  # Similarity from which a mismatch is reported as a close match
+MAX_CANDIDATES = 25  # Index candidates scored with edit distance per lookup
+COMMON_TRIGRAM_SHARE = 0.05  # Trigrams in more than this share of values ("pro", "roj") don't pick candidates
+
+_TOKEN_SPLIT = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_tokens(text):
+    """Lowercases, strips accents and splits on anything that is not a letter or digit."""
+    text = unicodedata.normalize("NFKD", str(text or "")).encode("ascii", "ignore").decode("ascii").lower()
+    return [token for token in _TOKEN_SPLIT.split(text) if token]
+
+
+def normalize_key(text):
+    """Canonical form used for comparisons: "Project Y – ABC" → "project y abc"."""
+    return " ".join(normalize_tokens(text))
+
+
+def edit_distance(a, b, max_distance=None):
+    """
+    Levenshtein distance between two strings.
+
+    With `max_distance`, only a diagonal band is computed and max_distance + 1 is
+    returned as soon as the distance is known to exceed it.
+    """
+    if a == b:
+        return 0
+    if len(a) > len(b):
+        a, b = b, a
+    if max_distance is None:
+        max_distance = len(b)
+    if len(b) - len(a) > max_distance:
+        return max_distance + 1
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        low, high = max(1, i - max_distance), min(len(b), i + max_distance)
+        current = [i] + [max_distance + 1] * len(b)
+        for j in range(low, high + 1):
+            cost = 0 if char_a == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+        if min(current[low - 1:high + 1]) > max_distance:
+            return max_distance + 1  # ✅ Early cutoff: every path already exceeds the budget
+        previous = current
+    return min(previous[len(b)], max_distance + 1)
+
+
+def similarity(a, b, min_ratio=0.0):
+    """1.0 for identical normalized values, falling with edit distance; 0.0 once below `min_ratio`."""
+    a, b = normalize_key(a), normalize_key(b)
+    longest = max(len(a), len(b))
+    if not longest:
+        return 1.0
+    budget = int(longest * (1 - min_ratio))
+    distance = edit_distance(a, b, budget)
+    return 0.0 if distance > budget else 1 - distance / longest
+
+
+def compare_field(found, expected, fuzzy=True, close_ratio=CLOSE_MATCH_RATIO):
+    """
+    Compares a document value with the expected one.
+
+    :param fuzzy: Report near misses as close matches. Leave off for IDs, where one
+                  character is the difference between two releases.
+    :return: (status, reason) with status "✅ Matched", "⚠️ Close Match" or "❌ Not Matched".
+    """
+    if str(found).strip().lower() == str(expected).strip().lower():
+        return "✅ Matched", "Values match"
+    if normalize_key(found) == normalize_key(expected):
+        return "✅ Matched", "Values match (ignoring case, spacing and punctuation)"
+    score = similarity(found, expected, close_ratio) if fuzzy else 0.0
+    if score:
+        return "⚠️ Close Match", f"Values differ slightly ({score:.0%} similar)"
+    return "❌ Not Matched", "Value mismatch"
+
+
+def _trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class FuzzyIndex:
+    """Precomputed normalized-trigram index over a list of values for closest-value lookups."""
+
+    def __init__(self, values):
+        self.values = []
+        self._keys = []
+        self._exact = {}
+        self._postings = defaultdict(list)
+        for value in dict.fromkeys(str(v) for v in values if str(v).strip()):
+            key = normalize_key(value)
+            if not key or key in self._exact:
+                continue
+            index = len(self.values)
+            self.values.append(value)
+            self._keys.append(key)
+            self._exact[key] = index
+            for gram in _trigrams(key):
+                self._postings[gram].append(index)
+
+    def __len__(self):
+        return len(self.values)
+
+    def closest(self, query, limit=1, min_ratio=0.6, exclude=None):
+        """
+        Returns up to `limit` (value, similarity) pairs, best first, scoring only the top trigram candidates.
+
+        :param exclude: A value (compared normalized) never returned, e.g. the expected one.
+        """
+        key = normalize_key(query)
+        excluded = self._exact.get(normalize_key(exclude)) if exclude is not None else None
+        if not key:
+            return []
+        if key in self._exact and self._exact[key] != excluded:
+            return [(self.values[self._exact[key]], 1.0)]
+
+        postings = [self._postings[gram] for gram in _trigrams(key) if gram in self._postings]
+        rare = [posting for posting in postings if len(posting) <= COMMON_TRIGRAM_SHARE * len(self)]
+        shared = Counter()
+        for posting in rare or postings:
+            shared.update(posting)
+
+        scored = []
+        for index, _ in shared.most_common(MAX_CANDIDATES + (excluded is not None)):
+            if index == excluded:
+                continue
+            candidate = self._keys[index]
+            longest = max(len(key), len(candidate))
+            budget = int(longest * (1 - min_ratio))
+            distance = edit_distance(key, candidate, budget)
+            if distance <= budget:
+                scored.append((self.values[index], 1 - distance / longest))
+        scored.sort(key=lambda item: -item[1])
+        return scored[:limit]
@@ -0,0 +1,108 @@
+"""
+Headers and footers of a .docx, resolved per document section.
+
+Each <w:sectPr> in word/document.xml lists its default/first/even header and
+footer by relationship ID; the IDs are resolved through the document's
+relationship graph, and a section without its own reference inherits the
+previous section's part, as Word does. The section map and each part's text
+are cached per document, and only the parts a check actually reaches are read,
+so a long document with many section footers is not scanned in full.
+"""
+import xml.etree.ElementTree as ET
+
+from .archive import get_archive
+from .doccache import cached_extraction
+from .relationships import load_relationships
+from .xmlparts import parse_part
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+VARIANTS = ("default", "first", "even")  # Checked in this order
+VARIANT_LABELS = {"default": "default", "first": "first page", "even": "even pages"}
+
+
+@cached_extraction
+def document_sections(docx_path):
+    """
+    Header and footer parts of every section, in document order.
+
+    :return: [{"section": 1-based number, "title_page": bool,
+               "headers": {variant: member}, "footers": {variant: member}}]
+    """
+    relationships = load_relationships(docx_path)
+    root = parse_part(docx_path, "word/document.xml")
+    sections = []
+    inherited = {"headers": {}, "footers": {}}
+    for number, sect_pr in enumerate(root.iter(W + "sectPr"), 1):
+        section = {"section": number, "title_page": sect_pr.find(W + "titlePg") is not None}
+        for kind, tag in (("headers", "headerReference"), ("footers", "footerReference")):
+            parts = dict(inherited[kind])
+            for reference in sect_pr.findall(W + tag):
+                member = relationships.target("word/document.xml", reference.get(R_ID))
+                if member:
+                    parts[reference.get(W + "type", "default")] = member
+            section[kind] = inherited[kind] = parts
+        sections.append(section)
+    return sections
+
+
+@cached_extraction
+def part_text(docx_path, member):
+    """Visible text of a header/footer part: runs joined per paragraph (tabs as spaces), paragraphs joined with spaces; field codes excluded."""
+    root = ET.fromstring(get_archive(docx_path).read(member))
+    paragraphs = (
+        "".join((node.text or "") if node.tag == W + "t" else " " for node in p.iter() if node.tag in (W + "t", W + "tab")).strip()
+        for p in root.iter(W + "p")
+    )
+    return " ".join(text for text in paragraphs if text)
+
+
+def _used_parts(section, kind):
+    """[(variant, member)] of a section's "headers"/"footers", skipping a first-page part the section does not show."""
+    return [(variant, section[kind][variant]) for variant in VARIANTS
+            if section[kind].get(variant) and (variant != "first" or section["title_page"])]
+
+
+def _joined_text(docx_path, kind):
+    members = dict.fromkeys(member for section in document_sections(docx_path) for _, member in _used_parts(section, kind))
+    return " ".join(filter(None, (part_text(docx_path, member) for member in members))).strip()
+
+
+def extract_footer_text(docx_path):
+    """Text of every footer used by the document (each part once, in section order)."""
+    return _joined_text(docx_path, "footers")
+
+
+def extract_header_text(docx_path):
+    """Text of every header used by the document (each part once, in section order)."""
+    return _joined_text(docx_path, "headers")
+
+
+def find_in_footers(docx_path, expected, every_section=False):
+    """
+    Looks for `expected` (case-insensitive) in the section footers.
+
+    Stops at the first matching footer; with `every_section`, each section must
+    have a matching footer and checking a section stops at its first match.
+    Parts shared between sections are read and searched once.
+
+    :return: (found, failing sections as [(section, [variant labels checked])], footers checked)
+    """
+    needle = str(expected).strip().lower()
+    sections = document_sections(docx_path)
+    verdicts = {}  # member -> contains the value
+    failing = []
+    for section in sections:
+        checked_variants = []
+        for variant, member in _used_parts(section, "footers"):
+            if member not in verdicts:
+                verdicts[member] = needle in part_text(docx_path, member).lower()
+            checked_variants.append(VARIANT_LABELS[variant])
+            if verdicts[member]:
+                break  # ✅ This section has a matching footer
+        else:
+            failing.append((section["section"], checked_variants))
+            continue
+        if not every_section:
+            return True, [], len(verdicts)  # ✅ Early exit at the first matching footer
+    return bool(sections) and not failing, failing, len(verdicts)
@@ -0,0 +1,65 @@
+import fnmatch
+import hashlib
+
+from .archive import get_archive
+
+
+def part_fingerprints(archive_path):
+    """Returns {member name: (CRC-32, uncompressed size)} read from the zip central directory only."""
+    return {info.filename: (info.CRC, info.file_size) for info in get_archive(archive_path).infolist()}
+
+
+def diff_parts(previous, current):
+    """Returns the set of members that were added, removed or changed between two fingerprint maps."""
+    return {name for name in previous.keys() | current.keys() if previous.get(name) != current.get(name)}
+
+
+def inputs_fingerprint(*values):
+    """Hashes the non-document inputs (config, selected release row) that every rule depends on."""
+    return hashlib.sha1(repr(values).encode("utf-8")).hexdigest()
+
+
+def rule_is_affected(patterns, changed_parts):
+    """Checks whether any changed member matches one of the rule's part patterns (fnmatch style)."""
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns for name in changed_parts)
+
+
+def run_incremental(archive_path, rules, rule_parts, cache, inputs_key=None, run_rules=None):
+    """
+    Runs only the rules whose document parts changed since the previous run and reuses cached results for the rest.
+
+    :param archive_path: Path to the uploaded .docx/.pptx archive.
+    :param rules: Ordered dict of result name -> zero-argument callable producing that result.
+    :param rule_parts: Dict of result name -> list of zip member patterns the rule reads.
+    :param cache: Mutable dict kept between runs (e.g. an entry in st.session_state).
+    :param inputs_key: Fingerprint of config/selection; a different key invalidates every cached result.
+    :param run_rules: Optional callable taking the dict of rules to re-run and returning their results
+                      (e.g. a parallel scheduler). Defaults to running them one after another.
+    :return: Dict of result name -> result, in the order of `rules`.
+    """
+    fingerprints = part_fingerprints(archive_path)
+    previous_results = cache.get("results", {})
+
+    # ✅ First run or changed config/selection: nothing can be reused
+    if not previous_results or cache.get("inputs_key") != inputs_key:
+        changed_parts = None
+    else:
+        changed_parts = diff_parts(cache.get("fingerprints", {}), fingerprints)
+
+    rerun = [
+        name for name in rules
+        if changed_parts is None
+        or name not in previous_results
+        or name not in rule_parts  # Rules without declared parts always re-run
+        or rule_is_affected(rule_parts[name], changed_parts)
+    ]
+    to_run = {name: rules[name] for name in rerun}
+    fresh_results = run_rules(to_run) if run_rules else {name: rule() for name, rule in to_run.items()}
+
+    results = {name: fresh_results[name] if name in fresh_results else previous_results[name] for name in rules}
+
+    cache["fingerprints"] = fingerprints
+    cache["inputs_key"] = inputs_key
+    cache["results"] = results
+    cache["last_rerun"] = rerun
+    return results
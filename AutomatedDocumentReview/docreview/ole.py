@@ -0,0 +1,266 @@
+"""
+In-memory reader for OLE compound files (the oleObject*.bin embeddings in decks).
+
+Only the structures needed to locate and stream one stream are parsed: header,
+FAT, mini FAT and directory. Workbooks are recognised in the three forms Office
+embeds them: a BIFF "Workbook"/"Book" stream (.xls), a "Package" stream holding
+an .xlsx, and an "\\x01Ole10Native" packager stream wrapping either of those.
+Nothing is written to disk.
+"""
+import io
+import struct
+
+OLE_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+ZIP_SIGNATURE = b"PK\x03\x04"
+
+_HEADER = struct.Struct("<8s16x5H6x9L")  # Fields up to and including the DIFAT counters
+_DIR_ENTRY = struct.Struct("<64sHBB3L16xL16xLQ")  # name, name length, type, colour, left, right, child, state, start, size
+
+FREE_SECTOR = 0xFFFFFFFF
+END_OF_CHAIN = 0xFFFFFFFE
+NO_STREAM = 0xFFFFFFFF
+STORAGE, STREAM, ROOT = 1, 2, 5
+
+PROBE_MAX_ROWS = 200  # Rows read per sheet when probing an embedded workbook
+
+
+class OleError(ValueError):
+    """Raised for data that is not a readable compound file."""
+
+
+class CellGrid(dict):
+    """Sheet cells keyed by reference ("A2"); missing cells read as None, like empty worksheet cells."""
+
+    def __missing__(self, key):
+        return None
+
+
+class OleFile:
+    """Compound file over bytes or a memoryview; streams are served sector by sector without copying the file."""
+
+    def __init__(self, data):
+        self._data = memoryview(data).cast("B")
+        if len(self._data) < 512 or bytes(self._data[:8]) != OLE_SIGNATURE:
+            raise OleError("Not an OLE compound file")
+
+        (_, _, major, _, sector_shift, mini_shift, _, fat_sectors, dir_start, _,
+         self._mini_cutoff, mini_fat_start, mini_fat_sectors, difat_start, difat_sectors) = _HEADER.unpack_from(self._data)
+        self._sector_size = 1 << sector_shift
+        self._mini_size = 1 << mini_shift
+        self._major = major
+
+        self._fat = self._read_fat(fat_sectors, difat_start, difat_sectors)
+        self._entries = self._read_directory(dir_start)
+        root = self._entries[0]
+        self._mini_stream = b"".join(self._chain_chunks(root["start"], root["size"])) if root["size"] else b""
+        self._mini_fat = self._read_table(mini_fat_start) if mini_fat_sectors else []
+        self._paths = self._build_paths()
+
+    # Sector plumbing
+    def _sector(self, sector_id):
+        offset = (sector_id + 1) * self._sector_size
+        if offset + self._sector_size > len(self._data):
+            raise OleError(f"Sector {sector_id} lies outside the file")
+        return self._data[offset:offset + self._sector_size]
+
+    def _ints(self, sector_id):
+        return struct.unpack_from(f"<{self._sector_size // 4}L", self._sector(sector_id))
+
+    def _read_fat(self, fat_sectors, difat_start, difat_sectors):
+        fat_ids = list(struct.unpack_from("<109L", self._data, 76))
+        sector_id = difat_start
+        for _ in range(difat_sectors):
+            if sector_id in (END_OF_CHAIN, FREE_SECTOR):
+                break
+            ids = self._ints(sector_id)
+            fat_ids.extend(ids[:-1])
+            sector_id = ids[-1]
+
+        fat = []
+        for fat_id in fat_ids[:fat_sectors]:
+            if fat_id != FREE_SECTOR:
+                fat.extend(self._ints(fat_id))
+        return fat
+
+    def _chain(self, start, table):
+        """Sector ids of a chain; stops on a loop or an out-of-range id instead of spinning."""
+        sector_id, steps = start, 0
+        while sector_id not in (END_OF_CHAIN, FREE_SECTOR):
+            if sector_id >= len(table) or steps > len(table):
+                raise OleError("Corrupt sector chain")
+            yield sector_id
+            sector_id = table[sector_id]
+            steps += 1
+
+    def _chain_chunks(self, start, size):
+        remaining = size
+        for sector_id in self._chain(start, self._fat):
+            chunk = self._sector(sector_id)[:remaining]
+            remaining -= len(chunk)
+            yield chunk
+            if remaining <= 0:
+                break
+
+    def _read_table(self, start):
+        table = []
+        for sector_id in self._chain(start, self._fat):
+            table.extend(self._ints(sector_id))
+        return table
+
+    def _read_directory(self, start):
+        entries = []
+        for sector_id in self._chain(start, self._fat):
+            sector = self._sector(sector_id)
+            for offset in range(0, self._sector_size, _DIR_ENTRY.size):
+                name, name_length, entry_type, _, left, right, child, _, start_sector, size = _DIR_ENTRY.unpack_from(sector, offset)
+                if self._major == 3:
+                    size &= 0xFFFFFFFF  # Version 3 files only define the low 32 bits
+                entries.append({
+                    "name": name[:max(name_length - 2, 0)].decode("utf-16-le", "replace"),
+                    "type": entry_type, "left": left, "right": right, "child": child,
+                    "start": start_sector, "size": size,
+                })
+        if not entries or entries[0]["type"] != ROOT:
+            raise OleError("Missing root directory entry")
+        return entries
+
+    def _build_paths(self):
+        """Maps "Storage/Stream" paths to directory entries by walking each storage's sibling tree."""
+        paths = {}
+        pending = [(self._entries[0]["child"], "")]
+        seen = set()
+        while pending:
+            index, prefix = pending.pop()
+            if index == NO_STREAM or index >= len(self._entries) or index in seen:
+                continue
+            seen.add(index)
+            entry = self._entries[index]
+            path = prefix + entry["name"]
+            pending.extend([(entry["left"], prefix), (entry["right"], prefix)])
+            if entry["type"] == STREAM:
+                paths[path] = entry
+            elif entry["type"] == STORAGE:
+                pending.append((entry["child"], path + "/"))
+        return paths
+
+    # Public API
+    def listdir(self):
+        """Stream paths, e.g. ["Workbook", "\\x05SummaryInformation", "ObjectPool/_1234/Package"]."""
+        return sorted(self._paths)
+
+    def exists(self, path):
+        return path in self._paths
+
+    def iter_stream(self, path):
+        """Yields the stream's bytes one sector at a time."""
+        entry = self._paths[path]
+        if entry["size"] >= self._mini_cutoff:
+            yield from (bytes(chunk) for chunk in self._chain_chunks(entry["start"], entry["size"]))
+            return
+
+        remaining = entry["size"]
+        for sector_id in self._chain(entry["start"], self._mini_fat):
+            offset = sector_id * self._mini_size
+            chunk = self._mini_stream[offset:offset + min(self._mini_size, remaining)]
+            remaining -= len(chunk)
+            yield chunk
+            if remaining <= 0:
+                break
+
+    def read_stream(self, path):
+        return b"".join(self.iter_stream(path))
+
+
+def _ole10_native_payload(data):
+    """Unwraps the file stored in an "\\x01Ole10Native" packager stream."""
+    try:
+        position = 6  # Total size (4) + type (2)
+        for _ in range(2):  # Label and original path, both NUL-terminated
+            position = data.index(b"\x00", position) + 1
+        position += 4  # Reserved
+        (temp_path_length,) = struct.unpack_from("<L", data, position)
+        position += 4 + temp_path_length
+        (payload_size,) = struct.unpack_from("<L", data, position)
+        position += 4
+    except (ValueError, struct.error):
+        return None
+    return data[position:position + payload_size]
+
+
+def find_embedded_workbook(data):
+    """
+    Locates a workbook inside an embedded object.
+
+    :return: ("xlsx", zip bytes), ("xls", BIFF workbook stream bytes) or (None, None).
+    """
+    if data[:4] == ZIP_SIGNATURE:
+        return "xlsx", data
+    try:
+        ole = OleFile(data)
+    except OleError:
+        return None, None
+
+    streams = {path.rsplit("/", 1)[-1]: path for path in ole.listdir()}
+    for name in ("Workbook", "Book"):
+        if name in streams:
+            return "xls", ole.read_stream(streams[name])
+    if "Package" in streams:
+        package = ole.read_stream(streams["Package"])
+        if package[:4] == ZIP_SIGNATURE:
+            return "xlsx", package
+    if "\x01Ole10Native" in streams:
+        payload = _ole10_native_payload(ole.read_stream(streams["\x01Ole10Native"]))
+        if payload and (payload[:4] == ZIP_SIGNATURE or payload[:8] == OLE_SIGNATURE):
+            return find_embedded_workbook(payload)
+    return None, None
+
+
+def _column_letter(index):
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def probe_workbook_cells(kind, payload, max_rows=PROBE_MAX_ROWS):
+    """
+    Reads the first `max_rows` rows of every sheet into {sheet name: CellGrid}.
+
+    .xls streams need the optional xlrd package; without it the sheets are not probed (None).
+    """
+    sheets = {}
+    if kind == "xlsx":
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(io.BytesIO(payload), read_only=True, data_only=True)
+        try:
+            for worksheet in workbook.worksheets:
+                grid = CellGrid()
+                for row_index, row in enumerate(worksheet.iter_rows(max_row=max_rows, values_only=True), 1):
+                    for column_index, value in enumerate(row):
+                        if value is not None:
+                            grid[f"{_column_letter(column_index)}{row_index}"] = value
+                sheets[worksheet.title] = grid
+        finally:
+            workbook.close()
+        return sheets
+
+    if kind == "xls":
+        try:
+            import xlrd
+        except ImportError:
+            return None
+        # xlrd reads a bare BIFF stream when the data is not itself a compound file
+        book = xlrd.open_workbook(file_contents=payload, on_demand=True)
+        for sheet in book.sheets():
+            grid = CellGrid()
+            for row_index in range(min(sheet.nrows, max_rows)):
+                for column_index, value in enumerate(sheet.row_values(row_index)):
+                    if value not in ("", None):
+                        grid[f"{_column_letter(column_index)}{row_index + 1}"] = value
+            sheets[sheet.name] = grid
+        return sheets
+
+    return None
@@ -0,0 +1,142 @@
+"""
+Local mock of the Performance Center REST endpoints used by docreview.perfcenter.
+
+Serves a deterministic project of `run_count` runs spread over `test_count` tests:
+
+    GET .../Runs                      all runs (ID, TestID); paged with ?page-size=&start-index= (1-based)
+    GET .../Runs/{id}/Extended        StartTime / EndTime of one run
+    GET .../tests?query={ID[{id}]}    Name of one test
+
+    python -m docreview.pcmock --runs 5000 --port 8765
+    python -m docreview.perfcenter --base-url http://localhost:8765
+"""
+import argparse
+import re
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from urllib.parse import parse_qs, unquote, urlsplit
+
+NAMESPACE = "http://www.hp.com/PC/REST/API"
+FIRST_RUN_ID = 15001
+FIRST_TEST_ID = 14000
+TEST_NAMES = ["load_test", "endurance_test", "stress_test", "spike_test", "e2e_test"]
+RUN_START = datetime(2025, 3, 10, 8, 0, 0)
+
+
+class MockProject:
+    """Generates run and test records on demand so large projects cost no memory up front."""
+
+    def __init__(self, run_count=1000, test_count=50, malformed_runs=()):
+        self.run_count = run_count
+        self.test_count = test_count
+        self.malformed_runs = list(malformed_runs)  # Extra listed runs as (ID text or None, TestID text or None)
+
+    def test_id(self, run_id):
+        return FIRST_TEST_ID + (run_id - FIRST_RUN_ID) % self.test_count
+
+    def has_run(self, run_id):
+        return FIRST_RUN_ID <= run_id < FIRST_RUN_ID + self.run_count
+
+    def has_test(self, test_id):
+        return FIRST_TEST_ID <= test_id < FIRST_TEST_ID + self.test_count
+
+    def listed_runs(self):
+        for run_id in range(FIRST_RUN_ID, FIRST_RUN_ID + self.run_count):
+            yield str(run_id), str(self.test_id(run_id))
+        yield from self.malformed_runs
+
+    def runs_xml(self, start_index=1, page_size=None):
+        """One page of the run listing (all runs when `page_size` is None)."""
+        end = None if page_size is None else start_index - 1 + page_size
+        runs = "".join(
+            "<Run>" + (f"<TestID>{test_id}</TestID>" if test_id is not None else "")
+            + (f"<ID>{run_id}</ID>" if run_id is not None else "") + "</Run>"
+            for run_id, test_id in islice(self.listed_runs(), start_index - 1, end)
+        )
+        return f'<Runs xmlns="{NAMESPACE}">{runs}</Runs>'
+
+    def run_xml(self, run_id):
+        start = RUN_START + timedelta(hours=(run_id - FIRST_RUN_ID) * 2)
+        end = start + timedelta(minutes=30 + run_id % 60)
+        return (
+            f'<Run xmlns="{NAMESPACE}"><ID>{run_id}</ID><TestID>{self.test_id(run_id)}</TestID>'
+            f"<StartTime>{start:%Y-%m-%d %H:%M:%S}</StartTime><EndTime>{end:%Y-%m-%d %H:%M:%S}</EndTime></Run>"
+        )
+
+    def test_xml(self, test_id):
+        name = f"{TEST_NAMES[test_id % len(TEST_NAMES)]}_{test_id}"
+        return f'<Tests xmlns="{NAMESPACE}"><Test><ID>{test_id}</ID><Name>{name}</Name></Test></Tests>'
+
+
+def make_handler(project, fail_every=0):
+    """
+    Builds a request handler for `project`.
+
+    :param fail_every: When > 0, every n-th request answers 503 so retry/backoff can be exercised.
+
+    The handler's `counter` holds the request count and the requested paths, for tests.
+    """
+    counter = {"requests": 0, "paths": []}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive, so pooled client connections are reused
+
+        def do_GET(self):
+            with lock:
+                counter["requests"] += 1
+                counter["paths"].append(self.path)
+                failing = fail_every and counter["requests"] % fail_every == 0
+            if failing:
+                return self._send(503, "<Error>Temporarily unavailable</Error>")
+
+            path = unquote(self.path)
+            url = urlsplit(path)
+            if re.search(r"/Runs/?$", url.path):
+                query = parse_qs(url.query)
+                page_size = int(query["page-size"][0]) if "page-size" in query else None
+                return self._send(200, project.runs_xml(int(query.get("start-index", ["1"])[0]), page_size))
+            match = re.search(r"/Runs/(\d+)/Extended$", path)
+            if match and project.has_run(int(match.group(1))):
+                return self._send(200, project.run_xml(int(match.group(1))))
+            match = re.search(r"/tests\?query=\{ID\[(\d+)\]\}$", path)
+            if match and project.has_test(int(match.group(1))):
+                return self._send(200, project.test_xml(int(match.group(1))))
+            return self._send(404, "<Error>Not found</Error>")
+
+        def _send(self, status, body):
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/xml")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass  # Thousands of requests per ingestion; keep the console quiet
+
+    Handler.counter = counter
+    return Handler
+
+
+def start_mock_server(run_count=1000, test_count=50, port=0, fail_every=0, malformed_runs=()):
+    """Starts the mock server on a background thread. Returns (server, base URL); call server.shutdown() when done."""
+    project = MockProject(run_count, test_count, malformed_runs)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(project, fail_every))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a mock Performance Center project.")
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--tests", type=int, default=50)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fail-every", type=int, default=0)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(MockProject(args.runs, args.tests), args.fail_every))
+    print(f"✅ Mock Performance Center with {args.runs} runs at http://127.0.0.1:{args.port}")
+    server.serve_forever()
@@ -0,0 +1,157 @@
+"""
+Performance Center (LoadRunner Enterprise) run-metadata ingestion.
+
+Runs are listed page by page, then each run's start/end time (Runs/{id}/Extended) and
+its test's name (tests?query={ID[...]}) are fetched on a bounded thread pool
+sharing one pooled, retrying HTTP session. Test names are fetched once per
+test, not once per run. Results are upserted into SQLite in one executemany
+transaction into the run store (docreview.rundb).
+
+    python -m docreview.perfcenter --base-url http://localhost:8765 --domain TRUST --project Perf
+
+See docreview/pcmock.py for a local mock server.
+"""
+import argparse
+import os
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .rundb import RUNS_DB, save_runs
+from .telemetry import get_logger
+
+PC_BASE_URL = os.environ.get("PC_BASE_URL", "http://localhost:8765")
+PC_DOMAIN = os.environ.get("PC_DOMAIN", "TRUST")
+PC_PROJECT = os.environ.get("PC_PROJECT", "TRUST_PerformanceTestProjects")
+PC_TOKEN = os.environ.get("PC_TOKEN")
+
+MAX_CONCURRENCY = 16  # Requests in flight (and pooled connections kept open)
+REQUEST_TIMEOUT = (5, 30)  # Connect, read seconds
+RETRIES = 3
+BACKOFF_FACTOR = 0.5  # 0.5s, 1s, 2s between retries
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RUNS_PAGE_SIZE = 500  # Runs listed per request
+
+logger = get_logger(__name__)
+
+
+def create_session(token=PC_TOKEN, max_concurrency=MAX_CONCURRENCY):
+    """One keep-alive session whose pool matches the worker count, retrying transient failures with backoff."""
+    session = requests.Session()
+    retry = Retry(
+        total=RETRIES, backoff_factor=BACKOFF_FACTOR, status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["GET"]), respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=max_concurrency, pool_maxsize=max_concurrency, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Accept"] = "application/xml"
+    if token:
+        session.headers["Authorization"] = f"Bearer {token}"
+    return session
+
+
+class PerformanceCenterClient:
+    """Thin wrapper over the project-scoped REST endpoints used for run metadata."""
+
+    def __init__(self, base_url=PC_BASE_URL, domain=PC_DOMAIN, project=PC_PROJECT, session=None):
+        self.api_url = f"{base_url.rstrip('/')}/LoadTest/rest/domains/{domain}/projects/{project}"
+        self.session = session or create_session()
+
+    def _get_xml(self, path):
+        response = self.session.get(f"{self.api_url}/{path}", timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return ET.fromstring(response.content)
+
+    def list_runs(self, page_size=RUNS_PAGE_SIZE):
+        """Returns [(run ID, test ID)] for every run in the project, requesting `page_size` runs at a time."""
+        runs = []
+        while True:
+            root = self._get_xml(f"Runs?page-size={page_size}&start-index={len(runs) + 1}")
+            page = [(run.findtext("{*}ID"), run.findtext("{*}TestID")) for run in root.findall(".//{*}Run")]
+            if runs and page[:1] == runs[:1]:
+                return runs  # Server ignores paging and already sent every run
+            runs.extend(page)
+            if len(page) < page_size or len(page) > page_size:
+                return runs  # Last page (or a server without paging returning everything at once)
+
+    def run_times(self, run_id):
+        root = self._get_xml(f"Runs/{run_id}/Extended")
+        return root.findtext(".//{*}StartTime"), root.findtext(".//{*}EndTime")
+
+    def test_name(self, test_id):
+        root = self._get_xml(f"tests?query={{ID[{test_id}]}}")
+        return root.findtext(".//{*}Name")
+
+
+def _safe(fetch, *args):
+    """Returns (value, error) so one failing request doesn't abort the whole batch."""
+    try:
+        return fetch(*args), None
+    except (requests.RequestException, ET.ParseError) as e:
+        return None, f"{fetch.__name__}({', '.join(map(str, args))}): {e}"
+
+
+def _as_id(value):
+    """Integer ID from a listing field, or None when it is missing or not a number."""
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def ingest_runs(client=None, runs=None, db_path=RUNS_DB, max_concurrency=MAX_CONCURRENCY):
+    """
+    Fetches run times and test names concurrently and upserts them.
+
+    Runs listed without a numeric ID are skipped (and reported in "errors") instead of
+    aborting the ingestion; a non-numeric test ID is stored as unknown.
+
+    :param runs: [(run ID, test ID)]; all runs of the project when None.
+    :return: Dict with "runs" (rows saved) and "errors" (skipped runs and failed requests, after retries).
+    """
+    client = client or PerformanceCenterClient()
+    listed = client.list_runs() if runs is None else list(runs)
+    runs, skipped = [], []
+    for run_id, test_id in listed:
+        if _as_id(run_id) is None:
+            logger.warning("skipping run with invalid ID %r (test %r)", run_id, test_id)
+            skipped.append(f"Skipped run with invalid ID {run_id!r} (test {test_id!r})")
+            continue
+        runs.append((_as_id(run_id), _as_id(test_id)))
+    test_ids = sorted({test_id for _, test_id in runs if test_id is not None})
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        names = dict(zip(test_ids, pool.map(lambda test_id: _safe(client.test_name, test_id), test_ids)))
+        times = list(pool.map(lambda run: _safe(client.run_times, run[0]), runs))
+
+    rows, errors = [], list(skipped)
+    for (run_id, test_id), (run_times, time_error) in zip(runs, times):
+        name, name_error = names.get(test_id, (None, None))
+        errors.extend(error for error in (time_error, name_error) if error)
+        start_time, end_time = run_times or (None, None)
+        rows.append((run_id, test_id, name, start_time, end_time))
+
+    save_runs(rows, db_path)
+    return {"runs": len(rows), "errors": sorted(set(errors))}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ingest Performance Center run metadata into SQLite.")
+    parser.add_argument("--base-url", default=PC_BASE_URL)
+    parser.add_argument("--domain", default=PC_DOMAIN)
+    parser.add_argument("--project", default=PC_PROJECT)
+    parser.add_argument("--db", default=RUNS_DB)
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY)
+    args = parser.parse_args()
+
+    summary = ingest_runs(
+        PerformanceCenterClient(args.base_url, args.domain, args.project, create_session(max_concurrency=args.concurrency)),
+        db_path=args.db, max_concurrency=args.concurrency,
+    )
+    print(f"✅ Saved {summary['runs']} run(s) to {args.db}")
+    for error in summary["errors"]:
+        print(f"⚠️ {error}")
@@ -0,0 +1,569 @@
+"""PowerPoint (.pptx) extraction and validation used by the PPT Review page."""
+import os
+import re
+import time
+
+import pandas as pd
+
+from .archive import get_archive, shared_archive
+from .doccache import cached_extraction, save_document_cache
+from .export import export_report
+from .incremental import run_incremental, inputs_fingerprint
+from .ole import find_embedded_workbook, probe_workbook_cells
+from .preflight import inspect_archive
+from .relationships import load_relationships
+from .releases import catalog_version, compare_release_field
+from .rules import load_rule_plan, execute_plan, plan_members
+from .rundb import RUNS_DB, match_executions, runs_available
+from .telemetry import get_logger, record_validation, timed_stage
+from .xmlparts import parse_part
+
+# SAMPLE_RELEASES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'SampleReleases.xlsx')
+# Define the path for the config file (assumes it's in a "config" folder next to the script)
+CONFIG_FOLDER = os.path.join(os.getcwd(), "config")
+CONFIG_FILE = os.path.join(CONFIG_FOLDER, "config.xlsx")
+SHEET_NAME = "performance_testing_strategy"  # Assuming a single sheet for all word documents
+SAMPLE_RELEASES_FILE = os.path.join(CONFIG_FOLDER,'SampleReleases.xlsx')
+RULES_SHEET_NAME = "ppt_rules"  # Optional sheet of declarative rules (see docreview/rules.py)
+temp_dir = os.path.join(os.getcwd(), "temp")  # Create 'temp' folder path
+
+logger = get_logger(__name__)
+
+
+# Extract text from named shapes in a slide
+@cached_extraction
+def extract_named_shapes(zip_path, slide_number):
+    shape_texts = {}
+    slide_file = f"ppt/slides/slide{slide_number}.xml"
+
+    with shared_archive(zip_path) as pptx_zip:
+        if slide_file in pptx_zip.namelist():
+            root = parse_part(zip_path, slide_file)  # ✅ One parse shared with extract_tables_from_slide
+            ns = {"p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+                  "a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
+
+            for sp in root.findall(".//p:sp", namespaces=ns):
+                name_elem = sp.find(".//p:nvSpPr/p:cNvPr", namespaces=ns)
+                if name_elem is not None and "name" in name_elem.attrib:
+                    shape_name = name_elem.attrib["name"]
+                    text_elem = sp.findall(".//a:t", namespaces=ns)
+                    text_content = " ".join([t.text for t in text_elem if t.text])
+                    shape_texts[shape_name] = text_content
+
+    return shape_texts
+
+# Check if embedded Excel files exist
+def check_embedded_excel(zip_path):
+    with shared_archive(zip_path) as pptx_zip:
+        return any(f.startswith("ppt/embeddings/") and f.endswith(".xlsx") for f in pptx_zip.namelist())
+
+
+@cached_extraction
+def extract_tables_from_slide(zip_path, slide_number):
+    """
+    Extracts tables from a given slide in the PowerPoint (.pptx) file.
+
+    Args:
+        zip_path (str): Path to the PPTX file (as a zip archive).
+        slide_number (int): The slide number to extract tables from.
+
+    Returns:
+        list: A list of tables, where each table is a list of rows, and each row is a list of cell values.
+    """
+    tables = []
+    
+    slide_path = f"ppt/slides/slide{slide_number}.xml"  # Locate the slide XML file
+    
+    with shared_archive(zip_path) as pptx:
+        if slide_path not in pptx.namelist():
+            return tables  # If slide XML is missing, return an empty list
+        
+        root = parse_part(zip_path, slide_path)  # Large slides are decompressed in chunks while parsing
+
+        # Define namespaces to search for table elements
+        ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+              'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'}
+
+        # Find all tables in the slide
+        for table in root.findall(".//a:tbl", ns):
+            extracted_table = []
+            
+            # Find all rows in the table
+            for row in table.findall(".//a:tr", ns):
+                extracted_row = []
+                
+                # Find all cells in the row
+                for cell in row.findall(".//a:tc", ns):
+                    # Extract text from each cell
+                    text_elem = cell.find(".//a:t", ns)
+                    extracted_row.append(text_elem.text.strip() if text_elem is not None else "")
+                
+                extracted_table.append(extracted_row)  # Add row to table
+            
+            tables.append(extracted_table)  # Add table to list of tables
+    
+    return tables
+
+def extract_embedded_files(zip_path, slide_number, output_dir="embedded_files"):
+    """
+    Extracts embedded files (Excel, CSV, etc.) from a specific slide in a PowerPoint file.
+
+    :param zip_path: Path to the PPTX zip archive.
+    :param slide_number: The slide number to check for embedded files.
+    :param output_dir: Directory to store extracted files.
+    :return: List of extracted file paths.
+    """
+    extracted_files = []
+    os.makedirs(output_dir, exist_ok=True)  # Ensure directory exists
+
+    with shared_archive(zip_path) as pptx_zip:
+        # Extract ALL embedded files from ppt/embeddings/
+        for file_name in pptx_zip.namelist():
+            if file_name.startswith("ppt/embeddings/"):  # Could be .xlsx, .csv, .bin
+                if file_name.lower().endswith(".bin"):
+                    continue  # OLE objects are inspected in memory (see inspect_ole_embeddings), never written out
+                extracted_path = os.path.join(output_dir, os.path.basename(file_name))
+                with pptx_zip.open(file_name) as source, open(extracted_path, "wb") as target:
+                    target.write(source.read())
+                extracted_files.append(extracted_path.lower().strip())
+
+        # Check slide-specific relationships for embedded files
+        slide_rels_path = f"ppt/slides/_rels/slide{slide_number}.xml.rels"
+        slide_embedded_files = []
+
+        if slide_rels_path in pptx_zip.namelist():
+            with pptx_zip.open(slide_rels_path) as rels_file:
+                rels_content = rels_file.read().decode("utf-8")
+
+                # Find all embedded references (may be .xlsx, .bin, .csv)
+                embedded_refs = re.findall(r'Target="(../embeddings/[^"]+)"', rels_content)
+                for ref in embedded_refs:
+                    embedded_filename = os.path.basename(ref)
+                    matched_file = os.path.normpath(os.path.join(output_dir, embedded_filename)).lower().strip()  # ✅ Normalize path
+
+                    # print(f"🔍 Checking Embedded File: {embedded_filename}")  
+                    # print(f"➡ Matched Path: {matched_file}")  
+                    # print(f"✅ Extracted Files: {extracted_files}")  
+
+                    # Compare after ensuring lowercase + consistent path format
+                    if matched_file in extracted_files:
+                        # print("✅ Match Found! Adding to results.")  
+                        slide_embedded_files.append(matched_file)
+
+    # print(slide_embedded_files)
+    return slide_embedded_files if slide_embedded_files else extracted_files
+
+def slide_embedding_members(zip_path, slide_number):
+    """Archive members of the objects embedded on one slide, resolved from the slide's relationships."""
+    return load_relationships(zip_path).embeddings(f"ppt/slides/slide{slide_number}.xml")
+
+
+@cached_extraction
+def inspect_ole_embeddings(zip_path):
+    """
+    Finds workbooks wrapped inside oleObject*.bin embeddings, reading each object in memory.
+
+    :return: Dict of member name -> {"kind": "xlsx" | "xls", "sheets": {sheet: cells} or None}
+             (None when the .xls reader is not installed). Objects without a workbook are omitted.
+    """
+    archive = get_archive(zip_path)
+    workbooks = {}
+    for member in archive.namelist():
+        if not (member.startswith("ppt/embeddings/") and member.lower().endswith(".bin")):
+            continue
+        kind, payload = find_embedded_workbook(archive.read_view(member))
+        if kind is None:
+            continue
+        try:
+            sheets = probe_workbook_cells(kind, payload)
+        except Exception as e:
+            logger.warning("could not read the workbook inside %s: %s", member, e)
+            sheets = None
+        workbooks[member] = {"kind": kind, "sheets": sheets}
+    return workbooks
+
+
+def load_ole_workbook(zip_path):
+    """Cells of the first workbook found inside an OLE embedding, as {sheet: cells}; used by the rule engine."""
+    for workbook in inspect_ole_embeddings(zip_path).values():
+        if workbook["sheets"]:
+            return workbook["sheets"]
+    return None
+
+
+@cached_extraction
+def get_total_slides(pptx_path):
+    """Extracts the total number of slides from a PowerPoint file."""
+    with shared_archive(pptx_path) as pptx_zip:
+        slide_files = [f for f in pptx_zip.namelist() if f.startswith("ppt/slides/slide") and f.endswith(".xml")]
+        return len(slide_files)
+    
+
+# Function to get a slide's display name based on its extracted title
+def get_slide_display_name(slide_number, slide_shapes):
+    """Extract slide title and format slide name dynamically"""
+    default_names = {1: "Title Page", 2: "Observations Slide"}  # Custom names for Slide 1 & 2
+    extracted_title = slide_shapes.get("Title", "").strip()  # Extract the title text
+
+    if slide_number in default_names:
+        return f"Slide {slide_number} - {default_names[slide_number]}"
+    elif extracted_title:
+        return f"Slide {slide_number} - {extracted_title}"  # Use extracted title
+    else:
+        return f"Slide {slide_number}"  # Default fallback if no title
+    
+
+def normalize_text(text):
+    if text is None:
+        return ""
+    text = str(text).strip()  # Convert to lowercase & strip spaces
+    text = re.sub(r"\s*[\-–—]\s*", "-", text)  # Replace different dashes with a standard hyphen
+    text = re.sub(r"\s+", " ", text)  # Normalize spaces
+    return text
+
+# Validate Slide 1 project details against selected row
+@cached_extraction
+def extract_slide1_project_details(zip_path):
+    """Extracts the release fields written in Slide 1's "Slide1ProjectDetails" shape."""
+    # Extract named shapes from Slide 1
+    slide1_shapes = extract_named_shapes(zip_path, 1)
+
+    # 🔹 Extract entire Project Details text block
+    project_details_text = slide1_shapes.get("Slide1ProjectDetails", "").strip()
+
+    # print("project_details_text: " + project_details_text)
+
+    # print("Normalized project_details_text:", repr(project_details_text))
+
+    required_fields = ["Enterprise Release ID", "Project Name", "Release", "Application ID", "Application Name", "Project ID"]  # Can be modified anytime
+
+    patterns = {
+    "Project Name": r"project\s*name\s*[:\-–]?\s*([\w\s\(\)\[\]\-–\.]+?)(?=\s*\b(release|project id|enterprise|application name|application id)\b|$)",
+    "Release": r"release\s*[:\-–]?\s*([\w\.\-]+)(?=\s*\b(project|application name|application id|enterprise release id|$)\b)",
+    "Project ID": r"project\s*id\s*[:\-–]?\s*([\w\-]+)(?=\s*\b(enterprise|application name|application id)\b|$)",
+    "Enterprise Release ID": r"enterprise\s+release\s+id\s*[:\-–]?\s*([\w\.\-\s]+)(?=\s*\b(application|application id)\b|$)",
+    "Application Name": r"application\s*name\s*[:\-–]?\s*([\w\d\s\(\)\[\]\-–]+?)(?=\s*\b(application id)\b|$)",
+    "Application ID": r"application id\s*[:\-–]?\s*(?:app-?id-?)?([\w\d\-]+)\b"
+    # "Application ID": r"application id\s*[:\-–]?\s*app-?([\w\d\-]+)"
+}   
+    extracted_values = {}
+    for key, pattern in patterns.items():
+        match = re.search(pattern, project_details_text, re.IGNORECASE)
+        if match:
+            extracted_values[key] = normalize_text(match.group(1).strip())
+    return extracted_values
+
+
+def validate_slide1(zip_path, checklist_row):
+    required_fields = ["Enterprise Release ID", "Project Name", "Release", "Application ID", "Application Name", "Project ID"]  # Can be modified anytime
+    extracted_values = extract_slide1_project_details(zip_path)
+
+    # print(extracted_values)
+    # 🔹 Compare extracted values with expected values from checklist
+    slide1_results = {}
+    for key, expected_value in checklist_row.items():
+        # print(key)
+        if key not in required_fields:
+            continue  # Skip fields that are not required
+        expected_value = normalize_text(str(expected_value).strip())
+        # print ("expected:" + expected_value)
+        # print (extracted_values)
+        extracted_value = extracted_values.get(key, None)
+
+        if extracted_value is None:
+            slide1_results[key] = f"🚫 Missing (Expected: {expected_value})"
+        elif key == "Application ID":  # Special handling for Application ID (removing "APP-")
+            if extracted_value == expected_value.replace("APP-", ""):
+                slide1_results[key] = "✅ Matched"
+            else:
+                slide1_results[key] = f"❌ Not Matched (Expected: {expected_value}, Found: APP-{extracted_value})"
+        else:
+            # ✅ Names tolerate small typos (reported as close matches); IDs must match exactly after normalization.
+            # A near miss that names another catalog value at least as closely fails instead.
+            status, _, other = compare_release_field(key, extracted_value, expected_value)
+            if status == "✅ Matched":
+                slide1_results[key] = status
+            else:
+                hint = f"; closest catalog value: {other[0]}" if other else ""
+                slide1_results[key] = f"{status} (Expected: {expected_value}, Found: {extracted_value}{hint})"
+
+    return slide1_results
+
+
+# Validate Slide 2 title, summary, execution table and embedded workbook
+def validate_slide2(zip_path, checklist_row):
+    slide2_shapes = extract_named_shapes(zip_path, 2)
+    slide2_tables = extract_tables_from_slide(zip_path, 2)
+    embedded_files = extract_embedded_files(zip_path, 2)
+
+    # Fetch Project ID & Release ID from checklist
+    project_name = checklist_row.get("Project Name", "").strip().lower()
+    release_id = checklist_row.get("Enterprise Release ID", "").strip().lower()
+
+    # ✅ Validate Slide2Title (Check if Project ID is present)
+    # ✅ Extract Slide 2 Title & Convert to Lowercase
+    slide2_title_text = normalize_text(slide2_shapes.get("Slide2Header", "").strip().lower())
+    logger.debug("slide 2 title %r", slide2_title_text)
+    project_name_lower = normalize_text(project_name.lower().strip())  # Normalize for comparison
+    # print(project_name_lower)
+
+    # ✅ Use Regex to Find "Project Y" Anywhere in the Title
+    match = re.search(rf"\b{re.escape(project_name_lower)}\b", slide2_title_text, re.IGNORECASE)
+
+    # ✅ If Project Name is Found in the Title, It’s Valid
+    title_missing = match is None  # If match is None, it means Project Name was NOT found
+
+    # print("Extracted Project Name Found:", match.group(0) if match else "Not Found")
+    # print("Expected Project Name:", project_name_lower)
+    # print("Title Validation Result:", "✅ Valid" if not title_missing else "❌ Missing Project Name")
+
+
+    # ✅ Validate Slide2Summary (Check for both Project ID & Release ID)
+    # ✅ Validate Slide2Summary (Check for Project Name & Release ID in any order)
+    slide2_summary_text = normalize_text(slide2_shapes.get("Slide2Summary", "").strip().lower())
+    # print ("==========" + slide2_summary_text)
+    summary_missing = []
+
+    
+    # 🔹 Directly check for Release ID in text (from config)
+    release_pattern = normalize_text(re.escape(release_id.lower()))  # Escape special characters if any
+    # print ("93-------------------" + release_pattern)
+    release_match = re.search(fr"\b{release_pattern}\b", slide2_summary_text)
+    # print(slide2_summary_text)
+
+    # ✅ Validate Release ID presence
+    if release_match:
+        extracted_release_id = release_id  # Since it's an exact match
+    else:
+        summary_missing.append(f"Release ID '{release_id.upper()}' Not Found")
+
+    # print("*******"+ project_name)
+    # 🔹 Directly check for Project Name in text (from config)
+    project_pattern = re.escape(normalize_text(project_name.lower()))  # Escape special characters if any
+    project_match = re.search(fr"\b{project_pattern}\b", slide2_summary_text)
+
+    # ✅ Validate Project Name presence
+    if project_match:
+        extracted_project_name = project_name  # Since it's an exact match
+    else:
+        project_name = project_name.title();
+        summary_missing.append(f"Project Name '{project_name}' Not Found")
+
+    # 🔹 Debug information (only formatted when DOCREVIEW_LOG_LEVEL=DEBUG)
+    logger.debug("slide 2 release ID %r, project name %r, missing %s",
+                 release_id if release_match else None, project_name if project_match else None, summary_missing)
+
+    # ✅ Validate Table (Ensure at least one row contains "Load" or "Endurance" in first column)
+    table_valid = False
+    date_row_valid = False
+
+    for table in slide2_tables:
+        for row_index, row in enumerate(table):
+            if row_index == 0:
+                continue  # Skip header row
+
+            first_column_text = row[0].strip().lower() if row and row[0] else ""
+            second_column_text = str(row[1]).strip() if len(row) > 1 else ""
+            third_column_text = str(row[2]).strip() if len(row) > 2 else ""
+
+            # ✅ Condition 1: Check if first column contains "Load" or "Endurance"
+            if first_column_text.lower() in ["load test", "endurance test", "load", "endurance"]:
+                table_valid = True
+
+            date_row_valid = False  # 🔹 Reset before validation
+            # ✅ Condition 2: Ensure both second & third columns contain valid dates
+            if len(second_column_text)>0 and len(third_column_text)>0:
+                date_row_valid = True
+                # try:
+                #     datetime.strptime(second_column_text, "%d/%m/%Y")  # Adjust format as needed
+                #     datetime.strptime(third_column_text, "%d/%m/%Y")
+                #     date_row_valid = True
+                #     print("Dates are present")
+                # except ValueError:
+                #     date_row_valid = False  # If parsing fails, mark it invalid
+            # ✅ If both conditions met, exit loop early
+            if table_valid and date_row_valid:
+                break
+
+        if table_valid and date_row_valid:
+            break
+
+    # ✅ Final Validation Result with Detailed Messages
+    if table_valid and date_row_valid:
+        table_validation_result = "✅ Valid"
+    elif table_valid and not date_row_valid:
+        table_validation_result = "❌ Found the Test Type, however, dates are missing."
+    else:
+        table_validation_result = "❌ Test Type is missing. Please validate and correct the Execution Details table."
+
+
+    # ✅ Validate Embedded Excel File Presence (including workbooks wrapped in OLE .bin objects)
+    has_embedded_excel = any(file.lower().endswith((".xlsm", ".xlsx", ".xls", ".csv")) for file in embedded_files)
+    ole_workbooks = inspect_ole_embeddings(zip_path)
+    relationships = load_relationships(zip_path)
+    slide_ole_workbooks = [relationships.title(m) for m in slide_embedding_members(zip_path, 2) if m in ole_workbooks]
+    if has_embedded_excel:
+        embedded_excel_result = "✅ Found"
+    elif slide_ole_workbooks:
+        embedded_excel_result = f"✅ Found (workbook inside {', '.join(slide_ole_workbooks)})"
+    else:
+        embedded_excel_result = "❌ No Excel file found"
+
+    slide2_results = {
+        "Title Validation": "✅ Valid" if not title_missing else "❌ Missing or Incorrect Project Name",
+        "Summary Validation": "✅ Valid" if not summary_missing else f"❌  {', '.join(summary_missing)}",
+        "Table Validation": table_validation_result,
+        "Embedded Excel": embedded_excel_result,
+        # "Extracted Shapes": slide2_shapes
+    }
+
+    # ✅ Cross-check the execution table against ingested run timings (once runs have been ingested)
+    if runs_available():
+        slide2_results["Run Cross-check"] = cross_check_execution_table(slide2_tables)
+    return slide2_results
+
+
+def execution_columns(table):
+    """
+    (name, start, end) column indexes of an execution table, picked by header, or None.
+
+    Only tables whose header names the test ("Test Name"/"Scenario") and its start are
+    execution tables: column 0 of the standard Slide 2 table is the test type ("Load
+    Test", ...), which never matches a run name. The end column is optional (None).
+    """
+    if len(table) < 2:
+        return None
+    header = [cell.strip().lower() for cell in table[0]]
+
+    def column(pattern):
+        return next((index for index, cell in enumerate(header) if re.search(pattern, cell)), None)
+
+    name_col, start_col = column(r"test name|scenario"), column(r"\bstart")
+    if name_col is None or start_col is None:
+        return None
+    return name_col, start_col, column(r"\bend\b")
+
+
+def execution_rows(tables):
+    """Collects (name, start, end) rows from the execution tables (see execution_columns); other tables are skipped."""
+    rows = []
+    for table in tables:
+        columns = execution_columns(table)
+        if columns is None:
+            continue
+        name_col, start_col, end_col = columns
+        for row in table[1:]:
+            cells = row + [""] * (max(index for index in columns if index is not None) + 1 - len(row))
+            if cells[name_col].strip() and cells[start_col].strip():
+                rows.append({"name": cells[name_col], "start": cells[start_col], "end": cells[end_col] if end_col is not None else ""})
+    return pd.DataFrame(rows, columns=["name", "start", "end"])
+
+
+def cross_check_execution_table(tables, db_path=RUNS_DB):
+    """Checks every execution listed on the slide against the ingested Performance Center runs in one batched query."""
+    if not any(execution_columns(table) for table in tables):
+        return "⚠️ Execution table has no test-name column; cross-check skipped"
+    executions = execution_rows(tables)
+    if executions.empty:
+        return "⚠️ No executions listed in the table"
+
+    matched = match_executions(executions, db_path)
+    problems = [
+        f"'{row.name}' has an unreadable start date '{row.start}'"
+        for row in matched[matched["start_date"].isna()].itertuples()
+    ] + [
+        f"'{row.name}' ({row.start} – {row.end or row.start}) has no matching run"
+        for row in matched[matched["start_date"].notna() & matched["run_id"].isna()].itertuples()
+    ]
+    if problems:
+        return f"❌ {'; '.join(problems)}"
+    return f"✅ All {len(matched)} execution(s) match ingested runs"
+
+
+# Validate Slide 3 onwards for "Title" and "Observations" shapes
+def validate_observation_slide(zip_path, slide_number):
+    slide_shapes = extract_named_shapes(zip_path, slide_number)
+
+    # Extract possible title and observation fields
+    extracted_title = slide_shapes.get("Title", "").strip()
+    extracted_observations = slide_shapes.get("Observations", "").strip()
+
+    return {
+        "Title Found": "✅ Yes" if extracted_title else "❌ No",
+        "Observations Found": "✅ Yes" if extracted_observations else "❌ No",
+        # "Extracted Shapes": slide_shapes
+    }
+
+
+def get_rule_parts(total_slides):
+    """Zip members each slide result depends on, so unchanged slides are not re-validated on re-upload."""
+    rule_parts = {
+        "Slide 1": ["ppt/slides/slide1.xml"],
+        "Slide 2": ["ppt/slides/slide2.xml", "ppt/slides/_rels/slide2.xml.rels", "ppt/embeddings/*"],
+    }
+    for slide_number in range(3, total_slides + 1):
+        rule_parts[f"Slide {slide_number}"] = [f"ppt/slides/slide{slide_number}.xml"]
+    return rule_parts
+
+
+@cached_extraction
+def list_embedded_parts(zip_path):
+    """Lists the embedded object members of the presentation (without extracting them)."""
+    with shared_archive(zip_path) as pptx_zip:
+        return [name for name in pptx_zip.namelist() if name.startswith("ppt/embeddings/")]
+
+
+# Slide parts the declarative rules in RULES_SHEET_NAME can read ("shapes:2" = named shapes of slide 2)
+RULE_ENGINE_PARTS = {
+    "shapes": {"extract": extract_named_shapes, "members": ["ppt/slides/slide{0}.xml"]},
+    "tables": {"extract": extract_tables_from_slide, "members": ["ppt/slides/slide{0}.xml"]},
+    "embedded_files": {"extract": list_embedded_parts, "members": ["ppt/embeddings/*"]},
+    "ole_workbook": {"extract": load_ole_workbook, "members": ["ppt/embeddings/*"]},
+}
+
+
+def metric_rule_label(name):
+    """Observation slides share one metric label so label values stay bounded however long the deck is."""
+    return name if name in ("Slide 1", "Slide 2", "Configured Rules") else "Observation Slide"
+
+
+# Validate PowerPoint against selected row
+def validate_ppt(zip_path, checklist_row, cache=None, config_file=CONFIG_FILE):
+    inspect_archive(zip_path)  # ✅ Reject zip bombs / oversized parts before any slide is parsed
+    started = time.perf_counter()
+    total_slides = get_total_slides(zip_path)
+    row = checklist_row.to_dict() if isinstance(checklist_row, pd.Series) else dict(checklist_row)
+
+    rules = {
+        "Slide 1": lambda: validate_slide1(zip_path, checklist_row),
+        "Slide 2": lambda: validate_slide2(zip_path, checklist_row),
+    }
+    for slide_number in range(3, total_slides + 1):
+        rules[f"Slide {slide_number}"] = lambda n=slide_number: validate_observation_slide(zip_path, n)
+    rule_parts = get_rule_parts(total_slides)
+
+    # ✅ Declarative rules from config.xlsx, compiled once and grouped by slide part
+    rule_plan = load_rule_plan(config_file, RULES_SHEET_NAME, RULE_ENGINE_PARTS)
+    if rule_plan:
+        rules["Configured Rules"] = lambda: {
+            f"Rule {index}": line for index, line in enumerate(execute_plan(rule_plan, zip_path, RULE_ENGINE_PARTS, row), 1)
+        }
+        rule_parts["Configured Rules"] = plan_members(rule_plan, RULE_ENGINE_PARTS)
+    rules = {name: timed_stage("ppt", metric_rule_label(name), rule) for name, rule in rules.items()}  # ✅ Slide latency histogram
+
+    if cache is None:
+        results = {name: rule() for name, rule in rules.items()}
+    else:
+        # ✅ Re-run only the slides whose XML (or embeddings) changed since the previous upload
+        config_mtime = os.path.getmtime(config_file) if os.path.exists(config_file) else None
+        runs_mtime = os.path.getmtime(RUNS_DB) if os.path.exists(RUNS_DB) else None  # Newly ingested runs re-check Slide 2
+        inputs_key = inputs_fingerprint(row, config_mtime, runs_mtime, catalog_version())  # A catalog ingestion re-checks Slide 1
+        results = run_incremental(zip_path, rules, rule_parts, cache, inputs_key)
+
+    save_document_cache(zip_path)  # ✅ Persist extracted slide structures for the next validation of this upload
+    record_validation("ppt", results, time.perf_counter() - started, rule_label=metric_rule_label)
+    return results
+
+# Generate validation report in Excel (rows streamed by xlsxwriter in constant_memory mode)
+def generate_excel_report(validation_results):
+    return export_report(validation_results, "xlsx")
@@ -0,0 +1,70 @@
+"""
+Pre-flight inspection of uploaded .docx/.pptx archives.
+
+Only the central directory is read, so a zip bomb or an oversized part is
+rejected before any member is decompressed or parsed. A file that is not a zip
+archive at all (corrupt, truncated or renamed) is rejected the same way. Parts
+that are large but within limits are listed; xmlparts feeds those to the parser
+in chunks, so the decompressed bytes are not held alongside the tree. The parsed
+tree itself is still built in full and is what the admission budget accounts for.
+"""
+import os
+import zipfile
+
+from .archive import get_archive
+
+MAX_ARCHIVE_BYTES = 200 * 1024 * 1024
+MAX_PARTS = 10_000
+MAX_PART_BYTES = 512 * 1024 * 1024  # Uncompressed size of any single member
+MAX_TOTAL_BYTES = 2 * 1024 * 1024 * 1024  # Uncompressed size of all members together
+MAX_COMPRESSION_RATIO = 100  # Office XML typically compresses 5-20x; bombs compress 1000x+
+RATIO_CHECK_MIN_BYTES = 1024 * 1024  # Tiny members can have any ratio
+STREAMING_PART_BYTES = 32 * 1024 * 1024  # Members above this are decompressed in chunks while parsing
+
+
+class ArchiveRejected(ValueError):
+    """Raised when an upload exceeds the archive limits; the message is shown to the user."""
+
+
+def inspect_archive(archive_path):
+    """
+    Checks part count, compression ratios and uncompressed sizes against the limits.
+
+    :return: Dict with "parts", "uncompressed_bytes", "largest_part" (name, bytes) and
+             "streaming_parts" (members above STREAMING_PART_BYTES).
+    :raises ArchiveRejected: When the file is not a readable zip archive or any limit is exceeded.
+    """
+    name = os.path.basename(archive_path)
+    try:
+        archive_bytes = os.path.getsize(archive_path)
+        if archive_bytes > MAX_ARCHIVE_BYTES:
+            raise ArchiveRejected(f"❌ {name} is {archive_bytes / 1024 / 1024:.0f} MB; the limit is {MAX_ARCHIVE_BYTES // 1024 // 1024} MB.")
+        infos = get_archive(archive_path).infolist()
+    except (zipfile.BadZipFile, OSError) as e:
+        raise ArchiveRejected(f"❌ {name} is not a valid Office document (unreadable zip archive: {e}).") from e
+    if len(infos) > MAX_PARTS:
+        raise ArchiveRejected(f"❌ {name} contains {len(infos)} parts; the limit is {MAX_PARTS}.")
+
+    total_bytes = 0
+    largest_part = (None, 0)
+    streaming_parts = []
+    for info in infos:
+        if info.file_size > MAX_PART_BYTES:
+            raise ArchiveRejected(f"❌ {name}: part '{info.filename}' expands to {info.file_size / 1024 / 1024:.0f} MB; the limit is {MAX_PART_BYTES // 1024 // 1024} MB.")
+        if info.file_size >= RATIO_CHECK_MIN_BYTES and info.file_size > MAX_COMPRESSION_RATIO * max(info.compress_size, 1):
+            raise ArchiveRejected(f"❌ {name}: part '{info.filename}' has a suspicious compression ratio ({info.file_size // max(info.compress_size, 1)}:1).")
+
+        total_bytes += info.file_size
+        if total_bytes > MAX_TOTAL_BYTES:
+            raise ArchiveRejected(f"❌ {name} expands to more than {MAX_TOTAL_BYTES // 1024 // 1024} MB.")
+        if info.file_size > largest_part[1]:
+            largest_part = (info.filename, info.file_size)
+        if info.file_size > STREAMING_PART_BYTES:
+            streaming_parts.append(info.filename)
+
+    return {
+        "parts": len(infos),
+        "uncompressed_bytes": total_bytes,
+        "largest_part": largest_part,
+        "streaming_parts": streaming_parts,
+    }
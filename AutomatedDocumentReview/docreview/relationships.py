@@ -0,0 +1,118 @@
+"""
+Relationship graph of a .docx/.pptx package, built once per document.
+
+Every *.rels part (document, headers, footers, slides, ...) is read once into
+{source part: {rId: target member}}, together with the reverse index of which
+parts embed each ppt/embeddings or word/embeddings member. The title of an
+embedded object is taken from the alt text / description the author gave the
+object that references it; objects without one are titled by their file name.
+All lookups afterwards are dict probes.
+"""
+import posixpath
+import xml.etree.ElementTree as ET
+
+from .archive import get_archive
+from .doccache import cached_extraction
+
+REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+EMBEDDING_FOLDERS = ("word/embeddings/", "ppt/embeddings/", "xl/embeddings/")
+
+# Elements describing the object that follows them: DrawingML non-visual properties and VML shapes
+_DESCRIPTION_TAGS = {"cNvPr", "docPr", "shape"}
+_DESCRIPTION_ATTRIBUTES = ("descr", "title", "alt")
+
+
+def _local_name(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def _source_part(rels_name):
+    """"word/_rels/document.xml.rels" -> "word/document.xml"; "_rels/.rels" -> "" (the package)."""
+    folder, name = posixpath.split(rels_name)
+    return posixpath.join(posixpath.dirname(folder), name[:-len(".rels")]).lstrip("/")
+
+
+def _resolve_target(source, target):
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source), target))
+
+
+class RelationshipGraph:
+    """Relationships of every part of a package, with embedded objects indexed both ways."""
+
+    def __init__(self, relationships, titles):
+        self.relationships = relationships  # source part -> {rId: target member}
+        self.titles = titles  # embedded member -> title
+        self.embedded_by = {}  # embedded member -> [(source part, rId)]
+        for source, targets in relationships.items():
+            for rid, target in targets.items():
+                if target.startswith(EMBEDDING_FOLDERS):
+                    self.embedded_by.setdefault(target, []).append((source, rid))
+        self._by_file_name = {posixpath.basename(member): member for member in self.embedded_by}
+
+    def target(self, source, rid):
+        """Archive member a relationship ID of `source` points to, or None."""
+        return self.relationships.get(source, {}).get(rid)
+
+    def embeddings(self, source):
+        """Embedded members referenced by one part, in relationship order."""
+        return [target for target in self.relationships.get(source, {}).values() if target.startswith(EMBEDDING_FOLDERS)]
+
+    def member(self, name):
+        """Full member name for an embedded member or its bare file name ("oleObject1.bin"), or None."""
+        return name if name in self.embedded_by else self._by_file_name.get(name)
+
+    def sources(self, name):
+        """[(source part, rId)] referencing an embedded object."""
+        return self.embedded_by.get(self.member(name), [])
+
+    def title(self, name):
+        """Author-given title of an embedded object, else its file name; None for unknown objects."""
+        member = self.member(name)
+        if member is None:
+            return None
+        return self.titles.get(member) or posixpath.basename(member)
+
+
+def _read_relationships(archive):
+    relationships = {}
+    for name in archive.namelist():
+        if not name.endswith(".rels"):
+            continue
+        source = _source_part(name)
+        targets = {}
+        for rel in ET.fromstring(archive.read(name)).iter(REL_NS + "Relationship"):
+            if rel.get("TargetMode") != "External" and rel.get("Target"):
+                targets[rel.get("Id")] = _resolve_target(source, rel.get("Target"))
+        relationships[source] = targets
+    return relationships
+
+
+def _embedding_titles(archive, source, embedded_rids):
+    """Walks a part once in document order, giving each embedded rId the description of the object around it."""
+    titles = {}
+    description = None
+    for element in ET.fromstring(archive.read(source)).iter():
+        if _local_name(element.tag) in _DESCRIPTION_TAGS:
+            description = next((element.get(a).strip() for a in _DESCRIPTION_ATTRIBUTES if (element.get(a) or "").strip()), None)
+        for attribute, value in element.attrib.items():
+            if attribute.startswith(R_NS) and value in embedded_rids and description:
+                titles.setdefault(embedded_rids[value], description)
+    return titles
+
+
+@cached_extraction
+def load_relationships(archive_path):
+    """RelationshipGraph of a document, built once per file contents."""
+    archive = get_archive(archive_path)
+    relationships = _read_relationships(archive)
+    titles = {}
+    names = set(archive.namelist())
+    for source, targets in relationships.items():
+        embedded_rids = {rid: target for rid, target in targets.items() if target.startswith(EMBEDDING_FOLDERS)}
+        if embedded_rids and source in names:
+            for member, title in _embedding_titles(archive, source, embedded_rids).items():
+                titles.setdefault(member, title)
+    return RelationshipGraph(relationships, titles)
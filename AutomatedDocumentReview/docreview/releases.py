@@ -0,0 +1,337 @@
+"""
+Release catalog stored in SQLite (config/releases.db).
+
+Uploaded release sheets are validated, coerced to text and merged into the
+catalog by key, so a new upload updates existing releases and adds new ones
+instead of replacing the whole file. Release, project and application IDs are
+indexed so lookups stay cheap as the catalog grows.
+
+One enterprise release spans several projects and applications, so a row is
+keyed by (Enterprise Release ID, Project ID, Application ID).
+"""
+import os
+import re
+import sqlite3
+import threading
+
+import pandas as pd
+
+from .fuzzy import FuzzyIndex, compare_field, normalize_key, similarity
+from .telemetry import get_logger
+
+CONFIG_FOLDER = os.path.join(os.getcwd(), "config")
+SAMPLE_RELEASES_FILE = os.path.join(CONFIG_FOLDER, "SampleReleases.xlsx")
+CATALOG_DB = os.path.join(CONFIG_FOLDER, "releases.db")
+CATALOG_TABLE = "releases"
+CATALOG_COLUMNS = [
+    "Enterprise Release ID", "Release", "Project ID", "Project Name",
+    "Application ID", "Application Name", "Workstream", "Lead Name",
+]
+KEY_COLUMNS = ["Enterprise Release ID", "Project ID", "Application ID"]
+INDEXED_COLUMNS = {"idx_release": "Enterprise Release ID", "idx_project": "Project ID", "idx_application": "Application ID"}
+
+logger = get_logger(__name__)
+
+_init_lock = threading.Lock()
+_index_cache = {}  # (db path, column) -> (catalog version, FuzzyIndex)
+_id_index_cache = {}  # db path -> (catalog version, {ID column: {ID key: [rowid, ...]}})
+
+
+def _quote(column):
+    return '"' + column.replace('"', '""') + '"'
+
+
+def connect(db_path=CATALOG_DB):
+    """Opens the catalog, creating the table and indexes on first use."""
+    conn = sqlite3.connect(db_path)
+    with _init_lock:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {CATALOG_TABLE} ("
+            + ", ".join(f"{_quote(column)} TEXT NOT NULL DEFAULT ''" for column in CATALOG_COLUMNS)
+            + f", PRIMARY KEY ({', '.join(_quote(column) for column in KEY_COLUMNS)}))"
+        )
+        for index_name, column in INDEXED_COLUMNS.items():
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {CATALOG_TABLE} ({_quote(column)} COLLATE NOCASE)")
+    return conn
+
+
+def normalize_releases(df):
+    """
+    Validates and coerces an uploaded releases sheet.
+
+    Column names are trimmed, every value becomes stripped text (IDs such as 2025.3 or
+    23344 are kept exactly as typed), rows without a key are dropped and duplicate keys
+    keep their last occurrence.
+
+    :return: (DataFrame with CATALOG_COLUMNS, list of ignored column names, number of rows dropped)
+    :raises ValueError: When a key column is missing.
+    """
+    df = df.rename(columns=lambda column: str(column).strip())
+    missing = [column for column in KEY_COLUMNS if column not in df.columns]
+    if missing:
+        raise ValueError(f"❌ Missing required column(s): {', '.join(missing)}")
+
+    ignored = [column for column in df.columns if column not in CATALOG_COLUMNS]
+    df = df.reindex(columns=CATALOG_COLUMNS).fillna("").astype(str).apply(lambda column: column.str.strip())
+
+    total = len(df)
+    df = df[(df[KEY_COLUMNS] != "").all(axis=1)]
+    df = df.drop_duplicates(subset=KEY_COLUMNS, keep="last")
+    return df.reset_index(drop=True), ignored, total - len(df)
+
+
+def read_release_sheet(source):
+    """Reads an .xlsx/.xls path or file object with every cell as text, so IDs keep their exact form."""
+    return pd.read_excel(source, dtype=str)
+
+
+def ingest_releases(source, db_path=CATALOG_DB):
+    """
+    Merges a releases sheet (path, file object or DataFrame) into the catalog.
+
+    :return: Dict with "rows" (valid rows merged), "inserted", "updated", "dropped"
+             (blank or duplicate keys) and "ignored_columns".
+    """
+    df = source if isinstance(source, pd.DataFrame) else read_release_sheet(source)
+    df, ignored, dropped = normalize_releases(df)
+
+    columns = ", ".join(_quote(column) for column in CATALOG_COLUMNS)
+    placeholders = ", ".join("?" for _ in CATALOG_COLUMNS)
+    updates = ", ".join(f"{_quote(column)} = excluded.{_quote(column)}" for column in CATALOG_COLUMNS if column not in KEY_COLUMNS)
+    sql = (
+        f"INSERT INTO {CATALOG_TABLE} ({columns}) VALUES ({placeholders}) "
+        f"ON CONFLICT ({', '.join(_quote(column) for column in KEY_COLUMNS)}) DO UPDATE SET {updates}"
+    )
+
+    conn = connect(db_path)
+    try:
+        with conn:  # One transaction for the whole upload
+            before = conn.execute(f"SELECT COUNT(*) FROM {CATALOG_TABLE}").fetchone()[0]
+            conn.executemany(sql, df.itertuples(index=False, name=None))
+            after = conn.execute(f"SELECT COUNT(*) FROM {CATALOG_TABLE}").fetchone()[0]
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            conn.execute(f"PRAGMA user_version = {version + 1}")  # Invalidates the fuzzy indexes
+    finally:
+        conn.close()
+
+    inserted = after - before
+    return {"rows": len(df), "inserted": inserted, "updated": len(df) - inserted, "dropped": dropped, "ignored_columns": ignored}
+
+
+def _ensure_catalog(db_path):
+    """Seeds an empty catalog from SampleReleases.xlsx the first time it is opened."""
+    conn = connect(db_path)
+    try:
+        empty = conn.execute(f"SELECT 1 FROM {CATALOG_TABLE} LIMIT 1").fetchone() is None
+    finally:
+        conn.close()
+    if empty and os.path.exists(SAMPLE_RELEASES_FILE):
+        ingest_releases(SAMPLE_RELEASES_FILE, db_path)
+
+
+def load_releases(db_path=CATALOG_DB):
+    """Returns the whole catalog as a DataFrame of text columns, in CATALOG_COLUMNS order."""
+    _ensure_catalog(db_path)
+    conn = connect(db_path)
+    try:
+        return pd.read_sql_query(f"SELECT * FROM {CATALOG_TABLE} ORDER BY rowid", conn)
+    finally:
+        conn.close()
+
+
+def find_release(release_id, project_id=None, application_id=None, db_path=CATALOG_DB):
+    """
+    Returns the catalog row for a release as a dict, or None.
+
+    Narrow with project/application ID when the release spans several projects;
+    otherwise the first matching row is returned.
+    """
+    if not str(release_id or "").strip():
+        return None
+    _ensure_catalog(db_path)
+    conditions = {"Enterprise Release ID": release_id, "Project ID": project_id, "Application ID": application_id}
+    where = " AND ".join(f"{_quote(column)} = ? COLLATE NOCASE" for column, value in conditions.items() if value)
+    params = [str(value).strip() for value in conditions.values() if value]
+
+    conn = connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        row = conn.execute(f"SELECT * FROM {CATALOG_TABLE} WHERE {where} ORDER BY rowid LIMIT 1", params).fetchone()
+    finally:
+        conn.close()
+    return dict(row) if row else None
+
+
+def _like_pattern(text):
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def query_releases(search="", sort_by=None, descending=False, page=1, page_size=25, db_path=CATALOG_DB):
+    """
+    Returns one page of the catalog with search and sort done in SQLite.
+
+    :param search: Case-insensitive substring matched against every column.
+    :param sort_by: A CATALOG_COLUMNS name; catalog order when None.
+    :param page: 1-based page number, clamped to the last page.
+    :return: (DataFrame of at most page_size rows, total number of matching rows, page actually returned)
+    """
+    if sort_by is not None and sort_by not in CATALOG_COLUMNS:
+        raise ValueError(f"❌ Unknown sort column '{sort_by}'. Expected one of {CATALOG_COLUMNS}")
+
+    where, params = "", []
+    search = (search or "").strip()
+    if search:
+        where = "WHERE " + " OR ".join(f"{_quote(column)} LIKE ? ESCAPE '\\'" for column in CATALOG_COLUMNS)
+        params = [_like_pattern(search)] * len(CATALOG_COLUMNS)
+    order = f"{_quote(sort_by)} COLLATE NOCASE {'DESC' if descending else 'ASC'}, rowid" if sort_by else "rowid"
+
+    _ensure_catalog(db_path)
+    conn = connect(db_path)
+    try:
+        total = conn.execute(f"SELECT COUNT(*) FROM {CATALOG_TABLE} {where}", params).fetchone()[0]
+        page = min(max(1, int(page)), max(1, -(-total // page_size)))
+        df = pd.read_sql_query(
+            f"SELECT * FROM {CATALOG_TABLE} {where} ORDER BY {order} LIMIT ? OFFSET ?",
+            conn,
+            params=params + [page_size, (page - 1) * page_size],
+        )
+    finally:
+        conn.close()
+    return df, total, page
+
+
+def catalog_index(column, db_path=CATALOG_DB):
+    """FuzzyIndex over the distinct values of a catalog column, rebuilt only after an ingestion."""
+    if column not in CATALOG_COLUMNS:
+        raise ValueError(f"❌ Unknown catalog column '{column}'. Expected one of {CATALOG_COLUMNS}")
+
+    _ensure_catalog(db_path)
+    conn = connect(db_path)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        cached = _index_cache.get((db_path, column))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        values = [row[0] for row in conn.execute(f"SELECT DISTINCT {_quote(column)} FROM {CATALOG_TABLE}")]
+    finally:
+        conn.close()
+
+    index = FuzzyIndex(values)
+    _index_cache[(db_path, column)] = (version, index)
+    return index
+
+
+def catalog_version(db_path=CATALOG_DB):
+    """
+    Version of the catalog contents (PRAGMA user_version, bumped by every ingestion), or None.
+
+    Validators put it in their incremental inputs key, so cached release comparisons
+    ("Value names another catalog ...") are recomputed after the catalog changes.
+    """
+    try:
+        conn = connect(db_path)
+        try:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning("release catalog unavailable for its version: %s", e)
+        return None
+
+
+def closest_catalog_value(column, value, db_path=CATALOG_DB, exclude=None):
+    """
+    Closest catalog value of `column` to a document value as (value, similarity), or None.
+
+    :param exclude: A value to skip (compared normalized), e.g. the expected value when
+                    looking for a *different* catalog value the document may name.
+    """
+    if column not in CATALOG_COLUMNS or not str(value or "").strip():
+        return None
+    try:
+        matches = catalog_index(column, db_path).closest(value, exclude=exclude)
+    except sqlite3.Error as e:
+        logger.warning("release catalog unavailable for suggestions: %s", e)
+        return None
+    return matches[0] if matches else None
+
+
+def compare_release_field(column, found, expected, db_path=CATALOG_DB):
+    """
+    compare_field for a release value, cross-checked against the rest of the catalog.
+
+    Names tolerate small typos, but a near miss only stays a "⚠️ Close Match" when no
+    other catalog value matches the document exactly or at least as closely: "Project Z"
+    against an expected "Project Y" names a different catalog project and fails.
+
+    :return: (status, reason, closest other catalog value as (value, similarity) or None)
+    """
+    status, reason = compare_field(found, expected, fuzzy="name" in column.lower())
+    if status == "✅ Matched":
+        return status, reason, None
+    other = closest_catalog_value(column, found, db_path, exclude=expected)
+    if status == "⚠️ Close Match" and other is not None and other[1] >= similarity(found, expected):
+        status, reason = "❌ Not Matched", f"Value names another catalog {column} ('{other[0]}')"
+    return status, reason, other
+
+
+def id_key(column, value):
+    """Hash key for an ID: normalized, spaces removed, and "APPID-" / "APP-" dropped from Application IDs."""
+    key = normalize_key(value).replace(" ", "")
+    if column == "Application ID":
+        key = re.sub(r"^app(id)?", "", key) or key
+    return key
+
+
+def _id_index(db_path):
+    """Dict-of-dicts index from each ID column's keys to catalog rowids, rebuilt only after an ingestion."""
+    _ensure_catalog(db_path)
+    conn = connect(db_path)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        cached = _id_index_cache.get(db_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        columns = ", ".join(_quote(column) for column in KEY_COLUMNS)
+        rows = conn.execute(f"SELECT rowid, {columns} FROM {CATALOG_TABLE}").fetchall()
+    finally:
+        conn.close()
+
+    index = {column: {} for column in KEY_COLUMNS}
+    for rowid, *values in rows:
+        for column, value in zip(KEY_COLUMNS, values):
+            index[column].setdefault(id_key(column, value), []).append(rowid)
+    _id_index_cache[db_path] = (version, index)
+    return index
+
+
+def match_releases(fields, limit=5, db_path=CATALOG_DB):
+    """
+    Finds catalog rows whose IDs appear in a document.
+
+    :param fields: Dict of document field -> value, keyed by catalog column names
+                   ("Enterprise Release ID", "Project ID", "Application ID"; others are ignored).
+    :return: Up to `limit` (row dict, [matched ID columns]) pairs, most matched IDs first.
+    """
+    index = _id_index(db_path)
+    hits = {}
+    for column in KEY_COLUMNS:
+        if fields.get(column):
+            for rowid in index[column].get(id_key(column, fields[column]), []):
+                hits.setdefault(rowid, []).append(column)
+    if not hits:
+        return []
+
+    ranked = sorted(hits.items(), key=lambda item: (-len(item[1]), item[0]))[:limit]
+    conn = connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        placeholders = ", ".join("?" for _ in ranked)
+        rows = {row["rowid"]: row for row in conn.execute(
+            f"SELECT rowid, * FROM {CATALOG_TABLE} WHERE rowid IN ({placeholders})", [rowid for rowid, _ in ranked]
+        )}
+    finally:
+        conn.close()
+    return [({column: rows[rowid][column] for column in CATALOG_COLUMNS}, columns) for rowid, columns in ranked]
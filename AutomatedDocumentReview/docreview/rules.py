@@ -0,0 +1,268 @@
+"""
+Declarative validation rules read from config.xlsx.
+
+A rules sheet (e.g. "word_rules", "ppt_rules") has one row per rule:
+
+    Rule      Free-text name shown in the results
+    Type      presence | regex | cell_equals | date_recency | table_contains
+    Part      Document part the rule reads, e.g. "footer", "revision_history",
+              "shapes:1" (named shapes of slide 1), "embedded_workbook"
+    Field     Optional selector inside the part: a shape name, a table column,
+              or "Sheet!A2" for workbook cells
+    Target    Text / regex / table value to look for
+    Expected  Expected value (cell_equals, regex group) or max age in days
+              (date_recency). "{Project Name}" style placeholders are filled
+              from the selected release row.
+
+Rules are compiled once into an execution plan grouped by part, so each part
+is extracted and parsed a single time no matter how many rules read it. A row
+that does not compile (unknown type or part, invalid regex, bad day count) is
+kept under INVALID_PART and reported as a failing result line, so one typo in
+the sheet never stops the other rules from running.
+"""
+import os
+import re
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from .dates import parse_dates
+from .telemetry import get_logger
+
+RULE_TYPES = {"presence", "regex", "cell_equals", "date_recency", "table_contains"}
+RULE_COLUMNS = ["Rule", "Type", "Part", "Field", "Target", "Expected"]
+INVALID_PART = "invalid"  # Plan key of the rows that failed to compile; they read no part
+
+logger = get_logger(__name__)
+
+_plan_cache = {}
+
+
+def _cell_text(value):
+    """Converts a config cell to a stripped string, treating NaN/None as empty."""
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return ""
+    return str(value).strip()
+
+
+def split_part(part_spec):
+    """Splits "shapes:2" into ("shapes", ("2",)); plain part names have no arguments."""
+    name, _, args = part_spec.partition(":")
+    return name.strip(), tuple(arg.strip() for arg in args.split(",")) if args else ()
+
+
+def _compile_rule(rule, part_registry):
+    """Validates one rule row and adds its compiled fields. Raises ValueError with the reason it cannot run."""
+    if rule["type"] not in RULE_TYPES:
+        raise ValueError(f"unknown rule type '{rule['type']}'. Expected one of {sorted(RULE_TYPES)}")
+
+    part_name, _ = split_part(rule["part"])
+    if part_name not in part_registry:
+        raise ValueError(f"unknown part '{rule['part']}'. Available parts: {sorted(part_registry)}")
+
+    try:
+        if rule["type"] == "regex":
+            rule["pattern"] = re.compile(rule["target"], re.IGNORECASE)
+        elif rule["type"] == "date_recency":
+            rule["pattern"] = re.compile(rule["target"]) if rule["target"] else None
+    except re.error as e:
+        raise ValueError(f"invalid regular expression '{rule['target']}' ({e})")
+    if rule["type"] == "date_recency":
+        try:
+            rule["max_age_days"] = int(float(rule["expected"] or 7))
+        except ValueError:
+            raise ValueError(f"date_recency expects a number of days, got '{rule['expected']}'")
+
+
+def compile_rules(rule_rows, part_registry):
+    """
+    Compiles rule rows into an execution plan {part spec: [compiled rule, ...]}.
+
+    Rows that do not compile are collected under INVALID_PART with their "error".
+
+    :param rule_rows: Iterable of dicts with the RULE_COLUMNS keys.
+    :param part_registry: Dict of part name -> {"extract": callable(path, *args), "members": [zip patterns]}.
+    """
+    plan = {}
+    for order, row in enumerate(rule_rows):
+        rule = {column.lower(): _cell_text(row.get(column)) for column in RULE_COLUMNS}
+        rule["type"] = rule["type"].lower().replace("-", "_")
+        rule["order"] = order
+        rule["rule"] = rule["rule"] or f"Rule {order + 1}"
+
+        if not rule["type"] and not rule["part"]:
+            continue  # Blank spreadsheet row
+        try:
+            _compile_rule(rule, part_registry)
+        except ValueError as e:
+            logger.warning("rule %s does not compile: %s", rule["rule"], e)
+            rule["error"] = str(e)
+            plan.setdefault(INVALID_PART, []).append(rule)
+            continue
+
+        plan.setdefault(rule["part"], []).append(rule)
+
+    return plan
+
+
+def load_rule_plan(config_file, sheet_name, part_registry):
+    """Reads and compiles the rules sheet, reusing the compiled plan until config.xlsx changes on disk."""
+    if not os.path.exists(config_file):
+        return {}
+
+    cache_key = (os.path.abspath(config_file), sheet_name, os.path.getmtime(config_file), tuple(sorted(part_registry)))
+    if cache_key not in _plan_cache:
+        xls = pd.ExcelFile(config_file, engine="openpyxl")
+        if sheet_name not in xls.sheet_names:
+            plan = {}  # No declarative rules configured for this document type
+        else:
+            df = pd.read_excel(xls, sheet_name=sheet_name, dtype=str)
+            df.columns = df.columns.str.strip()
+            plan = compile_rules(df.to_dict("records"), part_registry)
+        _plan_cache[cache_key] = plan
+
+    return _plan_cache[cache_key]
+
+
+def plan_members(plan, part_registry):
+    """Returns the zip member patterns read by a plan (used as its incremental-validation dependencies)."""
+    members = []
+    for part_spec in plan:
+        if part_spec == INVALID_PART:
+            continue
+        part_name, args = split_part(part_spec)
+        for pattern in part_registry[part_name].get("members", []):
+            members.append(pattern.format(*args))
+    return members
+
+
+def fill_placeholders(text, context):
+    """Replaces "{Key}" placeholders with values from the release row / config context."""
+    return re.sub(r"\{([^{}]+)\}", lambda m: _cell_text(context.get(m.group(1), m.group(0))), text)
+
+
+def _select(part, field):
+    """Selects the value a rule reads from an extracted part."""
+    if not field:
+        return part
+
+    if isinstance(part, dict):
+        if "!" in field:  # Workbook cell: "Summary!A2"
+            sheet_name, cell = field.rsplit("!", 1)
+            sheets = {str(name).lower(): sheet for name, sheet in part.items()}
+            sheet = sheets.get(sheet_name.strip().lower())
+            if sheet is None:
+                return None
+            value = sheet[cell.strip().upper()]
+            return getattr(value, "value", value)  # openpyxl Cell or plain value
+        lowered = {str(key).lower(): value for key, value in part.items()}
+        return part.get(field, lowered.get(field.lower()))
+
+    if isinstance(part, list) and part and isinstance(part[0], dict):  # Rows as dicts → one column
+        return [row.get(field) for row in part]
+
+    return part
+
+
+def _as_text(value):
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return " ".join(_as_text(item) for item in value)
+    if isinstance(value, dict):
+        return " ".join(_as_text(item) for item in value.values())
+    return str(value)
+
+
+def _iter_table_cells(part, column):
+    """Yields cell texts from a list of tables (rows of cells) or a list of row dicts, optionally one column."""
+    if isinstance(part, list) and part and isinstance(part[0], dict):
+        for row in part:
+            for key, value in row.items():
+                if not column or key.strip().lower() == column.lower():
+                    yield _as_text(value)
+        return
+
+    for table in part or []:
+        if not table:
+            continue
+        header = [_as_text(cell).strip().lower() for cell in table[0]]
+        column_index = header.index(column.lower()) if column and column.lower() in header else None
+        for row in table:
+            for index, cell in enumerate(row):
+                if column_index is None or index == column_index:
+                    yield _as_text(cell)
+
+
+def evaluate_rule(rule, part, context):
+    """Evaluates one compiled rule against an extracted part. Returns (passed, message)."""
+    rule_type = rule["type"]
+    expected = fill_placeholders(rule["expected"], context)
+    target = fill_placeholders(rule["target"], context)
+
+    if rule_type == "table_contains":
+        wanted = target.lower()
+        found = any(wanted in cell.strip().lower() for cell in _iter_table_cells(part, rule["field"]))
+        return found, f"'{target}' {'found' if found else 'not found'} in table"
+
+    value = _select(part, rule["field"])
+    text = _as_text(value).strip()
+
+    if rule_type == "presence":
+        if target:
+            found = target.lower() in text.lower()
+            return found, f"'{target}' {'present' if found else 'missing'}"
+        return bool(text), "Present" if text else "Missing or empty"
+
+    if rule_type == "regex":
+        match = rule["pattern"].search(text)
+        if not match:
+            return False, f"No match for pattern '{rule['target']}'"
+        if not expected:
+            return True, f"Matched '{match.group(0)}'"
+        found = (match.group(1) if match.groups() else match.group(0)).strip()
+        return found.lower() == expected.lower(), f"Found '{found}', Expected '{expected}'"
+
+    if rule_type == "cell_equals":
+        found = _as_text(value).strip()
+        return found.lower() == expected.lower(), f"Found '{found}', Expected '{expected}'"
+
+    if rule_type == "date_recency":
+        if rule["pattern"] is not None:
+            candidates = rule["pattern"].findall(text)
+        elif isinstance(value, (list, tuple)):
+            candidates = [_as_text(item) for item in value]
+        else:
+            candidates = [text]
+        dates = parse_dates(c for c in candidates if c).dropna()
+        if dates.empty:
+            return False, "No valid date found"
+        latest = dates.max().to_pydatetime()
+        recent = latest >= datetime.today() - timedelta(days=rule["max_age_days"])
+        return recent, f"Latest date {latest.strftime('%m/%d/%Y')} ({'within' if recent else 'older than'} {rule['max_age_days']} days)"
+
+    return False, f"Unsupported rule type '{rule_type}'"
+
+
+def execute_plan(plan, archive_path, part_registry, context=None):
+    """Runs a compiled plan, extracting each part once. Returns result lines in the configured rule order."""
+    context = context or {}
+    outcomes = []
+
+    for part_spec, rules in plan.items():
+        if part_spec == INVALID_PART:
+            outcomes.extend((rule["order"], f"❌ {rule['rule']}: {rule['error']}") for rule in rules)
+            continue
+        part_name, args = split_part(part_spec)
+        try:
+            part = part_registry[part_name]["extract"](archive_path, *args)
+        except Exception as e:
+            for rule in rules:
+                outcomes.append((rule["order"], f"⚠️ {rule['rule']}: Could not read part '{part_spec}' ({e})"))
+            continue
+
+        for rule in rules:
+            passed, message = evaluate_rule(rule, part, context)
+            outcomes.append((rule["order"], f"{'✅' if passed else '❌'} {rule['rule']}: {message}"))
+
+    return [line for _, line in sorted(outcomes)]
@@ -0,0 +1,103 @@
+"""
+SQLite store of Performance Center run timings (filled by docreview.perfcenter).
+
+Report execution tables are checked against it in one batched query: the rows
+are loaded into a temporary table and joined on (test name, start-time window),
+which the (Name, StartTime) index answers without scanning the runs.
+"""
+import os
+import sqlite3
+from datetime import timedelta
+
+import pandas as pd
+
+from .dates import parse_dates
+
+CONFIG_FOLDER = os.path.join(os.getcwd(), "config")
+RUNS_DB = os.path.join(CONFIG_FOLDER, "test_data.db")
+RUN_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"  # How Performance Center reports StartTime/EndTime (sorts as text)
+
+
+def create_database(db_path=RUNS_DB):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS test_runs (
+                ID INTEGER PRIMARY KEY,
+                TestID INTEGER,
+                Name TEXT,
+                StartTime TEXT,
+                EndTime TEXT
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_test_runs_name_start ON test_runs (Name COLLATE NOCASE, StartTime)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_test_runs_test ON test_runs (TestID)")
+    return conn
+
+
+def save_runs(rows, db_path=RUNS_DB):
+    """Upserts (ID, TestID, Name, StartTime, EndTime) rows in a single transaction; None never overwrites a stored value."""
+    conn = create_database(db_path)
+    try:
+        with conn:
+            conn.executemany("""
+                INSERT INTO test_runs (ID, TestID, Name, StartTime, EndTime) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (ID) DO UPDATE SET
+                    TestID = COALESCE(excluded.TestID, TestID), Name = COALESCE(excluded.Name, Name),
+                    StartTime = COALESCE(excluded.StartTime, StartTime), EndTime = COALESCE(excluded.EndTime, EndTime)
+            """, rows)
+    finally:
+        conn.close()
+
+
+def runs_available(db_path=RUNS_DB):
+    """True when run timings have been ingested, i.e. the cross-check can run."""
+    if not os.path.exists(db_path):
+        return False
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'test_runs'").fetchone() is not None \
+            and conn.execute("SELECT 1 FROM test_runs LIMIT 1").fetchone() is not None
+    finally:
+        conn.close()
+
+
+def match_executions(executions, db_path=RUNS_DB):
+    """
+    Finds an ingested run for each reported execution.
+
+    :param executions: DataFrame with "name", "start" and "end" text columns (one row per execution).
+    :return: The same rows with "start_date"/"end_date" (parsed; NaT when unreadable) and
+             "run_id", "run_start", "run_end" of the first run of that test whose start falls
+             between the start date and the end of the end date (NaN when none).
+    """
+    executions = executions.reset_index(drop=True).copy()
+    # ✅ One vectorized parse per column (format detected once) instead of strptime per cell
+    executions["start_date"] = parse_dates(executions["start"]).dt.normalize()
+    executions["end_date"] = parse_dates(executions["end"]).dt.normalize()
+    window_end = executions["end_date"].fillna(executions["start_date"]) + timedelta(days=1)
+
+    readable = executions["start_date"].notna()
+    rows = list(zip(
+        executions.index[readable].tolist(),
+        executions.loc[readable, "name"].str.strip().tolist(),
+        executions.loc[readable, "start_date"].dt.strftime(RUN_TIME_FORMAT).tolist(),
+        window_end[readable].dt.strftime(RUN_TIME_FORMAT).tolist(),
+    ))
+
+    conn = create_database(db_path)
+    try:
+        conn.execute("CREATE TEMP TABLE executions (idx INTEGER PRIMARY KEY, name TEXT, window_start TEXT, window_end TEXT)")
+        conn.executemany("INSERT INTO temp.executions VALUES (?, ?, ?, ?)", rows)
+        matches = pd.read_sql_query("""
+            SELECT e.idx, MIN(r.ID) AS run_id, MIN(r.StartTime) AS run_start, MIN(r.EndTime) AS run_end
+            FROM temp.executions e
+            JOIN test_runs r
+              ON r.Name = e.name COLLATE NOCASE
+             AND r.StartTime >= e.window_start AND r.StartTime < e.window_end
+            GROUP BY e.idx
+        """, conn).set_index("idx")
+    finally:
+        conn.close()
+
+    return executions.join(matches)
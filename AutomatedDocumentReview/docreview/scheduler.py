@@ -0,0 +1,60 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+def run_stages(stages, max_workers=4):
+    """
+    Runs validation stages as a DAG on a thread pool.
+
+    :param stages: Dict of stage name -> (zero-argument callable, [names of stages it depends on]).
+    :param max_workers: Thread pool size for independent stages.
+    :return: (results, timings) where timings[name] has "start", "duration" and "critical_path"
+             (seconds; critical_path is the longest dependency chain ending at that stage).
+    """
+    for name, (_, deps) in stages.items():
+        unknown = [dep for dep in deps if dep not in stages]
+        if unknown:
+            raise ValueError(f"❌ Stage '{name}' depends on unknown stage(s): {', '.join(unknown)}")
+
+    results = {}
+    timings = {}
+    pending = dict(stages)
+    running = {}
+    started_at = time.perf_counter()
+
+    def timed(name, func):
+        start = time.perf_counter()
+        value = func()
+        return value, start - started_at, time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while pending or running:
+            # ✅ Submit every stage whose dependencies have all finished
+            ready = [name for name, (_, deps) in pending.items() if all(dep in timings for dep in deps)]
+            if not ready and not running:
+                raise ValueError(f"❌ Dependency cycle between stages: {', '.join(pending)}")
+            for name in ready:
+                func, _ = pending.pop(name)
+                running[pool.submit(timed, name, func)] = name
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                value, start, duration = future.result()  # Re-raises the stage's exception
+                deps = stages[name][1]
+                results[name] = value
+                timings[name] = {
+                    "start": start,
+                    "duration": duration,
+                    "critical_path": duration + max((timings[dep]["critical_path"] for dep in deps), default=0.0),
+                }
+
+    return results, timings
+
+
+def critical_path_summary(timings):
+    """Returns (total critical-path seconds, name of the stage that ends the slowest chain)."""
+    if not timings:
+        return 0.0, None
+    slowest = max(timings, key=lambda name: timings[name]["critical_path"])
+    return timings[slowest]["critical_path"], slowest
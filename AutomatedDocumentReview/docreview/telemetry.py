@@ -0,0 +1,277 @@
+"""
+Leveled logging and in-process metrics for the validators.
+
+Loggers live under "docreview" and write one key=value line per record to
+stderr. The level comes from DOCREVIEW_LOG_LEVEL (default WARNING); messages use
+%-style arguments, so a disabled debug call costs one level check and never
+formats its arguments.
+
+Counters and histograms are kept in memory and rendered in the Prometheus text
+format by render_metrics(): served at /metrics by the API, and by a small local
+HTTP server when DOCREVIEW_METRICS_PORT is set (see start_metrics_server).
+"""
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LOG_LEVEL = os.environ.get("DOCREVIEW_LOG_LEVEL", "WARNING").upper()
+METRICS_PORT = int(os.environ.get("DOCREVIEW_METRICS_PORT", 0))  # 0 = no standalone metrics server
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)  # Seconds
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class StructuredFormatter(logging.Formatter):
+    """ts=... level=... logger=... msg="..." plus any fields passed as extra={"fields": {...}}."""
+
+    def format(self, record):
+        fields = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "msg": record.getMessage(),
+            **getattr(record, "fields", {}),
+        }
+        line = " ".join(f"{key}={_quote_value(value)}" for key, value in fields.items())
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+def _quote_value(value):
+    text = str(value)
+    if not text or any(char in text for char in ' "=\n'):
+        return '"' + text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+    return text
+
+
+_configure_lock = threading.Lock()
+_configured = False
+
+
+def configure_logging(level=LOG_LEVEL):
+    """Installs the structured stderr handler on the "docreview" logger once."""
+    global _configured
+    with _configure_lock:
+        root = logging.getLogger("docreview")
+        root.setLevel(level)
+        if _configured:
+            return
+        handler = logging.StreamHandler()
+        handler.setFormatter(StructuredFormatter())
+        root.addHandler(handler)
+        root.propagate = False  # Don't repeat records through the host's (Streamlit/uvicorn) root handlers
+        _configured = True
+
+
+def get_logger(name):
+    """Logger "docreview.<name>" (module names are passed as __name__ and used as they are)."""
+    configure_logging()
+    return logging.getLogger(name if name.startswith("docreview") else f"docreview.{name}")
+
+
+# Metrics
+def _label_key(labelnames, labels):
+    if set(labels) != set(labelnames):
+        raise ValueError(f"❌ Expected labels {list(labelnames)}, got {sorted(labels)}")
+    return tuple(str(labels[name]) for name in labelnames)
+
+
+def _format_labels(labelnames, key, extra=()):
+    pairs = list(zip(labelnames, key)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in pairs) + "}"
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic count per label combination."""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name, self.documentation, self.labelnames = name, documentation, tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(_label_key(self.labelnames, labels), 0)
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for key, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_number(value)}"
+
+
+class Histogram:
+    """Observations per label combination, counted into cumulative `buckets` (upper bounds)."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name, self.documentation, self.labelnames = name, documentation, tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._series = {}  # label key -> [per-bucket counts, sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = _label_key(self.labelnames, labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.setdefault(key, [[0] * len(self.buckets), 0.0, 0])
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observes the seconds spent in the with-block (also when it raises)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels):
+        series = self._series.get(_label_key(self.labelnames, labels))
+        return series[2] if series else 0
+
+    def samples(self):
+        with self._lock:
+            series = {key: (list(counts), total, count) for key, (counts, total, count) in self._series.items()}
+        for key, (counts, total, count) in sorted(series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, [("le", _format_number(bound))])
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_number(total)}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, key)} {count}"
+
+
+_registry = []
+
+
+def counter(name, documentation, labelnames=()):
+    metric = Counter(name, documentation, labelnames)
+    _registry.append(metric)
+    return metric
+
+
+def histogram(name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+    metric = Histogram(name, documentation, labelnames, buckets)
+    _registry.append(metric)
+    return metric
+
+
+DOCUMENTS_VALIDATED = counter(
+    "docreview_documents_validated_total", "Documents validated, by document kind and outcome.", ("kind", "outcome"))
+RULES_FAILED = counter(
+    "docreview_rules_failed_total", "Result lines marked ❌, by document kind and result section.", ("kind", "rule"))
+VALIDATION_SECONDS = histogram(
+    "docreview_validation_seconds", "Wall time of a whole validation, by document kind.", ("kind",))
+STAGE_SECONDS = histogram(
+    "docreview_stage_seconds", "Wall time of one validation stage or slide check.", ("kind", "stage"))
+
+
+def render_metrics():
+    """All registered metrics in the Prometheus text exposition format (version 0.0.4)."""
+    lines = []
+    for metric in _registry:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric.samples())
+    return "\n".join(lines) + "\n"
+
+
+def count_failures(results):
+    """Number of result lines (nested in lists or dicts) marked ❌."""
+    if isinstance(results, dict):
+        return sum(count_failures(value) for value in results.values())
+    if isinstance(results, (list, tuple)):
+        return sum(count_failures(value) for value in results)
+    return int(isinstance(results, str) and results.lstrip().startswith("❌"))
+
+
+def has_failures(results):
+    """True when any result line (nested in lists or dicts) is marked ❌."""
+    return count_failures(results) > 0
+
+
+def record_validation(kind, results, seconds, stage_timings=None, rule_label=None):
+    """
+    Updates the document, failed-rule and latency metrics for one finished validation.
+
+    :param rule_label: Maps a result section to its metric label, to keep label values
+                       bounded (e.g. every observation slide reported as one rule).
+    """
+    failed = 0
+    for rule, rule_results in results.items():
+        rule_failures = count_failures(rule_results)
+        if rule_failures:
+            RULES_FAILED.inc(rule_failures, kind=kind, rule=rule_label(rule) if rule_label else rule)
+            failed += rule_failures
+    DOCUMENTS_VALIDATED.inc(kind=kind, outcome="failed" if failed else "passed")
+    VALIDATION_SECONDS.observe(seconds, kind=kind)
+    for stage, timing in (stage_timings or {}).items():
+        STAGE_SECONDS.observe(timing["duration"], kind=kind, stage=stage)
+
+
+def timed_stage(kind, stage, func):
+    """Wraps a zero-argument check so each call is observed in STAGE_SECONDS."""
+    def run():
+        with STAGE_SECONDS.time(kind=kind, stage=stage):
+            return func()
+    return run
+
+
+_server_lock = threading.Lock()
+_server = None
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_metrics().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes every few seconds; keep the console quiet
+
+
+def start_metrics_server(port=METRICS_PORT, host="127.0.0.1"):
+    """Serves /metrics on a background thread, once per process. Returns the server, or None when port is 0."""
+    global _server
+    if not port:
+        return None
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            threading.Thread(target=_server.serve_forever, daemon=True).start()
+            get_logger(__name__).info("metrics server started", extra={"fields": {"url": f"http://{host}:{port}/metrics"}})
+    return _server
@@ -0,0 +1,36 @@
+"""
+Private temp copies of uploaded documents for the Streamlit pages.
+
+Readers memory-map the files they validate (docreview.archive), so an upload must
+never be written to a path another session may still have mapped: truncating a
+mapped file and reading past its new end kills the whole server with SIGBUS. Every
+upload therefore gets its own mkstemp file, unmapped and deleted once the page is done.
+"""
+import os
+import tempfile
+
+from .archive import release_archive
+
+TEMP_FOLDER = os.path.join(os.getcwd(), "temp")
+
+
+def save_upload(uploaded, folder=TEMP_FOLDER):
+    """Writes an upload (anything with .name and .getbuffer()) to its own temp file and returns the path."""
+    os.makedirs(folder, exist_ok=True)
+    fd, path = tempfile.mkstemp(dir=folder, suffix=os.path.splitext(uploaded.name)[1].lower())
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(uploaded.getbuffer())
+    except BaseException:
+        os.remove(path)
+        raise
+    return path
+
+
+def discard_upload(path):
+    """Unmaps a temp copy (required on Windows before deleting it) and deletes it."""
+    release_archive(path)
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,848 @@
+"""Word (.docx) extraction and validation used by the Word Review page."""
+import os
+import re
+import time
+from datetime import datetime, timedelta
+
+import openpyxl
+import pandas as pd
+
+from .archive import shared_archive
+from .doccache import cached_extraction, load_document_cache, save_document_cache
+from .dates import parse_dates
+from .incremental import run_incremental, inputs_fingerprint
+from .headerfooter import extract_footer_text, extract_header_text, find_in_footers
+from .preflight import inspect_archive
+from .releases import catalog_version, compare_release_field
+from .rules import load_rule_plan, execute_plan, plan_members
+from .scheduler import run_stages
+from .telemetry import get_logger, record_validation
+from .xmlparts import parse_part
+
+# Define the path for the config file (assumes it's in a "config" folder next to the script)
+CONFIG_FOLDER = os.path.join(os.getcwd(), "config")
+CONFIG_FILE = os.path.join(CONFIG_FOLDER, "config.xlsx")
+SHEET_NAME = "performance_testing_strategy"  # Assuming a single sheet for all word documents
+RULES_SHEET_NAME = "word_rules"  # Optional sheet of declarative rules (see docreview/rules.py)
+VALIDATION_WORKERS = 4  # Thread pool size for independent validation checks
+SAMPLE_RELEASES_FILE = os.path.join(CONFIG_FOLDER, 'SampleReleases.xlsx')
+temp_dir = os.path.join(os.getcwd(), "temp")  # Create 'temp' folder path
+
+logger = get_logger(__name__)
+
+
+@cached_extraction
+def extract_text_by_page(docx_path):
+    """Extracts text from the Word document page-wise."""
+    root = parse_part(docx_path, "word/document.xml")
+    namespace = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+    
+    paragraphs = root.findall(".//w:p", namespace)
+    text_by_page = {}
+    page_number = 1
+    text_by_page[page_number] = []
+    
+    for para in paragraphs:
+        texts = [node.text for node in para.findall(".//w:t", namespace) if node.text]
+        para_text = " ".join(texts).strip()
+        
+        if para_text:
+            text_by_page[page_number].append(para_text)
+        
+        if para_text.startswith("Page ") and para_text.split()[-1].isdigit():
+            page_number += 1
+            text_by_page[page_number] = []
+
+    return text_by_page
+
+
+# def extract_section_names(docx_path):
+#     """Extract section names from the document."""
+#     with zipfile.ZipFile(docx_path, "r") as docx_zip:
+#         document_xml = docx_zip.read("word/document.xml")
+
+#     root = ET.fromstring(document_xml)
+#     namespace = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+    
+#     section_names = []
+#     paragraphs = root.findall(".//w:p", namespace)
+    
+#     for para in paragraphs:
+#         texts = [node.text for node in para.findall(".//w:t", namespace) if node.text]
+#         text = " ".join(texts).strip()
+        
+#         if text:
+#             section_names.append(text)
+
+#     return section_names
+
+
+@cached_extraction
+def extract_section_names(docx_path):
+    """Extract section names (headings and bold text) from the document."""
+    root = parse_part(docx_path, "word/document.xml")
+    namespace = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+
+    section_names = []
+    paragraphs = root.findall(".//w:p", namespace)
+
+    for para in paragraphs:
+        # Extract all text inside this paragraph (even if not inside <w:r>)
+        texts = [node.text.strip() for node in para.findall(".//w:t", namespace) if node.text]
+        text = " ".join(texts).strip()  # Properly join words with spaces
+
+        # Check if the paragraph has a heading style
+        p_style = para.find(".//w:pPr/w:pStyle", namespace)
+        is_heading = False
+        if p_style is not None:
+            style_val = p_style.attrib.get("{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val", "")
+            if "Heading" in style_val:  # Detects Heading1, Heading2, etc.
+                is_heading = True
+
+        # Check if any text is bold
+        has_bold = any(r.find(".//w:rPr/w:b", namespace) is not None for r in para.findall(".//w:r", namespace))
+
+        # Add text if it's a heading OR contains bold text
+        if text and (is_heading or has_bold):
+            section_names.append(text)
+
+    # Remove duplicate or extra spaces
+    section_names = list(set(name.replace("  ", " ") for name in section_names))
+
+    return section_names
+    
+@cached_extraction
+def extract_table_content(docx_path):
+    """Extracts key-value pairs from tables in the document."""
+    table_data = []
+    
+    root = parse_part(docx_path, "word/document.xml")
+    namespace = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+
+    tables = root.findall(".//w:tbl", namespace)
+
+    for table in tables:
+        table_rows = []
+        for row in table.findall(".//w:tr", namespace):
+            cells = row.findall(".//w:tc", namespace)
+            row_data = []
+            for cell in cells:
+                texts = [node.text for node in cell.findall(".//w:t", namespace) if node.text]
+                row_data.append(" ".join(texts).strip())
+
+            if row_data:
+                table_rows.append(row_data)
+
+        if table_rows:
+            table_data.append(table_rows)
+    
+    return table_data
+
+def validate_revision_history(docx_path):
+    """Validates Document Revision History for recent date and non-blank Author."""
+    tables = extract_table_content(docx_path)
+    revision_history = None
+
+    for table in tables:
+        if "Document Revision History" in table[0][0]:  # Checking if it's the right table
+            revision_history = table[1:]  # Skip header row
+            break
+    
+    if not revision_history:
+        logger.debug("revision history table not found in %s", docx_path)
+        return False
+
+    recent_date = None
+    author_missing = False
+
+    for row in revision_history:
+        try:
+            revision_number = row[0]
+            author = row[1]
+            revision_date = row[2]
+
+            if not author.strip():
+                author_missing = True
+
+            parsed_date = datetime.strptime(revision_date, "%m/%d/%Y")  # Adjust format as per doc
+            if not recent_date or parsed_date > recent_date:
+                recent_date = parsed_date
+        except (IndexError, ValueError):
+            continue
+
+    if not recent_date:
+        logger.debug("revision date missing or unreadable")
+    else:
+        logger.debug("most recent revision date %s", recent_date.strftime("%m/%d/%Y"))
+
+    if author_missing:
+        logger.debug("revision history has blank authors")
+    else:
+        logger.debug("revision history authors filled")
+
+    return not author_missing and recent_date is not None
+
+@cached_extraction
+def extract_text_from_docx(docx_path):
+    """Extracts raw text from a DOCX file by parsing its XML content."""
+    root = parse_part(docx_path, "word/document.xml")
+
+    # Extract all text elements from the XML
+    namespaces = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+    texts = [node.text for node in root.findall(".//w:t", namespaces) if node.text]
+    # print (" ".join(texts))
+    return " ".join(texts)  # Join text with spaces for better readability
+         
+
+def extract_key_values(text):
+    """Extracts key-value pairs from the document text correctly."""
+    key_value_pairs = {}
+
+    # Define regex pattern with lookahead to stop at the next key
+    patterns = {
+        "Project Name": r"Project Name:\s*([^\n]+?)(?=\s+Release|$)",
+        "Release": r"Release:\s*([^\n]+?)(?=\s+Project ID|$)",
+        "Project ID": r"Project ID:\s*([^\n]+?)(?=\s+Enterprise Release ID|$)",
+        "Enterprise Release ID": r"Enterprise Release ID:\s*([^\n]+?)(?=\s+Application Name|$)",
+        "Application Name": r"Application Name:\s*([^\n]+?)(?=\s+Application ID|$)",
+        "Application ID": r"Application ID\s*:\s*([^\n]+?)(?=\s+Document Change History|$)"
+    }
+
+    # Apply regex to extract values
+    for key, pattern in patterns.items():
+        match = re.search(pattern, text)
+        if match:
+            key_value_pairs[key] = match.group(1).strip()
+
+    return key_value_pairs
+
+
+def extract_page1_text(docx_path):
+    """Extracts text from the first page using an approximation."""
+    full_text = extract_text_from_docx(docx_path)
+    return full_text[:500].strip()  # Extracts more characters for better accuracy
+
+
+def read_config(config_path, sheet_name):
+    """Reads the config Excel file and processes its key-value pairs correctly."""
+    df = pd.read_excel(config_path, sheet_name=sheet_name, engine="openpyxl")
+
+    # Debugging: Show column names
+    logger.debug("config sheet %s columns %s", sheet_name, df.columns.tolist())
+
+    # Ensure columns are correctly named
+    expected_columns = ["Key", "Value"]
+    df.columns = df.columns.str.strip()  # Trim whitespace
+    if not all(col in df.columns for col in expected_columns):
+        raise ValueError(f"❌ Excel sheet must contain columns: {expected_columns}. Found: {df.columns.tolist()}")
+
+    # Convert 'Key' and 'Value' to a dictionary
+    config_dict = {}
+    
+    for _, row in df.iterrows():
+        key = row["Key"].strip()
+        value = str(row["Value"]).strip()  # Convert to string and trim whitespace
+        
+        if key == "Sections":
+            # Convert sections into a list
+            config_dict[key] = [section.strip() for section in value.split(",")]
+        else:
+            # Store all other key-value pairs
+            config_dict[key] = value
+
+    return config_dict
+
+def compare_values(extracted, config):
+    """Compares extracted values with config file values."""
+    for key, value in extracted.items():
+        config_key = f"page1_{key}"  # Convert key to match config format
+        config_value = config.get(config_key)
+
+        # Handle missing keys in config
+        if config_value is None:
+            logger.warning("key %s not found in config", key)
+            continue
+
+        # Normalize case and whitespace for comparison
+        extracted_value = str(value).strip().lower()
+        expected_value = str(config_value).strip().lower()
+
+        # Handle list comparison (e.g., Sections)
+        if isinstance(config_value, list):
+            extracted_list = [item.strip().lower() for item in extracted_value.split(",")]
+            expected_list = [item.strip().lower() for item in config_value]
+            
+            if sorted(extracted_list) != sorted(expected_list):
+                logger.debug("mismatch in %s: extracted %s, expected %s", key, extracted_list, expected_list)
+            else:
+                logger.debug("match: %s", key)
+        else:
+            # Standard string comparison
+            if extracted_value != expected_value:
+                logger.debug("mismatch in %s: extracted %r, expected %r", key, value, config_value)
+            else:
+                logger.debug("match: %s", key)
+
+def normalize_application_id(value):
+    """Normalizes Application IDs so that APPID-123, "appid - 123" and 123 all compare equal."""
+    cleaned = value.replace(" ", "").lower()
+    return f"appid-{cleaned}" if cleaned.isnumeric() else cleaned
+
+
+def validate_page1_key_values(docx_path, selected_row, config):
+    """Validates key-value pairs from Page 1 text against the selected row data using configurable key validation."""
+
+    # print(f"DEBUG: selected_row type = {type(selected_row)}, value = {selected_row}")
+
+    # ✅ Convert selected_row to dictionary if it's a Pandas Series
+    if isinstance(selected_row, pd.Series):
+        selected_row = selected_row.to_dict()
+
+    if not isinstance(selected_row, dict):
+        raise TypeError(f"Expected selected_row to be a dictionary, but got {type(selected_row).__name__}")
+
+    # print("Converted selected_row:", selected_row)
+
+    # Extract and normalize required keys from config
+    raw_mandatory_fields = config.get('Page1_MandatoryFieldsToValidate', [])
+
+    # Ensure raw_mandatory_fields is always a list
+    if isinstance(raw_mandatory_fields, str):
+        raw_mandatory_fields = raw_mandatory_fields.split(',')
+    elif not isinstance(raw_mandatory_fields, list):
+        raise TypeError(f"Expected Page1_MandatoryFieldsToValidate to be a list or string, but got {type(raw_mandatory_fields).__name__}")
+
+    # Normalize required keys
+    required_keys = set(key.strip().lower().replace(" ", "") for key in raw_mandatory_fields)
+    # print("✅ Required Keys:", required_keys)
+
+    # print("Required Keys:", required_keys)
+
+    # Extract text from Page 1 of the document
+    page1_text = extract_page1_text(docx_path)
+    
+    # Extract key-value pairs from the Page 1 text
+    extracted_values = extract_key_values(page1_text)
+
+    # print("🔍 DEBUG: extracted_values type =", type(extracted_values), extracted_values)
+
+
+    # Normalize keys for case-insensitive comparison, but keep original case for UI
+    normalized_selected_row = {
+        key: str(value).strip()
+        for key, value in selected_row.items()
+        if key.lower().replace(" ", "") in required_keys
+    }
+
+    # print("Normalized Selected Row:", normalized_selected_row)
+
+    normalized_extracted = {
+        key.strip(): value.strip()
+        for key, value in extracted_values.items()
+    }
+
+    # print("Normalized Extracted Values:", normalized_extracted)
+
+    # Ensure normalized_extracted is a dictionary
+    if not isinstance(normalized_extracted, dict):
+        logger.error("normalized_extracted is a %s, not a dict", type(normalized_extracted).__name__)
+        normalized_extracted = {}
+    # Compare extracted values with selected row values
+    results = {}
+
+    for key, expected_value in normalized_selected_row.items():
+        found_value = normalized_extracted.get(key, "Missing")
+        # print(">>>" + key)
+        if found_value == "Missing":
+            status, reason = "❌ Not Matched", "Key not found in document"
+        elif expected_value.lower() == found_value.lower(): #or found_value.lower() in expected_value.lower():
+            status, reason = "✅ Matched", "Values match"
+        elif key == "Application ID" and normalize_application_id(found_value) == normalize_application_id(expected_value):
+            status, reason = "✅ Matched", "Values match (Partial Match Allowed)"
+        else:
+            # ✅ Names tolerate small typos (reported as close matches); IDs must match exactly after normalization.
+            # A near miss that names another catalog value at least as closely fails instead.
+            status, reason, other = compare_release_field(key, found_value, expected_value)
+            if other and not reason.startswith("Value names another catalog"):
+                reason += f"; the document looks closest to catalog {key} '{other[0]}'"
+
+        # Store structured result
+        results[key] = {
+            "status": status,
+            "found": found_value,
+            "expected": expected_value,
+            "reason": reason
+        }
+
+    # print(results)
+
+    # Return structured dictionary
+    return {
+        "status": "✅ All matched" if all(r["status"] == "✅ Matched" for r in results.values()) else "❌ Mismatches found",
+        "details": results  # Now this is a dictionary!
+    }
+
+    # # Determine overall validation status
+    # overall_status = "✅ All matched" if all("✅ Matched" in r for r in results) else "❌ Mismatches found"
+    # print(results)
+    # return {
+    #     "status": overall_status,
+    #     "details": results  # List of formatted messages for UI
+    # }
+
+
+@cached_extraction
+def extract_toc_sections(docx_path):
+    """Extracts section names with heading levels from the Table of Contents."""
+    root = parse_part(docx_path, "word/document.xml")
+    namespace = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+    toc_sections = []
+    for para in root.findall(".//w:p", namespace):
+        texts = [node.text for node in para.findall(".//w:t", namespace) if node.text]
+        text = " ".join(texts).strip()
+        match = re.match(r"(\d+(\.\d+)*)?\s*(.+?)\s+\d+$", text)
+        if match:
+            heading_level = match.group(1)
+            section_name = match.group(3).strip()
+            level = heading_level.count(".") + 1 if heading_level else 1
+            toc_sections.append((level, section_name))
+    return toc_sections
+
+def validate_sections_using_toc(docx_path, config_sections):
+    """Validates extracted TOC sections against expected sections while maintaining order."""
+    extracted_sections = extract_toc_sections(docx_path)
+
+    def normalize(text):
+        return re.sub(r'[^a-zA-Z0-9 ]', '', text).strip().lower()
+
+    expected_sections = [normalize(sec) for sec in config_sections]
+    extracted_sections = [(level, normalize(sec)) for level, sec in extracted_sections]  # Normalize names
+
+    missing_sections = [sec for sec in expected_sections if sec not in [s[1] for s in extracted_sections]]
+    unexpected_sections = [sec for sec in extracted_sections if sec[1] not in expected_sections]
+
+    return missing_sections, unexpected_sections
+
+
+def check_embedded_excels(docx_path):
+    """Checks for embedded Excel files in the Word document."""
+    with shared_archive(docx_path) as docx_zip:
+        return [file for file in docx_zip.namelist() if "embeddings" in file.lower() and file.endswith((".xls", ".xlsx", ".xlsm"))]
+
+def extract_embedded_excel(docx_path):
+    """Extracts embedded Excel files from the Word document."""
+    extracted_files = []
+    with shared_archive(docx_path) as docx_zip:
+        for file in docx_zip.namelist():
+            if "embeddings" in file.lower() and file.endswith((".xls", ".xlsx", ".xlsm")):
+                output_path = os.path.join(temp_dir, os.path.basename(file))
+                with docx_zip.open(file) as src, open(output_path, "wb") as dest:
+                    dest.write(src.read())
+                extracted_files.append(output_path)
+    return extracted_files
+
+
+def validate_excel_content(excel_path, config):
+    """Validate that the Excel file contains required sheets and correct values for Project ID & Release ID."""
+    try:
+        xls = pd.ExcelFile(excel_path)
+        sheet_names = [name.lower() for name in xls.sheet_names]  # Normalize for comparison
+        required_sheets = {"summary", "nonfunctional requirement", "logs", "contacts"}
+
+        logger.debug("checking embedded workbook %s, sheets %s", excel_path, xls.sheet_names)
+
+        # ✅ Check for required sheets
+        missing_sheets = required_sheets - set(sheet_names)
+        if missing_sheets:
+            logger.debug("embedded workbook missing sheets %s", ", ".join(missing_sheets))
+            # return False
+
+        # ✅ Open the Summary sheet
+        df = pd.read_excel(xls, sheet_name="Summary", header=None)
+
+        # ✅ Extract expected values from config
+        expected_project_id = str(config.get("Page_1_ProjectID", "")).strip().lower()
+        expected_release_id = str(config.get("Page_1_ReleaseID", "")).strip().lower()
+
+        # ✅ Ensure enough rows exist before checking
+        if df.shape[0] < 8 or df.shape[1] < 2:
+            logger.debug("embedded workbook too small to validate: %s", excel_path)
+            return False
+
+        # ✅ Read values from A2 and B8
+        # ✅ Ensure A2 and B8 are not NaN
+
+        
+        # Extract values from fixed cell locations
+        project_id_value = str(df.iloc[1, 0]).strip().lower()  # A2
+        release_id_value = str(df.iloc[7, 1]).strip().lower()  # B8
+
+        # Print extracted values
+        logger.debug("extracted project ID %r, release ID %r", project_id_value, release_id_value)
+        # project_id_value = df.iloc[1, 0] if pd.notna(df.iloc[1, 0]) else ""  # A2
+        # release_id_value = df.iloc[7, 1] if pd.notna(df.iloc[7, 1]) else ""  # B8
+
+        # ✅ Convert values to lowercase strings after handling NaN
+        project_id_value = str(project_id_value).strip().lower()
+        release_id_value = str(release_id_value).strip().lower()
+
+
+        if project_id_value != expected_project_id:
+            logger.debug("A2 (Project ID) mismatch: expected %r, found %r", expected_project_id, project_id_value)
+            return False
+
+        if release_id_value != expected_release_id:
+            logger.debug("B8 (Release ID) mismatch: expected %r, found %r", expected_release_id, release_id_value)
+            return False
+
+        logger.debug("embedded workbook passed: A2=%r, B8=%r", expected_project_id, expected_release_id)
+        return True
+
+    except Exception as e:
+        logger.warning("error reading embedded workbook %s: %s", excel_path, e)
+        return False
+
+@cached_extraction
+def extract_revision_history(docx_path):
+    """Extracts the Document Revision History table, handling merged title rows correctly."""
+
+    # Parse word/document.xml (shared with the other extractors)
+    root = parse_part(docx_path, "word/document.xml")
+    namespaces = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+
+    # Find all text elements
+    paragraphs = root.findall(".//w:t", namespaces)
+
+    found_section = False
+    revision_table = None
+
+    # Iterate through all text elements to locate "Document Change History and Management"
+    for para in paragraphs:
+        text = para.text.strip() if para.text else ""
+
+        # Check if we found "Document Change History and Management"
+        if "Document Change History and Management" in text:
+            found_section = True
+            continue
+
+        # Once found, locate the next table <w:tbl>
+        if found_section:
+            for table in root.findall(".//w:tbl", namespaces):
+                revision_table = table
+                break  # Stop at the first table found after the heading
+
+            if revision_table is not None:
+                break  # Stop searching once the table is found
+
+    # Handle case when no table is found
+    if revision_table is None:
+        logger.debug("revision history table not found in %s", docx_path)
+        return None
+
+    # Extract rows from the table
+    table_data = []
+    rows = revision_table.findall(".//w:tr", namespaces)
+
+    if len(rows) < 2:
+        logger.debug("revision history table has no data rows")
+        return None
+
+    # Ignore the first row (merged title row) and take the second row as headers
+    headers = []
+    for cell in rows[1].findall(".//w:tc", namespaces):
+        cell_text = " ".join(t.text.strip() for t in cell.findall(".//w:t", namespaces) if t.text)
+        headers.append(cell_text)
+
+    # Extract data rows
+    for row in rows[2:]:  # Skip first (title) and second (header) rows
+        row_data = []
+        for cell in row.findall(".//w:tc", namespaces):
+            cell_text = " ".join(t.text.strip() for t in cell.findall(".//w:t", namespaces) if t.text)
+            cell_text = re.sub(r"\s*/\s*", "/", cell_text)  # Normalize date formatting
+            row_data.append(cell_text)
+
+        if any(row_data):  # Ignore empty rows
+            table_data.append(dict(zip(headers, row_data)))  # Convert row into a dictionary
+
+    return table_data
+
+
+def validate_footer_contains_project(docx_path, projectName, every_section=False): #config
+    """Checks if the footer CONTAINS the Project Name, section by section (see docreview.headerfooter)."""
+    expected_project_name = str(projectName).strip()
+    found, failing_sections, _ = find_in_footers(docx_path, expected_project_name, every_section)
+
+    if found:
+        return True, f"✅ Footer contains the Project Name as {expected_project_name}"
+    if not failing_sections:
+        return False, "❌ Footer not found."
+    details = "; ".join(
+        f"section {section}: {', '.join(variants) + ' footer' if variants else 'no footer'}"
+        for section, variants in failing_sections
+    )
+    return False, f"❌ Footer does not contain Project Name as {expected_project_name} ({details})"
+
+
+def extract_excel_data_from_embedded(file_path):
+    """Extracts data from embedded Excel file for specific sheets and cells."""
+    sheets_to_check = [
+        "summary", "logs", "contacts", "architecture", "nonfunctional requirement", "test data"
+    ]
+    extracted_data = {}
+    matching_sheets = []
+
+    try:
+        # Load the embedded Excel file
+        wb = openpyxl.load_workbook(file_path)
+
+        # Iterate through each sheet in the Excel file
+        for sheet_name in wb.sheetnames:
+            if sheet_name.lower() in sheets_to_check:
+                sheet = wb[sheet_name]
+                
+                # Extract values from A2 and B8
+                a2_value = sheet["A2"].value
+                b8_value = sheet["B8"].value
+                
+                # Store the extracted data
+                extracted_data[sheet_name] = {"A2": a2_value, "B8": b8_value}
+                matching_sheets.append(sheet_name)
+                
+            # Stop searching once we have 3 matching sheets
+            if len(matching_sheets) >= 3:
+                break
+
+    except Exception as e:
+        logger.warning("error processing embedded workbook %s: %s", file_path, e)
+
+    return extracted_data, matching_sheets
+
+
+# Define the mapping for more human-readable names
+key_mapping = {
+    "projectid": "Project Id",
+    "projectname": "Project Name",
+    "releaseid": "Release ID",
+    "workstream": "Workstream",
+    "author": "Author",
+    "revisiondate": "Revision Date",
+    "revisionnumber": "Revision Number",
+    "description": "Description",
+    "performancetestplanversion": "Test Plan Version",
+    "appid" : "Application ID",
+    "applicationid": "Application ID",
+    "appname":"Application Name",
+    "applicationname": "Application Name",
+    "releasename": "Release Name"
+}
+
+
+def run_section_validation(docx_path, config):
+    """Checks that every configured section is present in the document."""
+    extracted_sections = extract_section_names(docx_path)
+
+    results = []
+    normalized_extracted = {section.strip().lower(): section for section in extracted_sections}
+    normalized_configured = {section.strip().lower(): section for section in config.get("Sections", [])}
+
+    for config_key, config_section in normalized_configured.items():
+        if config_key in normalized_extracted:
+            results.append(f"✅ {config_section}: Matched (Found in document)")
+        else:
+            results.append(f"❌ {config_section}: Not Found (Expected but missing)")
+
+    # extra_sections = [section for key, section in normalized_extracted.items() if key not in normalized_configured]
+    # if extra_sections:
+    #     results.append(f"⚠️ Extra Sections: {', '.join(extra_sections)} (Not in config)")
+
+    return results
+
+
+def run_revision_history_validation(docx_path):
+    """Checks the latest revision row for an Author and a revision date within the last 7 days."""
+    today = datetime.today()
+    one_week_ago = today - timedelta(days=7)
+    revision_history = extract_revision_history(docx_path)
+
+    revision_results = []
+    if revision_history:
+        # ✅ Parse the whole Revision Date column at once (format detected once, then vectorized)
+        revision_dates = parse_dates(row.get("Revision Date", "").strip() for row in revision_history)
+
+        for row in revision_history:
+            revision_results.append(f"📄 Revision {row.get('Revision Number', 'N/A')}: Author = {row.get('Author', 'N/A')}, Date = {row.get('Revision Date', 'N/A')}")
+        
+        if len(revision_history) > 0:
+            second_row = revision_history[0]
+            author_exists = bool(second_row.get("Author", "").strip())
+            revision_date = revision_dates.iloc[0]
+            recent_date = pd.notna(revision_date) and revision_date >= one_week_ago
+
+            revision_results.append(f"✅ **Author Present:** {'Yes' if author_exists else '❌ No'}")
+            revision_results.append(f"🗓️ **Recent Revision (within last 7 days):** {'✅ Yes' if recent_date else '❌ No'}")
+        else:
+            revision_results.append("⚠️ Not enough data to check revision history.")
+    else:
+        revision_results.append("❌ **Document Revision History table not found!**")
+    
+    return revision_results
+
+
+def run_page1_validation(docx_path, selected_row, config):
+    """Formats the Page 1 key-value comparison against the selected release row."""
+    page1_results = []
+
+    page1_validation = validate_page1_key_values(docx_path, selected_row, config)
+
+    # Iterate over each key in the expected config
+    if "details" in page1_validation:
+        for key, value in page1_validation["details"].items():
+            status = value.get("status", "❌ Unknown Status")
+            found = value.get("found", "N/A")
+            expected = value.get("expected", "N/A")
+            reason = value.get("reason", "No reason provided")
+
+            page1_results.append(f"{status} {key}: Found '{found}', Expected '{expected}' → {reason}")
+
+    # ✅ Footer check through the section map: stops at the first footer that names the project
+    project_name = selected_row.get("Project Name")
+    if project_name:
+        _, footer_message = validate_footer_contains_project(docx_path, project_name)
+        page1_results.append(footer_message)
+
+    return page1_results
+
+
+@cached_extraction
+def probe_embedded_excels(docx_path):
+    """Extracts the embedded workbooks and reads the A2/B8 cell probes of their matching sheets."""
+    return [(excel_file,) + extract_excel_data_from_embedded(excel_file) for excel_file in extract_embedded_excel(docx_path)]
+
+
+def run_embedded_excel_validation(docx_path, config):
+    """Checks the embedded NFR workbook for the required sheets and Project/Release IDs."""
+    embedded_excels = probe_embedded_excels(docx_path)
+    embedded_excel_results = []
+
+    if embedded_excels:
+        for excel_file, extracted_data, matching_sheets in embedded_excels:
+            if len(matching_sheets) >= 3:
+                embedded_excel_results.append(f"✅ Embedded Excel File: {excel_file} contains the required sheets: {', '.join(matching_sheets)}")
+                project_id = config.get("Project ID")
+                release_id = config.get("Release ID")
+                a2_value = extracted_data.get(matching_sheets[0], {}).get("A2")
+                b8_value = extracted_data.get(matching_sheets[0], {}).get("B8")
+
+                if a2_value == project_id:
+                    embedded_excel_results.append(f"  - ✅ A2 matches the Project ID: {a2_value}")
+                else:
+                    embedded_excel_results.append(f"  - ❌ A2 does not match the Project ID: {a2_value}")
+
+                if b8_value == release_id:
+                    embedded_excel_results.append(f"  - ✅ B8 matches the Release ID: {b8_value}")
+                else:
+                    embedded_excel_results.append(f"  - ❌ B8 does not match the Release ID: {b8_value}")
+                
+                break
+        else:
+            embedded_excel_results.append("❌ Please check if you have attached the correct Non-Functional Requirement sheet template.")
+
+    return embedded_excel_results
+
+
+def load_embedded_workbook(docx_path):
+    """Loads the first embedded Excel workbook as {sheet name: worksheet} for cell rules."""
+    embedded_excels = extract_embedded_excel(docx_path)
+    if not embedded_excels:
+        return {}
+    wb = openpyxl.load_workbook(embedded_excels[0], data_only=True)
+    return {sheet.title: sheet for sheet in wb.worksheets}
+
+
+# Document parts the declarative rules in RULES_SHEET_NAME can read, with the zip members behind each part
+RULE_ENGINE_PARTS = {
+    "document_text": {"extract": extract_text_from_docx, "members": ["word/document.xml"]},
+    "page1_text": {"extract": extract_page1_text, "members": ["word/document.xml"]},
+    "toc": {"extract": lambda path: [name for _, name in extract_toc_sections(path)], "members": ["word/document.xml"]},
+    "tables": {"extract": extract_table_content, "members": ["word/document.xml"]},
+    "revision_history": {"extract": extract_revision_history, "members": ["word/document.xml"]},
+    "footer": {"extract": extract_footer_text, "members": ["word/footer*.xml", "word/document.xml", "word/_rels/document.xml.rels"]},
+    "header": {"extract": extract_header_text, "members": ["word/header*.xml", "word/document.xml", "word/_rels/document.xml.rels"]},
+    "embedded_workbook": {"extract": load_embedded_workbook, "members": ["word/embeddings/*"]},
+}
+
+
+# Zip members each validation result depends on. On re-upload, a result is
+# only recomputed when one of its parts changed (see docreview.incremental).
+RULE_PARTS = {
+    "Section Validation": ["word/document.xml", "word/styles.xml"],
+    "Document Revision History": ["word/document.xml"],
+    "Page 1 Summary Details": ["word/document.xml", "word/_rels/document.xml.rels", "word/footer*.xml"],
+    "Embedded Excel Validation": ["word/embeddings/*"],
+}
+
+
+def run_validation_stages(docx_path, rules, rule_parts, timings=None):
+    """Parses word/document.xml once, then fans the independent checks out to a thread pool."""
+    # A document already in the on-disk parse cache needs no XML parse at all
+    stages = {"Parse": (lambda: load_document_cache(docx_path) or parse_part(docx_path, "word/document.xml"), [])}
+    for name, rule in rules.items():
+        # Checks that read document.xml wait for the shared parse; the rest start immediately
+        deps = ["Parse"] if "word/document.xml" in rule_parts.get(name, []) else []
+        stages[name] = (rule, deps)
+
+    results, stage_timings = run_stages(stages, max_workers=VALIDATION_WORKERS)
+    if timings is not None:
+        timings.update(stage_timings)
+    results.pop("Parse")
+    return results
+
+
+# Main validation function
+def validate_document(docx_path, config_file, sheet_name, selected_row, cache=None, timings=None):
+    """Validates the Word document using a config extracted from an Excel file.
+
+    When `cache` (a dict kept across reruns) is given, only the results whose
+    document parts changed since the previous upload are recomputed. Per-stage
+    timings are written into `timings` when a dict is passed.
+    Raises ArchiveRejected before any parsing when the upload exceeds the archive limits.
+    """
+    inspect_archive(docx_path)
+    started = time.perf_counter()
+    if timings is None:
+        timings = {}
+    config = pd.read_excel(config_file, sheet_name=sheet_name, engine="openpyxl").set_index("Key")["Value"].to_dict()
+    
+    if "Sections" in config:
+        config["Sections"] = [s.strip() for s in str(config["Sections"]).split(",")]
+
+    rules = {
+        "Section Validation": lambda: run_section_validation(docx_path, config),
+        "Document Revision History": lambda: run_revision_history_validation(docx_path),
+        "Page 1 Summary Details": lambda: run_page1_validation(docx_path, selected_row, config),
+        "Embedded Excel Validation": lambda: run_embedded_excel_validation(docx_path, config),
+    }
+    rule_parts = dict(RULE_PARTS)
+
+    # ✅ Declarative rules from config.xlsx, compiled once and grouped by document part
+    rule_plan = load_rule_plan(config_file, RULES_SHEET_NAME, RULE_ENGINE_PARTS)
+    if rule_plan:
+        context = {**config, **(selected_row or {})}
+        rules["Configured Rules"] = lambda: execute_plan(rule_plan, docx_path, RULE_ENGINE_PARTS, context)
+        rule_parts["Configured Rules"] = plan_members(rule_plan, RULE_ENGINE_PARTS)
+
+    def run_rules(to_run):
+        return run_validation_stages(docx_path, to_run, rule_parts, timings)
+
+    if cache is None:
+        results = run_rules(rules)
+        results = {name: results[name] for name in rules}
+    else:
+        # Config mtime and catalog version are part of the key so edits to the rules sheet
+        # or a new catalog ingestion invalidate cached results
+        inputs_key = inputs_fingerprint(config, selected_row, os.path.getmtime(config_file), catalog_version())
+        results = run_incremental(docx_path, rules, rule_parts, cache, inputs_key, run_rules=run_rules)
+
+    save_document_cache(docx_path)  # ✅ Persist newly extracted structures for the next validation of this upload
+    record_validation("word", results, time.perf_counter() - started, timings)
+    return results
@@ -0,0 +1,498 @@
+"""
+Standalone .xlsx test artifacts (NFR and results workbooks), validated while streaming.
+
+Worksheets are read straight from their sheet XML with a pull parser fed one
+decompressed chunk at a time: each <row> is turned into {column index: value},
+checked, and dropped before the next is read, so memory stays flat whether a
+sheet has 50 or 50,000 rows. Shared strings are read once per workbook, and
+only sheets that have checks configured are streamed at all; a sheet with only
+header and fixed-cell checks stops at the last row those need.
+
+Two config.xlsx sheets describe a workbook type (names come from its document
+type, e.g. "nfr_workbook_sheets" / "nfr_workbook_rules"):
+
+    Sheets sheet    Sheet | Required | Header Row | Columns
+                    Required: Yes/No (default Yes). Columns: comma-separated
+                    headers that must be present in the header row.
+    Rules sheet     Rule | Sheet | Column | Type | Target | Expected
+                    Column: a header name (checked on every data row) or a cell
+                    such as "A2" (checked once). Type: not_blank | equals |
+                    regex | one_of | range | unique. "{Project ID}" style
+                    placeholders are filled from the selected release row.
+
+Blank cells only fail not_blank; the other rule types skip them. Error cells
+(#N/A, #REF!, #DIV/0!, ...) fail every rule, not_blank included.
+
+    python -m docreview.workbook results.xlsx --type results_workbook --release-id 2025.3
+"""
+import argparse
+import os
+import re
+import time
+import xml.etree.ElementTree as ET
+
+import pandas as pd
+
+from .archive import get_archive, release_archive
+from .doccache import cached_extraction, save_document_cache
+from .doctypes import CONFIG_FILE, release_row_dict
+from .incremental import inputs_fingerprint, run_incremental
+from .preflight import inspect_archive
+from .relationships import load_relationships
+from .rules import fill_placeholders
+from .scheduler import run_stages
+from .telemetry import get_logger, record_validation
+from .xmlparts import PartCache, parse_part
+
+S = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+WORKBOOK_PART = "xl/workbook.xml"
+WORKBOOK_RULE_TYPES = {"not_blank", "equals", "regex", "one_of", "range", "unique"}
+SCHEMA_COLUMNS = ["Sheet", "Required", "Header Row", "Columns"]
+RULE_COLUMNS = ["Rule", "Sheet", "Column", "Type", "Target", "Expected"]
+MAX_REPORTED_ROWS = 5  # Failing row numbers listed per rule
+VALIDATION_WORKERS = 4  # Sheets streamed in parallel
+STREAM_CHUNK_BYTES = 64 * 1024  # Decompressed XML fed to the parser at once; bounds the rows held between events
+
+_CELL_REF = re.compile(r"^([A-Z]{1,3})(\d+)$")
+_plan_cache = {}
+_shared_strings = PartCache(max_entries=4)  # Dropped with the workbook's archive (release_archive)
+
+logger = get_logger(__name__)
+
+
+def column_index(letters):
+    """"A" -> 0, "Z" -> 25, "AA" -> 26."""
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index - 1
+
+
+def _cell_text(value):
+    """Converts a cell or config value to a stripped string; None/NaN are empty and whole floats drop ".0"."""
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+class CellError(str):
+    """Value of an error cell such as "#N/A" or "#REF!": never a valid value for a rule."""
+
+
+def _normalize_header(value):
+    return " ".join(_cell_text(value).split()).lower()
+
+
+# Reading
+@cached_extraction
+def workbook_sheets(xlsx_path):
+    """{sheet name: worksheet member} in workbook order."""
+    relationships = load_relationships(xlsx_path)
+    sheets = {}
+    for sheet in parse_part(xlsx_path, WORKBOOK_PART).iter(S + "sheet"):
+        member = relationships.target(WORKBOOK_PART, sheet.get(R_ID))
+        if member:
+            sheets[sheet.get("name")] = member
+    return sheets
+
+
+def shared_strings_member(xlsx_path):
+    for target in load_relationships(xlsx_path).relationships.get(WORKBOOK_PART, {}).values():
+        if target.endswith("sharedStrings.xml"):
+            return target
+    return None
+
+
+def _iter_elements(archive, member, tag):
+    """Yields each complete `tag` element of a member, then detaches it so the tree never grows."""
+    parser = ET.XMLPullParser(events=("start", "end"))
+    open_elements = []
+    with archive.open(member) as f:
+        for chunk in iter(lambda: f.read(STREAM_CHUNK_BYTES), b""):
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                if event == "start":
+                    open_elements.append(element)
+                    continue
+                open_elements.pop()
+                if element.tag == tag:
+                    yield element
+                    if open_elements:
+                        open_elements[-1].remove(element)
+        parser.close()
+
+
+def _string_item_text(item):
+    """Text of a shared/inline string item: plain <t> or rich-text runs; phonetic hints (<rPh>) are skipped."""
+    return "".join(t.text or "" for t in item.findall(S + "t") + item.findall(f"{S}r/{S}t"))
+
+
+def _read_shared_strings(xlsx_path):
+    archive = get_archive(xlsx_path)
+    member = shared_strings_member(xlsx_path)
+    if member is None or member not in archive.namelist():
+        return ()
+    return tuple(_string_item_text(si) for si in _iter_elements(archive, member, S + "si"))
+
+
+def shared_strings(xlsx_path):
+    """The workbook's shared string table, streamed once per file version and shared by every sheet."""
+    return _shared_strings.get(xlsx_path, (), lambda: _read_shared_strings(xlsx_path))
+
+
+def _cell_value(cell, strings):
+    cell_type = cell.get("t", "n")
+    if cell_type == "inlineStr":
+        item = cell.find(S + "is")
+        return _string_item_text(item) if item is not None else None
+    value = cell.findtext(S + "v")
+    if value is None:
+        return None
+    if cell_type == "s":
+        return strings[int(value)]
+    if cell_type == "b":
+        return value == "1"
+    if cell_type == "n":
+        number = float(value)
+        return int(number) if number.is_integer() else number
+    if cell_type == "e":
+        return CellError(value)
+    return value  # str (formula result), d (ISO date)
+
+
+def iter_sheet_rows(xlsx_path, member, strings=None):
+    """
+    Streams a worksheet row by row.
+
+    :return: Generator of (1-based row number, {0-based column index: value}); empty
+             rows written to the XML are yielded with an empty dict, absent rows are skipped.
+    """
+    strings = shared_strings(xlsx_path) if strings is None else strings
+    row_number = 0
+    for row in _iter_elements(get_archive(xlsx_path), member, S + "row"):
+        row_number = int(row.get("r") or row_number + 1)
+        values = {}
+        index = -1
+        for cell in row.findall(S + "c"):
+            match = _CELL_REF.match(cell.get("r") or "")
+            index = column_index(match.group(1)) if match else index + 1
+            value = _cell_value(cell, strings)
+            if value is not None and value != "":
+                values[index] = value
+        yield row_number, values
+
+
+# Plan
+def _is_yes(value, default=True):
+    text = _cell_text(value).lower()
+    return default if not text else text in {"y", "yes", "true", "1", "x"}
+
+
+def compile_workbook_plan(schema_rows, rule_rows):
+    """
+    Compiles the sheets and rules config rows into {sheet name (lowercase): sheet plan}.
+
+    A sheet plan has "sheet", "required", "header_row", "columns" (required headers) and
+    "rules" (compiled rules; cell rules carry "cell" = (row, column index)).
+    """
+    plan = {}
+
+    def sheet_plan(name):
+        return plan.setdefault(name.lower(), {"sheet": name, "required": False, "header_row": 1, "columns": [], "rules": []})
+
+    for row in schema_rows:
+        name = _cell_text(row.get("Sheet"))
+        if not name:
+            continue  # Blank spreadsheet row
+        entry = sheet_plan(name)
+        entry["required"] = _is_yes(row.get("Required"))
+        header_row = _cell_text(row.get("Header Row"))
+        if header_row:
+            try:
+                entry["header_row"] = int(float(header_row))
+            except ValueError:
+                raise ValueError(f"❌ Sheet '{name}': Header Row must be a row number, got '{header_row}'")
+        entry["columns"] = [column.strip() for column in _cell_text(row.get("Columns")).split(",") if column.strip()]
+
+    for order, row in enumerate(rule_rows):
+        rule = {column.lower(): _cell_text(row.get(column)) for column in RULE_COLUMNS}
+        rule["type"] = rule["type"].lower().replace("-", "_").replace(" ", "_")
+        rule["order"] = order
+        rule["rule"] = rule["rule"] or f"Rule {order + 1}"
+        if not rule["type"] and not rule["sheet"]:
+            continue  # Blank spreadsheet row
+        if rule["type"] not in WORKBOOK_RULE_TYPES:
+            raise ValueError(f"❌ {rule['rule']}: unknown rule type '{rule['type']}'. Expected one of {sorted(WORKBOOK_RULE_TYPES)}")
+        if not rule["sheet"] or not rule["column"]:
+            raise ValueError(f"❌ {rule['rule']}: Sheet and Column are required")
+
+        match = _CELL_REF.match(rule["column"].upper())
+        rule["cell"] = (int(match.group(2)), column_index(match.group(1))) if match else None
+        if rule["cell"] and rule["type"] == "unique":
+            raise ValueError(f"❌ {rule['rule']}: unique applies to a column, not the single cell {rule['column']}")
+        if rule["type"] == "regex":
+            rule["pattern"] = re.compile(rule["target"], re.IGNORECASE)
+        elif rule["type"] == "range":
+            try:
+                rule["bounds"] = tuple(float(bound) if bound else None for bound in (rule["target"], rule["expected"]))
+            except ValueError:
+                raise ValueError(f"❌ {rule['rule']}: range expects numeric Target (min) / Expected (max)")
+
+        sheet_plan(rule["sheet"])["rules"].append(rule)
+
+    return plan
+
+
+def _read_config_rows(xls, sheet_name, columns):
+    if not sheet_name or sheet_name not in xls.sheet_names:
+        return []
+    df = pd.read_excel(xls, sheet_name=sheet_name, dtype=str)
+    df.columns = df.columns.str.strip()
+    return df.reindex(columns=columns).to_dict("records")
+
+
+def load_workbook_plan(config_file, schema_sheet, rules_sheet):
+    """Reads and compiles a workbook type's config sheets, reusing the plan until config.xlsx changes on disk."""
+    if not os.path.exists(config_file):
+        return {}
+
+    cache_key = (os.path.abspath(config_file), schema_sheet, rules_sheet, os.path.getmtime(config_file))
+    if cache_key not in _plan_cache:
+        xls = pd.ExcelFile(config_file, engine="openpyxl")
+        _plan_cache[cache_key] = compile_workbook_plan(
+            _read_config_rows(xls, schema_sheet, SCHEMA_COLUMNS), _read_config_rows(xls, rules_sheet, RULE_COLUMNS)
+        )
+    return _plan_cache[cache_key]
+
+
+# Checking
+def _check_value(rule, value, expected, seen):
+    """True when a non-blank value passes the rule."""
+    text = _cell_text(value)
+    rule_type = rule["type"]
+    if rule_type == "equals":
+        return text.lower() == expected.lower()
+    if rule_type == "regex":
+        return rule["pattern"].search(text) is not None
+    if rule_type == "one_of":
+        return text.lower() in expected
+    if rule_type == "range":
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return False
+        low, high = rule["bounds"]
+        return (low is None or number >= low) and (high is None or number <= high)
+    if rule_type == "unique":
+        key = text.lower()
+        if key in seen:
+            return False
+        seen.add(key)
+        return True
+    return True  # not_blank: any non-blank value
+
+
+def _expected_value(rule, context):
+    if rule["type"] == "one_of":
+        return {value.strip().lower() for value in fill_placeholders(rule["target"], context).split(",") if value.strip()}
+    return fill_placeholders(rule["expected"] or rule["target"], context)
+
+
+def _rows_text(rows, count):
+    listed = ", ".join(str(row) for row in rows)
+    return f"row{'s' if count > 1 else ''} {listed}{', ...' if count > len(rows) else ''}"
+
+
+def check_sheet(xlsx_path, member, sheet_plan, context, strings=None):
+    """
+    Streams one sheet once, checking its header and every rule in the same pass.
+
+    :return: List of result lines (header check first, then rules in configured order).
+    """
+    header_row = sheet_plan["header_row"]
+    column_rules = [rule for rule in sheet_plan["rules"] if rule["cell"] is None]
+    cell_rules = {}
+    for rule in sheet_plan["rules"]:
+        if rule["cell"] is not None:
+            cell_rules.setdefault(rule["cell"][0], []).append(rule)
+    last_needed_row = max([header_row] + list(cell_rules))
+    expected = {rule["order"]: _expected_value(rule, context) for rule in sheet_plan["rules"]}
+
+    outcomes = {}  # rule order -> result line
+    failures = {rule["order"]: [0, []] for rule in column_rules}  # rule order -> [failing rows, first few row numbers]
+    seen = {rule["order"]: set() for rule in column_rules if rule["type"] == "unique"}
+    bound = []  # (rule, column index) once the header row is read
+    header_line = None
+    header_found = False
+    data_rows = 0
+
+    for row_number, values in iter_sheet_rows(xlsx_path, member, strings):
+        for rule in cell_rules.pop(row_number, ()):
+            outcomes[rule["order"]] = _cell_rule_line(rule, values.get(rule["cell"][1]), expected[rule["order"]])
+
+        if row_number == header_row:
+            header_found = True
+            header_line, bound = _read_header(sheet_plan, values, column_rules, outcomes)
+        elif row_number > header_row and bound and values:
+            data_rows += 1
+            for rule, index in bound:
+                value = values.get(index)
+                if value is None:
+                    passed = rule["type"] != "not_blank"
+                elif isinstance(value, CellError):
+                    passed = False
+                else:
+                    passed = _check_value(rule, value, expected[rule["order"]], seen.get(rule["order"]))
+                if not passed:
+                    failure = failures[rule["order"]]
+                    failure[0] += 1
+                    if len(failure[1]) < MAX_REPORTED_ROWS:
+                        failure[1].append(row_number)
+
+        if row_number >= last_needed_row and not bound and not cell_rules:
+            break  # ✅ Nothing left to check further down the sheet
+
+    logger.debug("streamed sheet %s: %d data rows", sheet_plan["sheet"], data_rows)
+    if not header_found and (sheet_plan["columns"] or column_rules):
+        header_line = f"❌ Header row {header_row} not found"
+    for rows in cell_rules.values():  # Cells below the last row of the sheet
+        for rule in rows:
+            outcomes[rule["order"]] = _cell_rule_line(rule, None, expected[rule["order"]])
+    for rule, _ in bound:
+        count, rows = failures[rule["order"]]
+        if count:
+            outcomes[rule["order"]] = f"❌ {rule['rule']}: {count} of {data_rows} rows fail {rule['type']} on '{rule['column']}' ({_rows_text(rows, count)})"
+        else:
+            outcomes[rule["order"]] = f"✅ {rule['rule']}: {data_rows} rows pass {rule['type']} on '{rule['column']}'"
+    for rule in column_rules:
+        outcomes.setdefault(rule["order"], f"⚠️ {rule['rule']}: column '{rule['column']}' not found in header row {header_row}")
+
+    return ([header_line] if header_line else []) + [outcomes[order] for order in sorted(outcomes)]
+
+
+def _read_header(sheet_plan, values, column_rules, outcomes):
+    """Checks the required headers and binds column rules to column indexes. Returns (line, [(rule, index)])."""
+    positions = {}
+    for index, value in sorted(values.items()):
+        positions.setdefault(_normalize_header(value), index)
+
+    line = None
+    if sheet_plan["columns"]:
+        missing = [column for column in sheet_plan["columns"] if _normalize_header(column) not in positions]
+        if missing:
+            line = f"❌ Header row {sheet_plan['header_row']} is missing column(s): {', '.join(missing)}"
+        else:
+            line = f"✅ Header row {sheet_plan['header_row']}: all {len(sheet_plan['columns'])} required columns present"
+
+    bound = []
+    for rule in column_rules:
+        index = positions.get(_normalize_header(rule["column"]))
+        if index is not None:
+            bound.append((rule, index))
+    return line, bound
+
+
+def _cell_rule_line(rule, value, expected):
+    found = _cell_text(value)
+    cell = rule["column"].upper()
+    if not found:
+        passed = False
+        detail = "empty"
+    elif isinstance(value, CellError):
+        passed = False
+        detail = f"error cell {found}"
+    else:
+        passed = _check_value(rule, value, expected, set())
+        detail = f"Found '{found}'" + (f", Expected '{expected}'" if rule["type"] == "equals" else "")
+    return f"{'✅' if passed else '❌'} {rule['rule']}: {cell} {detail}"
+
+
+# Validation
+def validate_workbook(doc_type, xlsx_path, release_row, cache=None, timings=None, config_file=CONFIG_FILE):
+    """
+    Validates a standalone workbook against its document type's sheets and rules config.
+
+    Follows the docreview.doctypes validator signature. Required sheets are checked from
+    the workbook part alone; every configured sheet is then streamed once, in parallel
+    with the others, after the shared strings are read.
+    """
+    inspect_archive(xlsx_path)
+    started = time.perf_counter()
+    if timings is None:
+        timings = {}
+    plan = load_workbook_plan(config_file, doc_type.config_sheet, doc_type.rules_sheet)
+    if not plan:
+        return {"Required Sheets": [f"⚠️ No sheets or rules configured in '{doc_type.config_sheet}' / '{doc_type.rules_sheet}' for {doc_type.label}"]}
+
+    context = release_row_dict(release_row)
+    sheets = workbook_sheets(xlsx_path)
+    members = {name.lower(): (name, member) for name, member in sheets.items()}
+    strings_member = shared_strings_member(xlsx_path)
+
+    def check_required_sheets():
+        missing = [entry["sheet"] for key, entry in plan.items() if entry["required"] and key not in members]
+        if missing:
+            return [f"❌ Missing required sheet(s): {', '.join(missing)}"]
+        required = sum(entry["required"] for entry in plan.values())
+        return [f"✅ All {required} required sheets present"] if required else []
+
+    rules = {"Required Sheets": check_required_sheets}
+    rule_parts = {"Required Sheets": [WORKBOOK_PART]}
+    for key, entry in plan.items():
+        if not entry["columns"] and not entry["rules"]:
+            continue  # Presence check only: the sheet is never streamed
+        name = f"Sheet: {entry['sheet']}"
+        if key not in members:
+            rules[name] = lambda entry=entry: [f"{'❌' if entry['required'] else '⚠️'} Sheet '{entry['sheet']}' not found"]
+            rule_parts[name] = [WORKBOOK_PART]
+            continue
+        member = members[key][1]
+        rules[name] = lambda member=member, entry=entry: check_sheet(xlsx_path, member, entry, context)
+        rule_parts[name] = [WORKBOOK_PART, member] + ([strings_member] if strings_member else [])
+
+    def run_rules(to_run):
+        # Sheets wait for the shared string table, which is streamed once for all of them
+        stages = {"Shared Strings": (lambda: len(shared_strings(xlsx_path)), [])}
+        for name, rule in to_run.items():
+            stages[name] = (rule, ["Shared Strings"] if name.startswith("Sheet: ") else [])
+        results, stage_timings = run_stages(stages, VALIDATION_WORKERS)
+        timings.update(stage_timings)
+        results.pop("Shared Strings")
+        return results
+
+    if cache is None:
+        results = run_rules(rules)
+        results = {name: results[name] for name in rules}
+    else:
+        inputs_key = inputs_fingerprint(context, os.path.getmtime(config_file))
+        results = run_incremental(xlsx_path, rules, rule_parts, cache, inputs_key, run_rules=run_rules)
+
+    save_document_cache(xlsx_path)
+    record_validation(doc_type.name, results, time.perf_counter() - started, timings)
+    return results
+
+
+if __name__ == "__main__":
+    from .doctypes import get_document_type
+    from .releases import find_release
+
+    parser = argparse.ArgumentParser(description="Validate standalone test workbooks against their config.xlsx sheets.")
+    parser.add_argument("workbooks", nargs="+")
+    parser.add_argument("--type", default="nfr_workbook", help="Document type name, e.g. nfr_workbook or results_workbook")
+    parser.add_argument("--release-id", help="Fills {placeholders} from this catalog release")
+    args = parser.parse_args()
+
+    doc_type = get_document_type(args.type)
+    release = find_release(args.release_id) if args.release_id else None
+    if args.release_id and release is None:
+        parser.error(f"Unknown release '{args.release_id}'")
+    for path in args.workbooks:
+        print(f"📄 {os.path.basename(path)}")
+        for section, lines in validate_workbook(doc_type, path, release).items():
+            print(f"  {section}")
+            for line in lines:
+                print(f"    {line}")
+        release_archive(path)
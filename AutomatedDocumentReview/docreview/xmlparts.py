@@ -0,0 +1,93 @@
+import os
+import threading
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+
+from .archive import get_archive, on_release
+from .preflight import STREAMING_PART_BYTES
+
+STREAM_CHUNK_BYTES = 1024 * 1024
+MAX_CACHED_PARTS = 8  # Parsed trees kept at once; a large document.xml tree can take hundreds of MB
+
+
+def _parse_streaming(archive, member):
+    """Feeds the parser one decompressed chunk at a time, so the decompressed member is never held next to its tree."""
+    parser = ET.XMLParser()
+    with archive.open(member) as f:
+        for chunk in iter(lambda: f.read(STREAM_CHUNK_BYTES), b""):
+            parser.feed(chunk)
+    return parser.close()
+
+
+def _parse(archive_path, member):
+    archive = get_archive(archive_path)
+    if archive.getinfo(member).file_size > STREAMING_PART_BYTES:
+        return _parse_streaming(archive, member)
+    return ET.fromstring(archive.read_view(member))
+
+
+class PartCache:
+    """
+    Small LRU of values built from one file version, e.g. parsed parts.
+
+    Keys start with the file's absolute path, mtime and size. Concurrent misses for
+    the same key build the value once while other keys build in parallel, and every
+    entry of a file is dropped when the file is released (docreview.archive), so
+    trees of deleted temp uploads do not outlive their validation.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._building = {}  # key -> lock held while the value is built
+        self._lock = threading.Lock()
+        on_release(self.drop)
+
+    def get(self, path, key, build):
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size) + tuple(key)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            building = self._building.setdefault(key, threading.Lock())
+
+        with building:  # ✅ Only callers of the same key wait for each other
+            try:
+                with self._lock:
+                    if key in self._entries:
+                        return self._entries[key]
+                value = build()
+                with self._lock:
+                    self._entries[key] = value
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            finally:
+                with self._lock:
+                    if self._building.get(key) is building:
+                        del self._building[key]  # Also when build() raises, so failing parts leak no lock
+        return value
+
+    def drop(self, abs_path):
+        """Forgets every entry of a file."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == abs_path]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_parts = PartCache(MAX_CACHED_PARTS)
+
+
+def parse_part(archive_path, member):
+    """
+    Parses an XML member of a .docx/.pptx archive once and returns the shared root element.
+
+    Results are cached per (path, mtime, size, member), so every extractor that reads
+    e.g. word/document.xml during one validation shares a single parse. Callers must
+    treat the returned tree as read-only.
+    """
+    return _parts.get(archive_path, (member,), lambda: _parse(archive_path, member))
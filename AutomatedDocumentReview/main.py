@@ -46,9 +46,11 @@ Emoji	Unicode Code	Description
 import os
 import streamlit as st
 import base64
+from docreview.telemetry import start_metrics_server
 
 # ✅ Set Page Title & Layout
 st.set_page_config(page_title="Validation App", layout="wide", page_icon="📊")
+start_metrics_server()  # ✅ /metrics for local scraping when DOCREVIEW_METRICS_PORT is set (once per process)
 # Inject custom CSS to modify the Streamlit header
 custom_css = """
     <style>
@@ -174,7 +176,7 @@ st.markdown(
 
 # ✅ Sidebar with Navigation
 st.sidebar.title("📌 Navigation")
-selected_page = st.sidebar.radio("Go to:", ["🏠 Home", "📊 PPT Review", "📝 Word Review", "\U0001F4C2 Document Upload"])
+selected_page = st.sidebar.radio("Go to:", ["🏠 Home", "📊 PPT Review", "📝 Word Review", "🗂️ Other Documents", "⚖️ Compare Releases", "\U0001F4C2 Document Upload"])
 
 # # ✅ Handle Page Navigation
 # if selected_page == "🏠 Home":
@@ -211,5 +213,11 @@ elif selected_page == "📊 PPT Review":
 elif selected_page == "📝 Word Review":
     load_page("uiword.py")
 
+elif selected_page == "🗂️ Other Documents":
+    load_page("uireview.py")
+
+elif selected_page == "⚖️ Compare Releases":
+    load_page("uicompare.py")
+
 elif selected_page == "\U0001F4C2 Document Upload":
     load_page("uiupload.py")
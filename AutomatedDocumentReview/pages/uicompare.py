@@ -0,0 +1,81 @@
+import streamlit as st
+from docreview.compare import compare_documents
+from docreview.admission import PPT_MAIN_PARTS, WORD_MAIN_PARTS, controller as admission, estimate_job_cost
+from docreview.preflight import ArchiveRejected, inspect_archive
+from docreview.export import EXPORT_FORMATS, cached_report, new_run_id
+from docreview.uploads import discard_upload, save_upload
+
+st.markdown(
+    """
+    <style>
+        .block-container { padding-top: 0.5rem; } /* Reduce top padding */
+    </style>
+    """,
+    unsafe_allow_html=True
+)
+
+st.title("⚖️ Compare Document Releases")
+st.markdown(
+    '<p style="font-size:18px;">Upload the previously approved document and the new revision '
+    '(both <b>.docx</b> or both <b>.pptx</b>) to see what changed in sections, TOC, revision history, '
+    'Page 1 fields and slide shapes.</p>',
+    unsafe_allow_html=True
+)
+
+col_old, col_new = st.columns(2)
+with col_old:
+    previous_file = st.file_uploader("📂 Previous Release", type=["docx", "pptx"], key="compare_previous")
+with col_new:
+    new_file = st.file_uploader("📂 New Release", type=["docx", "pptx"], key="compare_new")
+
+col1, col2 = st.columns([0.8, 0.2])
+
+with col1:
+    compare_button = st.button("⚖️ Compare Documents", disabled=not (previous_file and new_file))
+
+if compare_button and previous_file and new_file:
+    with st.spinner("🔍 Comparing documents... Please wait."):
+        # ✅ Private copies: two uploads (or two sessions) with the same file name never share a path
+        previous_path = save_upload(previous_file)
+        new_path = save_upload(new_file)
+
+        try:
+            # ✅ Reject zip bombs / oversized parts, then wait for a slot sized for both documents
+            inspect_archive(previous_path)
+            inspect_archive(new_path)
+            main_parts = PPT_MAIN_PARTS if new_path.endswith(".pptx") else WORD_MAIN_PARTS
+            job_cost = estimate_job_cost(previous_path, main_parts) + estimate_job_cost(new_path, main_parts)
+            queue_status = st.empty()
+            with admission.admit(job_cost, on_wait=lambda position: queue_status.info(f"⏳ Other validations are running. Position in queue: {position}")):
+                queue_status.empty()
+                comparison = compare_documents(previous_path, new_path)
+            st.session_state["compare_run"] = {"id": new_run_id(), "results": comparison}
+            st.toast("✅ Comparison Completed!")
+        except (ArchiveRejected, ValueError) as e:
+            st.error(str(e))
+        finally:
+            discard_upload(previous_path)
+            discard_upload(new_path)
+
+compare_run = st.session_state.get("compare_run")
+
+if compare_run:
+    st.write("### Differences:")
+    for section, changes in compare_run["results"].items():
+        st.write(f"#### {section}:")
+        for change in changes:
+            st.write(f"- {change}")
+
+    report_cache = st.session_state.setdefault("compare_report_cache", {})
+    with col2:
+        if (compare_run["id"], "xlsx") not in report_cache:
+            if st.button("📄 Prepare Comparison Report"):
+                cached_report(report_cache, compare_run["id"], compare_run["results"], "xlsx")
+                st.rerun()
+        else:
+            st.download_button(
+                label="📥 Download Comparison Report",
+                data=report_cache[(compare_run["id"], "xlsx")],
+                file_name="Comparison_Report.xlsx",
+                mime=EXPORT_FORMATS["xlsx"][1]
+            )
@@ -0,0 +1,140 @@
+import streamlit as st
+import pandas as pd
+import os
+from st_aggrid import AgGrid, GridOptionsBuilder
+from docreview.admission import controller as admission, estimate_job_cost
+from docreview.autodetect import DETECTABLE_EXTENSIONS, detect_release_admitted
+from docreview.doctypes import document_types
+from docreview.preflight import ArchiveRejected, inspect_archive
+from docreview.releases import query_releases
+from docreview.export import EXPORT_FORMATS, cached_report, new_run_id
+from docreview.uploads import discard_upload, save_upload
+
+# Every document type of docreview.doctypes is reviewed on this one page: Word test plans and
+# PowerPoint reports by their own validators, other templates by their rules sheet in config.xlsx.
+
+st.markdown(
+    """
+    <style>
+        .block-container { padding-top: 0.5rem; } /* Reduce top padding */
+        details > summary { font-size: 20px; }
+    </style>
+    """,
+    unsafe_allow_html=True
+)
+
+st.title("🗂️ Document Validation Application")
+
+RELEASE_PAGE_SIZE = 25  # Rows sent to the release grid per rerun
+
+
+types = document_types()
+type_col, search_col = st.columns([0.6, 0.4])
+with type_col:
+    type_name = st.selectbox("Document type", list(types), format_func=lambda name: types[name].label, key="review_doc_type")
+with search_col:
+    search_text = st.text_input("", placeholder="🔍 Search...", key="review_release_search")
+doc_type = types[type_name]
+
+df, total_releases, _ = query_releases(search_text, page_size=RELEASE_PAGE_SIZE)
+st.caption(f"Showing {len(df)} of {total_releases} matching releases")
+
+grid_options_builder = GridOptionsBuilder.from_dataframe(df)
+grid_options_builder.configure_selection('single', use_checkbox=True)
+st.subheader("📋 Select a Release for Validation")
+response = AgGrid(df, gridOptions=grid_options_builder.build(), height=300, width='100%', fit_columns_on_grid_load=True)
+
+selected_rows = response.get('selected_rows', [])
+if isinstance(selected_rows, list) and selected_rows:
+    selected_row = selected_rows[0]
+elif isinstance(selected_rows, pd.DataFrame) and not selected_rows.empty:
+    selected_row = selected_rows.iloc[0].to_dict()
+else:
+    selected_row = None
+    st.warning("⚠️ No row selected. Please select a release, or upload the document to detect it.")
+
+uploaded_file = st.file_uploader(
+    f"📂 Upload {doc_type.label}", type=[extension.lstrip(".") for extension in doc_type.extensions], key=f"review_upload_{type_name}"
+)
+
+# ✅ No selection: detect the release from the IDs written in Word/PowerPoint documents (once per upload)
+if uploaded_file and not selected_row and os.path.splitext(uploaded_file.name)[1].lower() in DETECTABLE_EXTENSIONS:
+    detection_key = (uploaded_file.name, uploaded_file.size)
+    if st.session_state.get("review_detection", {}).get("key") != detection_key:
+        detect_path = save_upload(uploaded_file)
+        queue_status = st.empty()
+        try:
+            # ✅ Detection parses the document too: it waits for a slot like a validation
+            result = detect_release_admitted(detect_path, doc_type.main_parts, on_wait=lambda position: queue_status.info(f"⏳ Other validations are running. Position in queue: {position}"))
+            st.session_state["review_detection"] = {"key": detection_key, "result": result}
+        finally:
+            queue_status.empty()
+            discard_upload(detect_path)
+    detection = st.session_state["review_detection"]["result"]
+    if detection["error"]:
+        st.error(detection["error"])
+    elif detection["release"]:
+        selected_row = detection["release"]
+        st.info(f"🔎 Detected release {selected_row['Enterprise Release ID']} – {selected_row['Project Name']} "
+                f"({selected_row['Application ID']}) from the document. Select a row to override.")
+    elif detection["candidates"]:
+        st.warning(f"⚠️ The document matches {len(detection['candidates'])} releases equally well. Please select one.")
+
+col1, col2 = st.columns([0.8, 0.2])
+with col1:
+    # ✅ Word and PowerPoint validators compare against the release row: wait for a selected or detected one
+    release_missing = doc_type.requires_release and not selected_row
+    validate_button = st.button("🚀 Validate Document", disabled=not uploaded_file or release_missing, key="review_validate")
+
+if validate_button and uploaded_file and not release_missing:
+    with st.spinner("🔍 Validating document... Please wait."):
+        document_path = save_upload(uploaded_file)
+
+        # ✅ One incremental cache per document type, kept across uploads
+        validation_cache = st.session_state.setdefault("review_validation_cache", {}).setdefault(type_name, {})
+        try:
+            inspect_archive(document_path)
+            queue_status = st.empty()
+            job_cost = estimate_job_cost(document_path, doc_type.main_parts)
+            with admission.admit(job_cost, on_wait=lambda position: queue_status.info(f"⏳ Other validations are running. Position in queue: {position}")):
+                queue_status.empty()
+                validation_result = doc_type.validate(document_path, selected_row, cache=validation_cache)
+        except (ArchiveRejected, ValueError) as e:
+            st.error(str(e))
+            validation_result = None
+        finally:
+            discard_upload(document_path)  # Unmap, then delete this session's private copy
+
+        if validation_result:
+            st.session_state["review_validation_run"] = {"id": new_run_id(), "type": type_name, "results": validation_result}
+            st.toast("✅ Validation Completed!")
+
+validation_run = st.session_state.get("review_validation_run")
+
+if validation_run and validation_run["type"] == type_name:
+    st.write("### Validation Results:")
+    for section, results in validation_run["results"].items():
+        with st.expander(section, expanded=True):
+            if isinstance(results, dict):
+                for check, result in results.items():
+                    st.write(f"- **{check}**: {result}")
+            elif isinstance(results, list):
+                for result in results:
+                    st.write(f"- {result}")
+            else:
+                st.write(f"- {results}")
+
+    report_cache = st.session_state.setdefault("review_report_cache", {})
+    with col2:
+        if (validation_run["id"], "xlsx") not in report_cache:
+            if st.button("📄 Prepare Excel Report", key="review_prepare_report"):
+                cached_report(report_cache, validation_run["id"], validation_run["results"], "xlsx")
+                st.rerun()
+        else:
+            st.download_button(
+                label="📥 Download Excel Report",
+                data=report_cache[(validation_run["id"], "xlsx")],
+                file_name=f"{type_name}_Validation_Report.xlsx",
+                mime=EXPORT_FORMATS["xlsx"][1],
+                key="review_export_download"
+            )
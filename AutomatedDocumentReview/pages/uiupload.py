@@ -1,6 +1,7 @@
 import streamlit as st
 import os
 import pandas as pd
+from docreview.releases import ingest_releases
 
 
 # Define the config folder
@@ -15,7 +16,7 @@ def upload_sample_releases():
     st.header("Welcome to the Sample Releases Upload Page!")
     st.markdown(
         '<p style="font-size:18px;">Here, you can upload an Excel file containing sample release data. '
-        'Once uploaded, click <b>Submit</b> to save the file.</p>',
+        'Once uploaded, click <b>Submit</b> to merge it into the release catalog.</p>',
         unsafe_allow_html=True
     )
 
@@ -30,11 +31,20 @@ def upload_sample_releases():
     # Submit button
     if "uploaded_file" in st.session_state:
         if st.button("✅ Submit"):
-            file_path = os.path.join(CONFIG_FOLDER, "SampleReleases.xlsx")
-            with open(file_path, "wb") as f:
-                f.write(st.session_state["uploaded_file"].getbuffer())
-
-            st.success("File uploaded successfully and saved in the config folder!")
+            # ✅ Merge into the catalog by (Enterprise Release ID, Project ID, Application ID) instead of overwriting it
+            try:
+                summary = ingest_releases(st.session_state["uploaded_file"])
+            except ValueError as e:
+                st.error(str(e))
+                return
+
+            st.success(
+                f"Release catalog updated: {summary['inserted']} new and {summary['updated']} updated release(s)."
+            )
+            if summary["dropped"]:
+                st.warning(f"⚠️ Skipped {summary['dropped']} row(s) with a blank or duplicate Release/Project/Application ID.")
+            if summary["ignored_columns"]:
+                st.info(f"Ignored unknown column(s): {', '.join(summary['ignored_columns'])}")
             st.toast("Upload completed! 🎉")
 
 upload_sample_releases()
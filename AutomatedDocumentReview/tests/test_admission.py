@@ -0,0 +1,48 @@
+import threading
+
+import pytest
+
+from docreview.admission import AdmissionController
+
+
+def test_on_wait_runs_without_the_controller_lock():
+    controller = AdmissionController(memory_budget=100, max_jobs=1)
+    first_running, release_first, waited = threading.Event(), threading.Event(), threading.Event()
+
+    def first_job():
+        with controller.admit(10):
+            first_running.set()
+            release_first.wait(5)
+
+    def on_wait(position):
+        # A slow UI callback: the running job must still be able to finish meanwhile
+        assert position == 1
+        waited.set()
+        release_first.set()
+        first.join(5)
+        assert not first.is_alive()
+
+    first = threading.Thread(target=first_job)
+    first.start()
+    first_running.wait(5)
+    with controller.admit(10, on_wait=on_wait):
+        assert controller.queue_length() == 0
+    assert waited.is_set()
+
+
+def test_abandoned_wait_gives_up_its_place():
+    controller = AdmissionController(memory_budget=100, max_jobs=1)
+
+    class Stop(Exception):
+        pass
+
+    def on_wait(position):
+        raise Stop()
+
+    with controller.admit(10):
+        with pytest.raises(Stop):
+            with controller.admit(10, on_wait=on_wait):
+                pass
+        assert controller.queue_length() == 0
+    with controller.admit(10):
+        pass
@@ -0,0 +1,26 @@
+import os
+
+from docreview import doccache
+
+
+def test_prune_keeps_recent_files_of_the_current_version(tmp_path, monkeypatch):
+    monkeypatch.setattr(doccache, "CACHE_FOLDER", str(tmp_path))
+    stale = tmp_path / f"old-v{doccache.EXTRACTOR_VERSION - 1}.pkl"
+    stale.write_bytes(b"")
+    for n in range(5):
+        cache_file = tmp_path / f"{n}-v{doccache.EXTRACTOR_VERSION}.pkl"
+        cache_file.write_bytes(b"")
+        os.utime(cache_file, (1000 + n, 1000 + n))
+
+    doccache.prune_cache_folder(max_files=3)
+
+    assert sorted(os.listdir(tmp_path)) == [f"{n}-v{doccache.EXTRACTOR_VERSION}.pkl" for n in (2, 3, 4)]
+
+
+def test_digest_memo_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(doccache, "MAX_DIGESTS", 3)
+    for n in range(5):
+        path = tmp_path / f"{n}.docx"
+        path.write_bytes(str(n).encode())
+        doccache.document_digest(str(path))
+    assert len(doccache._digests) == 3
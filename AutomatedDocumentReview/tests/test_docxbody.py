@@ -0,0 +1,46 @@
+import json
+import os
+import zipfile
+
+from docreview.archive import release_archive
+from docreview.docxbody import read_body
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+    'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+TEXT_BOX = (
+    "<w:r><w:t>Before </w:t></w:r>"
+    "<w:r><mc:AlternateContent><mc:Choice Requires=\"wps\"><w:drawing><wps:txbx><w:txbxContent>"
+    "<w:p><w:r><w:t>Text box choice</w:t></w:r></w:p></w:txbxContent></wps:txbx></w:drawing></mc:Choice>"
+    "<mc:Fallback><w:pict><w:txbxContent><w:p><w:r><w:t>Text box fallback</w:t></w:r></w:p>"
+    "</w:txbxContent></w:pict></mc:Fallback></mc:AlternateContent></w:r>"
+    "<w:r><w:t>after</w:t></w:r>"
+)
+BODY = (
+    "<w:p><w:r><w:t>Performance Test Plan</w:t></w:r></w:p>"
+    "<w:p><w:pPr><w:numPr><w:ilvl w:val=\"0\"/></w:numPr></w:pPr><w:r><w:t>Scope</w:t></w:r></w:p>"
+    "<w:p><w:r><w:t xml:space=\"preserve\">See </w:t></w:r><w:hyperlink r:id=\"rId9\"><w:r><w:t>the wiki</w:t></w:r></w:hyperlink>"
+    "<w:r><w:t>.</w:t></w:r></w:p>"
+    f"<w:p>{TEXT_BOX}</w:p>"
+    "<w:p><w:r><w:t>Name</w:t><w:tab/><w:t>Value</w:t><w:br/><w:t>next line</w:t></w:r></w:p>"
+    "<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Cell</w:t></w:r></w:p><w:p>" + TEXT_BOX + "</w:p></w:tc></w:tr></w:tbl>"
+)
+
+
+def test_paragraph_texts_match_python_docx(tmp_path):
+    path = str(tmp_path / "textbox.docx")
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("word/document.xml", f"<w:document {NAMESPACES}><w:body>{BODY}</w:body></w:document>")
+    with open(os.path.join(FIXTURES, "textbox_docx_expected.json"), encoding="utf-8") as f:
+        expected = json.load(f)  # python-docx paragraph.text / cell.text of the same document
+
+    body = read_body(path)
+
+    assert [para.text for para in body.paragraphs] == expected["paragraphs"]
+    assert [para.numbered for para in body.paragraphs] == [False, True, False, False, False]
+    assert body.tables == expected["tables"]
+    release_archive(path)
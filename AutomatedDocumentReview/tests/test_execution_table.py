@@ -0,0 +1,21 @@
+from docreview.ppt import cross_check_execution_table, execution_rows
+
+STANDARD_TABLE = [["Test Type", "Start Date", "End Date"], ["Load Test", "03/10/2025", "03/11/2025"]]
+
+
+def test_table_without_test_name_column_is_not_cross_checked(tmp_path):
+    result = cross_check_execution_table([STANDARD_TABLE], str(tmp_path / "runs.db"))
+    assert result == "⚠️ Execution table has no test-name column; cross-check skipped"
+
+
+def test_rows_are_read_from_tables_naming_the_test():
+    tables = [
+        STANDARD_TABLE,
+        [["Scenario", "Start", "End"], ["load_test_14000", "2025-03-10 08:00", "2025-03-10 09:00"]],
+        [["Start Time", "Test Name"], ["2025-03-11", "stress_test_14002"]],
+    ]
+    rows = execution_rows(tables).to_dict("records")
+    assert rows == [
+        {"name": "load_test_14000", "start": "2025-03-10 08:00", "end": "2025-03-10 09:00"},
+        {"name": "stress_test_14002", "start": "2025-03-11", "end": ""},
+    ]
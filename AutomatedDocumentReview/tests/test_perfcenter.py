@@ -0,0 +1,72 @@
+import sqlite3
+
+import pytest
+
+from docreview.pcmock import FIRST_RUN_ID, start_mock_server
+from docreview.perfcenter import PerformanceCenterClient, create_session, ingest_runs
+
+
+@pytest.fixture
+def mock_pc():
+    servers = []
+
+    def start(**kwargs):
+        server, base_url = start_mock_server(**kwargs)
+        servers.append(server)
+        return server, PerformanceCenterClient(base_url, session=create_session(max_concurrency=4))
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def stored_runs(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT ID, TestID, Name, StartTime, EndTime FROM test_runs ORDER BY ID").fetchall()
+
+
+def test_ingests_every_run(mock_pc, tmp_path):
+    _, client = mock_pc(run_count=20, test_count=5)
+    db_path = tmp_path / "runs.db"
+
+    summary = ingest_runs(client, db_path=str(db_path), max_concurrency=4)
+
+    assert summary == {"runs": 20, "errors": []}
+    rows = stored_runs(db_path)
+    assert [row[0] for row in rows] == list(range(FIRST_RUN_ID, FIRST_RUN_ID + 20))
+    assert all(name and start and end for _, _, name, start, end in rows)
+
+
+def test_retries_transient_failures(mock_pc, tmp_path):
+    server, client = mock_pc(run_count=20, test_count=5, fail_every=4)
+    db_path = tmp_path / "runs.db"
+
+    summary = ingest_runs(client, db_path=str(db_path), max_concurrency=4)
+
+    assert summary == {"runs": 20, "errors": []}
+    assert server.RequestHandlerClass.counter["requests"] > 1 + 5 + 20  # Some requests were answered 503 and retried
+    assert all(row[3] for row in stored_runs(db_path))
+
+
+def test_lists_runs_page_by_page(mock_pc):
+    server, client = mock_pc(run_count=25, test_count=5)
+
+    runs = client.list_runs(page_size=10)
+
+    assert [int(run_id) for run_id, _ in runs] == list(range(FIRST_RUN_ID, FIRST_RUN_ID + 25))
+    listing = [path for path in server.RequestHandlerClass.counter["paths"] if "/Runs?" in path]
+    assert [path.rsplit("start-index=", 1)[1] for path in listing] == ["1", "11", "21"]
+
+
+def test_skips_runs_without_a_numeric_id(mock_pc, tmp_path):
+    _, client = mock_pc(run_count=5, test_count=5, malformed_runs=[(None, "14000"), ("abc", "14001"), (str(FIRST_RUN_ID + 5), "n/a")])
+    db_path = tmp_path / "runs.db"
+
+    summary = ingest_runs(client, db_path=str(db_path), max_concurrency=4)
+
+    assert summary["runs"] == 6
+    assert len(summary["errors"]) == 3  # Two skipped runs, one run time the mock does not know
+    assert any("invalid ID None" in error for error in summary["errors"])
+    assert any("invalid ID 'abc'" in error for error in summary["errors"])
+    assert stored_runs(db_path)[-1][:3] == (FIRST_RUN_ID + 5, None, None)
@@ -0,0 +1,16 @@
+import pytest
+
+from docreview.preflight import ArchiveRejected, inspect_archive
+
+
+@pytest.mark.parametrize("content", [b"", b"not a zip archive", b"PK\x03\x04truncated"])
+def test_non_zip_upload_is_rejected(tmp_path, content):
+    path = tmp_path / "report.docx"
+    path.write_bytes(content)
+    with pytest.raises(ArchiveRejected, match="not a valid Office document"):
+        inspect_archive(str(path))
+
+
+def test_missing_file_is_rejected(tmp_path):
+    with pytest.raises(ArchiveRejected):
+        inspect_archive(str(tmp_path / "gone.pptx"))
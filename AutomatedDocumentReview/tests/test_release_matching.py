@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+from docreview.releases import CATALOG_COLUMNS, catalog_version, compare_release_field, ingest_releases
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    db_path = str(tmp_path / "releases.db")
+    rows = [
+        ["2025.3", "March", "P001", "Project Y", "APP-1", "Billing Portal", "Payments", "Ana"],
+        ["2025.3", "March", "P002", "Project Z", "APP-2", "Billing Portals", "Payments", "Ben"],
+        ["2025.4", "April", "P003", "Customer Onboarding", "APP-3", "Claims Engine", "Claims", "Cy"],
+    ]
+    ingest_releases(pd.DataFrame(rows, columns=CATALOG_COLUMNS), db_path)
+    return db_path
+
+
+def test_near_identical_project_name_of_another_project_fails(catalog):
+    status, reason, other = compare_release_field("Project Name", "Project Z", "Project Y", catalog)
+    assert status == "❌ Not Matched"
+    assert other[0] == "Project Z"
+    assert "Project Z" in reason
+
+
+def test_typo_matching_no_other_catalog_value_is_a_close_match(catalog):
+    status, _, other = compare_release_field("Project Name", "Customer Onboardng", "Customer Onboarding", catalog)
+    assert status == "⚠️ Close Match"
+    assert other is None
+
+
+def test_typo_closer_to_another_catalog_value_fails(catalog):
+    # "Billing Portalz" is one edit from both catalog application names
+    status, _, other = compare_release_field("Application Name", "Billing Portalz", "Billing Portal", catalog)
+    assert status == "❌ Not Matched"
+    assert other[0] == "Billing Portals"
+
+
+def test_exact_match_is_not_cross_checked(catalog):
+    assert compare_release_field("Project Name", "project y", "Project Y", catalog)[0] == "✅ Matched"
+
+
+def test_catalog_version_changes_on_ingestion(catalog):
+    version = catalog_version(catalog)
+    ingest_releases(pd.DataFrame([["2025.5"] + [""] * (len(CATALOG_COLUMNS) - 1)], columns=CATALOG_COLUMNS), catalog)
+    assert catalog_version(catalog) != version
@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+
+from docreview.rules import INVALID_PART, compile_rules, execute_plan, plan_members
+
+
+def registry(calls):
+    def extract(name, value):
+        def run(path, *args):
+            calls.append((name, args))
+            return value
+        return run
+
+    return {
+        "footer": {"extract": extract("footer", "Company Confidential - Project Y v1.2"), "members": ["word/footer*.xml"]},
+        "page1": {"extract": extract("page1", {"Project Name": "Project Y", "Version": "1.2"}), "members": ["word/document.xml"]},
+        "revision_history": {
+            "extract": extract("revision_history", [["Date", "Author"], [(datetime.today() - timedelta(days=2)).strftime("%m/%d/%Y"), "Ana"]]),
+            "members": ["word/document.xml"],
+        },
+        "tables": {"extract": extract("tables", [[["Transaction", "Owner"], ["Login", "Ana"]]]), "members": ["word/document.xml"]},
+        "shapes": {"extract": extract("shapes", {"Title": "Test Report"}), "members": ["ppt/slides/slide{0}.xml"]},
+    }
+
+
+def rule(name, rule_type, part, field="", target="", expected=""):
+    return {"Rule": name, "Type": rule_type, "Part": part, "Field": field, "Target": target, "Expected": expected}
+
+
+def run(rows, context=None):
+    calls = []
+    parts = registry(calls)
+    plan = compile_rules(rows, parts)
+    return execute_plan(plan, "doc.docx", parts, context), calls
+
+
+def test_presence():
+    lines, _ = run([rule("Confidential", "presence", "footer", target="Confidential"), rule("Draft", "presence", "footer", target="Draft")])
+    assert lines == ["✅ Confidential: 'Confidential' present", "❌ Draft: 'Draft' missing"]
+
+
+def test_regex_with_placeholder():
+    lines, _ = run([rule("Version", "regex", "footer", target=r"v(\d+\.\d+)", expected="{Version}")], {"Version": "1.2"})
+    assert lines == ["✅ Version: Found '1.2', Expected '1.2'"]
+
+
+def test_cell_equals():
+    lines, _ = run([rule("Project", "cell_equals", "page1", field="project name", expected="{Project Name}")], {"Project Name": "Project Z"})
+    assert lines == ["❌ Project: Found 'Project Y', Expected 'Project Z'"]
+
+
+def test_date_recency():
+    lines, _ = run([
+        rule("Recent", "date_recency", "revision_history", target=r"\d{2}/\d{2}/\d{4}", expected="7"),
+        rule("Very recent", "date_recency", "revision_history", target=r"\d{2}/\d{2}/\d{4}", expected="1"),
+    ])
+    assert lines[0].startswith("✅ Recent: Latest date") and "within 7 days" in lines[0]
+    assert lines[1].startswith("❌ Very recent:") and "older than 1 days" in lines[1]
+
+
+def test_table_contains():
+    lines, _ = run([rule("Owner", "table_contains", "tables", field="Owner", target="Ana"),
+                    rule("Other owner", "table_contains", "tables", field="Owner", target="Ben"),
+                    rule("Wrong column", "table_contains", "tables", field="Transaction", target="Ana")])
+    assert lines == ["✅ Owner: 'Ana' found in table", "❌ Other owner: 'Ben' not found in table", "❌ Wrong column: 'Ana' not found in table"]
+
+
+def test_rules_are_grouped_by_part():
+    rows = [rule("A", "presence", "footer"), rule("B", "presence", "shapes:2"), rule("C", "regex", "footer", target="Project")]
+    calls = []
+    parts = registry(calls)
+    plan = compile_rules(rows, parts)
+
+    assert [[r["rule"] for r in rules] for rules in plan.values()] == [["A", "C"], ["B"]]
+    assert plan_members(plan, parts) == ["word/footer*.xml", "ppt/slides/slide2.xml"]
+    assert execute_plan(plan, "doc.docx", parts) == ["✅ A: Present", "✅ B: Present", "✅ C: Matched 'Project'"]
+    assert calls == [("footer", ()), ("shapes", ("2",))]  # Each part extracted once
+
+
+def test_bad_rows_fail_alone():
+    rows = [
+        rule("Typo type", "presense", "footer"),
+        rule("Typo part", "presence", "foter"),
+        rule("Bad regex", "regex", "footer", target="v(1"),
+        rule("Bad days", "date_recency", "revision_history", expected="a week"),
+        rule("Good", "presence", "footer", target="Confidential"),
+    ]
+    calls = []
+    parts = registry(calls)
+    plan = compile_rules(rows, parts)
+    lines = execute_plan(plan, "doc.docx", parts)
+
+    assert [r["rule"] for r in plan[INVALID_PART]] == ["Typo type", "Typo part", "Bad regex", "Bad days"]
+    assert plan_members(plan, parts) == ["word/footer*.xml"]
+    assert lines[0].startswith("❌ Typo type: unknown rule type 'presense'")
+    assert lines[1].startswith("❌ Typo part: unknown part 'foter'")
+    assert lines[2].startswith("❌ Bad regex: invalid regular expression 'v(1'")
+    assert lines[3] == "❌ Bad days: date_recency expects a number of days, got 'a week'"
+    assert lines[4] == "✅ Good: 'Confidential' present"
@@ -0,0 +1,42 @@
+import zipfile
+
+from docreview.archive import release_archive
+from docreview.workbook import CellError, check_sheet, compile_workbook_plan, iter_sheet_rows
+
+SHEET = """<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>
+<row r="1"><c r="A1" t="inlineStr"><is><t>Transaction</t></is></c><c r="B1" t="inlineStr"><is><t>Response Time</t></is></c></row>
+<row r="2"><c r="A2" t="inlineStr"><is><t>Login</t></is></c><c r="B2"><v>1.5</v></c></row>
+<row r="3"><c r="A3" t="e"><f>VLOOKUP(X1,Y:Y,1,0)</f><v>#N/A</v></c><c r="B3" t="e"><v>#REF!</v></c></row>
+</sheetData></worksheet>"""
+
+
+def _workbook(path):
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("xl/worksheets/sheet1.xml", SHEET)
+    return str(path)
+
+
+def test_error_cells_are_read_as_errors(tmp_path):
+    path = _workbook(tmp_path / "results.xlsx")
+    rows = dict(iter_sheet_rows(path, "xl/worksheets/sheet1.xml", strings=()))
+    assert rows[3] == {0: "#N/A", 1: "#REF!"}
+    assert all(isinstance(value, CellError) for value in rows[3].values())
+    release_archive(path)
+
+
+def test_error_cells_fail_every_rule(tmp_path):
+    path = _workbook(tmp_path / "results.xlsx")
+    plan = compile_workbook_plan([], [
+        {"Rule": "Names", "Sheet": "Results", "Column": "Transaction", "Type": "not_blank"},
+        {"Rule": "Times", "Sheet": "Results", "Column": "Response Time", "Type": "regex", "Target": "."},
+        {"Rule": "Cell", "Sheet": "Results", "Column": "A3", "Type": "not_blank"},
+    ])["results"]
+
+    lines = check_sheet(path, "xl/worksheets/sheet1.xml", plan, {}, strings=())
+
+    assert lines == [
+        "❌ Names: 1 of 2 rows fail not_blank on 'Transaction' (row 3)",
+        "❌ Times: 1 of 2 rows fail regex on 'Response Time' (row 3)",
+        "❌ Cell: A3 error cell #N/A",
+    ]
+    release_archive(path)
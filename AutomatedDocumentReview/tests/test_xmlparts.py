@@ -0,0 +1,45 @@
+import xml.etree.ElementTree as ET
+import zipfile
+
+import pytest
+
+from docreview.archive import release_archive
+from docreview.xmlparts import MAX_CACHED_PARTS, _parts, parse_part
+
+
+def _archive(path, parts):
+    with zipfile.ZipFile(path, "w") as z:
+        for name in parts:
+            z.writestr(name, f"<root name='{name}'/>")
+    return str(path)
+
+
+def test_parse_is_shared_until_the_archive_is_released(tmp_path):
+    path = _archive(tmp_path / "doc.docx", ["word/document.xml"])
+    first = parse_part(path, "word/document.xml")
+    assert parse_part(path, "word/document.xml") is first
+
+    release_archive(path)
+    assert parse_part(path, "word/document.xml") is not first
+    release_archive(path)
+
+
+def test_cache_is_bounded(tmp_path):
+    names = [f"ppt/slides/slide{n}.xml" for n in range(MAX_CACHED_PARTS + 3)]
+    path = _archive(tmp_path / "deck.pptx", names)
+    for name in names:
+        assert parse_part(path, name).get("name") == name
+    assert len(_parts._entries) <= MAX_CACHED_PARTS
+    release_archive(path)
+    assert not any(key[0] == str(tmp_path / "deck.pptx") for key in _parts._entries)
+
+
+def test_failed_parse_leaves_no_building_lock(tmp_path):
+    path = _archive(tmp_path / "doc.docx", [])
+    with zipfile.ZipFile(path, "a") as z:
+        z.writestr("word/broken.xml", "<root>")
+    for _ in range(2):
+        with pytest.raises(ET.ParseError):
+            parse_part(path, "word/broken.xml")
+    assert not _parts._building
+    release_archive(path)
@@ -1,12 +1,19 @@
 import datetime
 import pandas as pd
-import docx
 import zipfile
 import re
+import logging
 import os
-import xml.etree.ElementTree as ET
- 
-from docx.oxml.ns import qn  # ✅ Import for handling Word namespaces
+import sys
+
+# ✅ Share the raw-XML extraction core with the Streamlit app instead of building a python-docx object model
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "AutomatedDocumentReview"))
+from docreview.docxbody import load_body
+from docreview.doccache import save_document_cache
+from docreview.relationships import load_relationships
+from docreview.telemetry import get_logger
+
+logger = get_logger("app")  # Diagnostics go to the leveled logger (DOCREVIEW_LOG_LEVEL); the report itself is printed
 
 def load_config_from_excel(excel_path, sheet_name):
     """Load configuration for a given Word document from an Excel sheet."""
@@ -20,7 +27,7 @@ def load_config_from_excel(excel_path, sheet_name):
     return config
 
 def extract_text_by_page(doc):
-    """Extract text page-wise from the document."""
+    """Extract text page-wise from the document (a docreview.docxbody.DocumentBody)."""
     text_by_page = {}
     page_number = 1
     text_by_page[page_number] = []
@@ -55,12 +62,8 @@ import re
 
 def get_numbering_text(para):
     """Extracts numbering from a paragraph if it exists"""
-    numbering = para._element.find(".//" + qn("w:numPr"))  # ✅ Use `qn("w:numPr")`
-    if numbering is not None:
-        numbering_text = []
-        for run in para.runs:
-            numbering_text.append(run.text)
-        return " ".join(numbering_text).strip()
+    if para.numbered:  # ✅ w:numPr presence and run texts are read once when the body is loaded
+        return para.runs_text
     return None
 
 def extract_section_names(doc):
@@ -127,10 +130,10 @@ def extract_table_content(doc):
     """Extract key-value pairs from tables, handling multi-line values."""
     table_data = {}
     for table in doc.tables:
-        for row in table.rows:
-            if len(row.cells) >= 2:
-                key = row.cells[0].text.strip().lower().replace(" ", "")
-                value = row.cells[1].text.strip().replace("\n", " ")
+        for row in table:
+            if len(row) >= 2:
+                key = row[0].strip().lower().replace(" ", "")
+                value = row[1].strip().replace("\n", " ")
                 table_data[key] = value
 
                 # 🔥 Debug: Print extracted keys to compare
@@ -154,10 +157,10 @@ def extract_page1_content(doc):
 
     # ✅ Extract from tables
     for table in doc.tables:
-        for row in table.rows:
-            if len(row.cells) >= 2:  # Ensures key-value format
-                key = row.cells[0].text.strip().lower()
-                value = row.cells[1].text.strip()
+        for row in table:
+            if len(row) >= 2:  # Ensures key-value format
+                key = row[0].strip().lower()
+                value = row[1].strip()
                 page1_content[key] = value
 
     return page1_content
@@ -178,8 +181,8 @@ def extract_table_content_fixed(doc):
     table_data = {}
 
     for table in doc.tables:
-        for row in table.rows:
-            cells = [cell.text.strip() for cell in row.cells if cell.text.strip()]
+        for row in table:
+            cells = [cell.strip() for cell in row if cell.strip()]
             
             if len(cells) == 1:  # 🛑 Entire row is in a single cell
                 multi_line_content = cells[0].split("\n")  # Split by new lines
@@ -216,8 +219,7 @@ def validate_page_1_content(text_by_page, doc, config):
         if key.startswith("Page_1_"):
             normalized_expected = str(expected_value).lower().replace(" ", "")
 
-            # 🔥 Debug: Print expected values
-            print(f"Validating {key}: '{normalized_expected}'")
+            logger.debug("validating %s: %r", key, normalized_expected)
 
             found_in_text = normalized_expected in page_1_text
             found_in_table = any(
@@ -233,24 +235,21 @@ def validate_page_1_content(text_by_page, doc, config):
 def debug_tables(doc):
     """Prints out table structure to debug missing content."""
     if not doc.tables:
-        print("❌ No tables found in the document.")
+        logger.debug("no tables found in the document")
     else:
-        print(f"✅ Found {len(doc.tables)} tables.")
+        logger.debug("found %d tables", len(doc.tables))
 
 
 def debug_tables_first_page(doc):
-    """Prints tables that appear on the first page before the first page break."""
-    found_tables = False
+    """Logs tables that appear on the first page before the first page break (debug level only)."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return  # ✅ Skip walking every row when nobody reads the output
     for table_idx, table in enumerate(doc.tables):
-        # print(f"\n🔍 Table {table_idx + 1} Content:")
-        for row_idx, row in enumerate(table.rows):
-            row_data = [cell.text.strip() for cell in row.cells]
-            # print(f"  ➝ Row {row_idx + 1}: {row_data}")
-        found_tables = True
-        # print("-" * 50)
+        for row_idx, row in enumerate(table):
+            logger.debug("table %d row %d: %s", table_idx + 1, row_idx + 1, [cell.strip() for cell in row])
 
-    if not found_tables:
-        print("❌ No tables found on the first page.")
+    if not doc.tables:
+        logger.debug("no tables found on the first page")
 
 # def extract_document_revision_history(doc):
 #     """Extracts 'Document Revision History' section from paragraphs and tables."""
@@ -289,8 +288,8 @@ def debug_tables_first_page(doc):
 def extract_document_revision_history_from_table(doc):
     """Extracts 'Document Revision History' table correctly with original column names."""
     for table in doc.tables:
-        for row in table.rows:
-            row_values = [cell.text.strip() for cell in row.cells]
+        for row in table:
+            row_values = [cell.strip() for cell in row]
 
             # ✅ Identify the header row by checking key terms
             if "Revision Number" in row_values and "Revision Date" in row_values:
@@ -299,8 +298,8 @@ def extract_document_revision_history_from_table(doc):
                 
                 data = []
 
-                for r in table.rows[1:]:  # ✅ Process data rows
-                    values = [cell.text.strip() for cell in r.cells]
+                for r in table[1:]:  # ✅ Process data rows
+                    values = [cell.strip() for cell in r]
                     data.append(dict(zip(headers, values)))  # ✅ Map original headers
 
                 return data  # ✅ Returns a list of dictionaries preserving original keys
@@ -319,9 +318,8 @@ def validate_document_revision_history(doc, config):
 
     # ✅ Check if expected columns exist
     expected_columns = {key.replace("DocumentRevisionHistory_", "").lower() for key in config if key.startswith("DocumentRevisionHistory_")}
-    print(expected_columns)
     table_columns = set(revision_table[0].keys())  # Extract actual columns from first row
-    print(table_columns)
+    logger.debug("revision history columns: expected %s, found %s", expected_columns, table_columns)
 
     missing_columns = expected_columns - table_columns
     if missing_columns:
@@ -354,8 +352,8 @@ def validate_table_of_content(doc, config):
     revision_mismatches = validate_document_revision_history(doc, config)
     mismatches.extend(revision_mismatches)
 
-    # Search in all paragraphs
-    toc_text = " ".join([p.text.lower() for p in doc.paragraphs])
+    # Search in all paragraphs (joined and lowercased once per document)
+    toc_text = doc.lower_text
 
     if "table of contents" in toc_text:
         toc_found = True
@@ -368,8 +366,8 @@ def validate_table_of_content(doc, config):
     # If not found in paragraphs, search in tables
     if not toc_found:
         for table in doc.tables:
-            for row in table.rows:
-                if any("table of contents" in cell.text.lower() for cell in row.cells):
+            for row in table:
+                if any("table of contents" in cell.lower() for cell in row):
                     toc_found = True
                     break
 
@@ -388,7 +386,7 @@ def check_embedded_excels(docx_path):
                 if "embeddings" in file.lower() and file.endswith((".xls", ".xlsx", ".xlsm")):
                     embedded_excels.append(file)
     except zipfile.BadZipFile:
-        print("❌ The document is not a valid .docx file. Please check the format.")
+        logger.error("%s is not a valid .docx file", docx_path)
 
     return embedded_excels
 
@@ -416,7 +414,7 @@ def validate_sections(extracted_sections, expected_sections):
 #                 if "embeddings" in file.lower() and file.endswith((".xls", ".xlsx", ".xlsm", ".csv")):
 #                     embedded_excels.append(os.path.basename(file))
 #     except zipfile.BadZipFile:
-#         print("❌ The document is not a valid .docx file. Please check the format.")
+#         logger.error("%s is not a valid .docx file", docx_path)
 
 #     return embedded_excels
 
@@ -441,7 +439,7 @@ def extract_embedded_excel(docx_path):
                     embedded_excels.append(output_path)
 
     except zipfile.BadZipFile:
-        print("❌ The document is not a valid .docx file. Please check the format.")
+        logger.error("%s is not a valid .docx file", docx_path)
 
     return embedded_excels
 
@@ -454,14 +452,13 @@ def validate_excel_content(excel_path, config):
         sheet_names = [name.lower() for name in xls.sheet_names]  # Normalize for comparison
         required_sheets = {"sheet1", "sheet2", "sheetname"}
 
-        print(f"🔍 Checking {excel_path}...")
-        print(f"📄 Found Sheets: {xls.sheet_names}")
+        logger.debug("checking %s, sheets %s", excel_path, xls.sheet_names)
 
         # ✅ Check for required sheets
         missing_sheets = required_sheets - set(sheet_names)
         if missing_sheets:
             reason = f"❌ Missing Sheets: {', '.join(missing_sheets)}"
-            print(reason)
+            print(reason)  # Not returned (the check does not fail the workbook), so the report prints it
             # return False, reason
 
         # ✅ Read first sheet
@@ -474,7 +471,7 @@ def validate_excel_content(excel_path, config):
         # ✅ Ensure we have enough rows before checking
         if df.shape[0] < 6:
             reason = "❌ Excel does not have enough rows for validation."
-            print(reason)
+            logger.debug(reason)
             return False, reason
 
         # ✅ Convert to string (handle NaN cases)
@@ -483,90 +480,27 @@ def validate_excel_content(excel_path, config):
 
         if row_4_value != expected_project_id:
             reason = f"❌ Row 4 Mismatch: Expected '{expected_project_id}', Found '{row_4_value}'"
-            print(reason)
+            logger.debug(reason)
             return False, reason
 
         if row_6_value != expected_release_id:
             reason = f"❌ Row 6 Mismatch: Expected '{expected_release_id}', Found '{row_6_value}'"
-            print(reason)
+            logger.debug(reason)
             return False, reason
 
-        print(f"✅ Validation Passed: '{expected_project_id}' in Row 4 & '{expected_release_id}' in Row 6")
+        logger.debug("validation passed: %r in row 4, %r in row 6", expected_project_id, expected_release_id)
         return True, "Validation Passed"
 
     except Exception as e:
         reason = f"⚠️ Error reading Excel file: {e}"
-        print(reason)
+        logger.warning("error reading %s: %s", excel_path, e)
         return False, reason
 
 
-import zipfile
-import xml.etree.ElementTree as ET
-
 def get_real_embedded_filename(docx_path, extracted_filename):
-    """Retrieve the real name of an embedded Excel file given its extracted filename, with debugging."""
-    try:
-        with zipfile.ZipFile(docx_path, "r") as docx_zip:
-            print("\n🔍 Extracting relationships from document.xml.rels...")
-            
-            # ✅ Step 1: Extract relationships from document.xml.rels
-            rels_path = "word/_rels/document.xml.rels"
-            file_rel_map = {}
-
-            if rels_path in docx_zip.namelist():
-                with docx_zip.open(rels_path) as rels_file:
-                    tree = ET.parse(rels_file)
-                    root = tree.getroot()
-                    
-                    namespace = {"rel": "http://schemas.openxmlformats.org/package/2006/relationships"}
-                    for rel in root.findall("rel:Relationship", namespace):
-                        target = rel.get("Target")
-                        rid = rel.get("Id")
-                        if target and target.startswith("embeddings/"):
-                            file_name = target.split("/")[-1]  # Extract only filename
-                            file_rel_map[file_name] = rid  # Map filename to rId
-
-            print(f"🔹 Extracted file-rel map: {file_rel_map}")
-
-            # ✅ Ensure the extracted filename exists
-            if extracted_filename not in file_rel_map:
-                print(f"❌ Extracted filename '{extracted_filename}' not found in relationships.")
-                return None
-
-            related_rid = file_rel_map[extracted_filename]  # Get associated rId
-            print(f"🔹 Found relationship ID: {related_rid}")
-
-            # ✅ Step 2: Extract original names from docProps/app.xml
-            app_xml_path = "docProps/app.xml"
-            if app_xml_path in docx_zip.namelist():
-                print("\n🔍 Extracting TitlesOfParts from docProps/app.xml...")
-                with docx_zip.open(app_xml_path) as app_file:
-                    tree = ET.parse(app_file)
-                    root = tree.getroot()
-
-                    titles_element = root.find(".//{http://schemas.openxmlformats.org/officeDocument/2006/extended-properties}TitlesOfParts")
-
-                    if titles_element is not None:
-                        title_list = [title.text for title in titles_element]
-
-                        print(f"🔹 Extracted TitlesOfParts: {title_list}")
-
-                        # Convert rId to index
-                        rid_index = int(related_rid.replace("rId", "")) - 1
-
-                        if rid_index < len(title_list):
-                            real_name = title_list[rid_index]
-                            print(f"✅ Real Embedded File Name: {real_name}")
-                            return real_name
-                        else:
-                            print(f"❌ rId index {rid_index} is out of range in TitlesOfParts.")
-                    else:
-                        print("❌ TitlesOfParts element not found in docProps/app.xml.")
-
-    except Exception as e:
-        print(f"❌ Error retrieving real embedded filename: {e}")
-
-    return None  # No match found
+    """Retrieve the real name of an embedded Excel file given its extracted filename."""
+    # ✅ Relationships of every part are read once per document; each lookup is a dict probe
+    return load_relationships(docx_path).title(os.path.basename(extracted_filename))
 
 
 def extract_and_validate_embedded_excels(doc_path, config):
@@ -575,7 +509,7 @@ def extract_and_validate_embedded_excels(doc_path, config):
     validation_results = []
 
     if not embedded_excels:
-        print("❌ No embedded Excel found.")
+        logger.debug("no embedded Excel found in %s", doc_path)
         return False, "No embedded Excel found"
 
     all_success = True  # Track if all checks pass
@@ -603,12 +537,12 @@ def validate_document(doc_path, excel_path):
     # Convert file name to match Excel sheet format
     file_name = os.path.basename(doc_path).replace(".docx", "").replace("-", "_")
 
-    print(f"🔍 Looking for sheet: {file_name} in {excel_path}")
+    logger.info("looking for sheet %s in %s", file_name, excel_path)
 
     # Load Excel sheet that matches the modified filename
     config = load_config_from_excel(excel_path, file_name)
 
-    doc = docx.Document(doc_path)
+    doc = load_body(doc_path)
 
     # Extract content
     text_by_page = extract_text_by_page(doc)
@@ -669,6 +603,7 @@ def validate_document(doc_path, excel_path):
     # else:
     #     print(f"  - No embedded Excel files found.")
 
+    save_document_cache(doc_path)  # ✅ The next run on the same file skips the XML parse
     print("\n🚀 Validation Complete!")
 
 
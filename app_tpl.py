@@ -3,8 +3,14 @@ import xml.etree.ElementTree as ET
 import pandas as pd
 import os
 import re
+import sys
 from datetime import datetime, timedelta
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "AutomatedDocumentReview"))
+from docreview.telemetry import get_logger
+
+logger = get_logger("app_tpl")  # Debug dumps go to the leveled logger (DOCREVIEW_LOG_LEVEL); findings are printed
+
 def extract_text_by_page(docx_path):
     """Extracts text from the Word document page-wise."""
     with zipfile.ZipFile(docx_path, "r") as docx_zip:
@@ -171,7 +177,7 @@ def read_config(config_path, sheet_name):
     df = pd.read_excel(config_path, sheet_name=sheet_name, engine="openpyxl")
 
     # Debugging: Show column names
-    print(f"🔍 Available columns in '{sheet_name}': {df.columns.tolist()}")
+    logger.debug("config sheet %s columns %s", sheet_name, df.columns.tolist())
 
     # Ensure columns are correctly named
     expected_columns = ["Key", "Value"]
@@ -201,7 +207,7 @@ def compare_values(extracted, config):
 
 def validate_page1_key_values(docx_path, config_file, sheet_name):
     """Validates key-value pairs from Page 1 text against the config file."""
-    print(f"🔍 Reading config from: {config_file} | Sheet: {sheet_name}")
+    logger.debug("reading config from %s, sheet %s", config_file, sheet_name)
 
     # Load expected key-value pairs from Excel
     config = read_config(config_file, sheet_name)
@@ -209,15 +215,12 @@ def validate_page1_key_values(docx_path, config_file, sheet_name):
     # Extract Page 1 text
     page1_text = extract_page1_text(docx_path)
 
-    print("\n📌 Extracted Page 1 Text:")
-    print(page1_text)  # Debugging
+    logger.debug("page 1 text: %s", page1_text)
 
     # Extract key-value pairs from the text
     extracted_values = extract_key_values(page1_text)
 
-    print("\n📌 Extracted Key-Value Pairs from Page 1:")
-    for k, v in extracted_values.items():
-        print(f"  - {k}: {v}")
+    logger.debug("page 1 key-value pairs: %s", extracted_values)
 
     # Load expected key-value pairs from Excel
     config_df = pd.read_excel(config_file, sheet_name=sheet_name, engine="openpyxl")
@@ -320,8 +323,7 @@ def validate_excel_content(excel_path, config):
         sheet_names = [name.lower() for name in xls.sheet_names]  # Normalize for comparison
         required_sheets = {"summary", "nonfunctional requirement", "logs", "contacts"}
 
-        print(f"\n🔍 Checking {excel_path}...")
-        print(f"📄 Found Sheets: {xls.sheet_names}")
+        logger.debug("checking %s, sheets %s", excel_path, xls.sheet_names)
 
         # ✅ Check for required sheets
         missing_sheets = required_sheets - set(sheet_names)
@@ -350,8 +352,7 @@ def validate_excel_content(excel_path, config):
         release_id_value = str(df.iloc[7, 1]).strip().lower()  # B8
 
         # Print extracted values
-        print(f"Extracted Project ID: {project_id_value if project_id_value else 'Not Found'}")
-        print(f"Extracted Release ID: {release_id_value if release_id_value else 'Not Found'}")
+        logger.debug("extracted project ID %r, release ID %r", project_id_value, release_id_value)
         # project_id_value = df.iloc[1, 0] if pd.notna(df.iloc[1, 0]) else ""  # A2
         # release_id_value = df.iloc[7, 1] if pd.notna(df.iloc[7, 1]) else ""  # B8
 
@@ -359,8 +360,6 @@ def validate_excel_content(excel_path, config):
         project_id_value = str(project_id_value).strip().lower()
         release_id_value = str(release_id_value).strip().lower()
 
-        print(f"Project ID (A2): '{project_id_value}'")
-        print(f"Release ID (B8): '{release_id_value}'")
 
         if project_id_value != expected_project_id:
             print(f"❌ A2 (Project ID) Mismatch: Expected '{expected_project_id}', Found '{project_id_value}'")
@@ -462,8 +461,7 @@ def validate_footer_contains_project(docx_path, config):
     extracted_footer = extract_footer_text(docx_path)
     expected_project_name = str(config.get("Page_1_ProjectName", "")).strip()
 
-    print(f"🔍 Extracted Footer: {extracted_footer if extracted_footer else 'Not Found'}")
-    print(f"🔍 Expected Project Name: {expected_project_name}")
+    logger.debug("footer %r, expected project name %r", extracted_footer, expected_project_name)
 
     if not extracted_footer:
         return False, "❌ Footer not found."